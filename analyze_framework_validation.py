@@ -4,13 +4,12 @@ Validate the Synthetic User Generation Framework implementation
 Analyzes the 500-user cohort for correlation patterns and distribution accuracy
 """
 
-import json
 from collections import Counter, defaultdict
 import statistics
+from core.dataset.readers import load_users
 
 # Load generated users
-with open('output/private_language_synthetic_users.json', 'r') as f:
-    users = json.load(f)
+users = load_users('output/private_language_synthetic_users.json')
 
 print("=" * 80)
 print("SYNTHETIC USER GENERATION FRAMEWORK VALIDATION")
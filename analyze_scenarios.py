@@ -6,11 +6,10 @@ Analyzes generated synthetic users for specific product scenarios like
 first capture sessions, onboarding patterns, and engagement behaviors.
 """
 
-import json
-from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Any
 import statistics
+from core.dataset.readers import load_users, resolve_dataset
 
 
 class ScenarioAnalyzer:
@@ -18,8 +17,7 @@ class ScenarioAnalyzer:
 
     def __init__(self, data_file: str):
         """Load synthetic user data"""
-        with open(data_file, 'r') as f:
-            self.users = json.load(f)
+        self.users = load_users(data_file)
 
     def analyze_first_capture_session(self) -> Dict[str, Any]:
         """Analyze first knowledge capture session scenario"""
@@ -255,7 +253,7 @@ def main():
     """Run scenario analysis"""
     data_file = "output/private_language_synthetic_users.json"
 
-    if not Path(data_file).exists():
+    if not resolve_dataset(data_file).exists():
         print(f"❌ Data file not found: {data_file}")
         print("   Run: python cli.py generate private_language --count 100")
         return
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Cost of the generation event hooks
+
+Times hooks.emit() with no subscriber against an empty function call,
+then generates the same seeded cohort (personas and journeys) with:
+
+    none         no subscribers (the cost every run pays)
+    inline       a no-op inline subscriber on every event
+    background   a no-op background subscriber on every event
+
+and reports the time per user and the overhead of the unsubscribed emits
+(emit cost x events per user, relative to the time per user).
+
+Usage:
+    python -m benchmarks.hook_overhead [--project private_language] [--users 2000] [--repeats 5]
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import timeit
+from contextlib import ExitStack
+from pathlib import Path
+
+from core.generators.cohort_generator import CohortGenerator
+from core.utils import hooks
+
+
+def noop(*args):
+    pass
+
+
+def emit_cost(number=2_000_000):
+    """Seconds per unsubscribed emit() and per empty function call"""
+    names = {"emit": hooks.emit, "noop": noop}
+    emit = min(timeit.repeat('emit("on_step", None, None)', globals=names, number=number, repeat=5)) / number
+    call = min(timeit.repeat("noop(None, None)", globals=names, number=number, repeat=5)) / number
+    return emit, call
+
+
+def time_cohort(cohort, users, seed, mode):
+    """Seconds to generate the cohort with no-op subscribers of the given mode"""
+    with ExitStack() as stack:
+        if mode != "none":
+            for event in hooks.EVENTS:
+                stack.enter_context(hooks.subscribed(event, noop, background=mode == "background"))
+        gc.collect()
+        start = time.perf_counter()
+        for _ in cohort.iter_models(users, seed=seed):
+            pass
+        return time.perf_counter() - start
+
+
+def count_events(cohort, users, seed):
+    """Events emitted per user"""
+    counts = dict.fromkeys(hooks.EVENTS, 0)
+
+    def counter(event):
+        def count(*args):
+            counts[event] += 1
+        return count
+
+    with ExitStack() as stack:
+        for event in hooks.EVENTS:
+            stack.enter_context(hooks.subscribed(event, counter(event)))
+        for _ in cohort.iter_models(users, seed=seed):
+            pass
+    return sum(counts.values()) / users
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overhead of the generation event hooks")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--users", type=int, default=2_000, help="Users per run")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per mode (median)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    cohort = CohortGenerator(Path("projects") / args.project)
+
+    print("⏱️  Unsubscribed emit() vs empty call...")
+    emit, call = emit_cost()
+    events = count_events(cohort, args.users, args.seed)
+
+    # Modes take turns so drift in machine speed affects them alike
+    modes = ("none", "inline", "background")
+    times = {mode: [] for mode in modes}
+    print(f"👥 {args.users:,} users x {args.repeats} runs per mode...")
+    for _ in range(args.repeats):
+        for mode in modes:
+            times[mode].append(time_cohort(cohort, args.users, args.seed, mode))
+    results = {mode: statistics.median(seconds) for mode, seconds in times.items()}
+
+    per_user = results["none"] / args.users
+    print(f"\n📊 Hook overhead ({events:.1f} events/user)")
+    print(f"   emit() without subscribers {emit * 1e9:>8.1f} ns  (empty call {call * 1e9:.1f} ns)")
+    print(f"   per user                   {emit * events * 1e6:>8.2f} µs of {per_user * 1e6:,.0f} µs "
+          f"({emit * events / per_user:.2%})")
+    print(f"\n   {'subscribers':<12} {'µs/user':>10} {'vs none':>9}")
+    for mode, seconds in results.items():
+        print(f"   {mode:<12} {seconds / args.users * 1e6:>10,.1f} {seconds / results['none'] - 1:>+9.1%}")
+
+
+if __name__ == "__main__":
+    main()
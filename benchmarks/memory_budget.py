@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Memory budget: bytes per persona, journey step and SSR response
+
+Measures what each pipeline stage keeps in memory and what a run needs:
+
+    in-memory    tracemalloc bytes retained per persona, user profile,
+                 journey step, to_dict record and SSR response, plus the
+                 RSS growth of holding a whole cohort
+    streaming    peak traced memory and peak RSS growth of generating
+                 straight into a JSONL file (the cli.py generate path)
+
+Retained sizes are measured with core.utils.memory.retained_bytes (as in
+benchmarks.model_memory): objects are generated untraced and tracemalloc
+counts rebuilding them from a pickle.
+The top allocation sites come from tracing the generators themselves on
+a smaller sample.
+
+SSR responses are rated for real when the SSR extras are installed;
+otherwise every step gets four stand-in responses with the layout of
+SSRResponseGenerator.generate_persona_response (labelled "simulated").
+
+Usage:
+    python -m benchmarks.memory_budget [--project private_language] [--users 5000] [--trace-users 1000]
+                                       [--top 10] [--project-users 100000] [--output FILE]
+"""
+
+import argparse
+import gc
+import json
+import random
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from core.dataset.writers import open_writer
+from core.generators.cohort_generator import CohortGenerator
+from core.generators.journey_generator import SSR_AVAILABLE
+from core.utils.memory import RssSampler, format_size, retained_bytes, rss_bytes
+
+SSR_SCALES = ("engagement", "satisfaction", "progress", "relevance")
+
+
+def simulated_ssr_responses(journeys, seed):
+    """Per-step SSR responses laid out like SSRResponseGenerator output"""
+    rng = random.Random(seed)
+    responses = []
+    for journey in journeys:
+        for step in journey.steps:
+            stimulus = f"Phase: {step.phase_id}, Objectives: ..."
+            for scale_id in SSR_SCALES:
+                weights = [rng.random() for _ in range(5)]
+                total = sum(weights)
+                pmf = [w / total for w in weights]
+                responses.append({
+                    "text_response": f"{step.emotional_state} at {step.engagement_score:.2f}",
+                    "pmf": pmf,
+                    "expected_value": sum(p * (i + 1) for i, p in enumerate(pmf)),
+                    "most_likely_rating": pmf.index(max(pmf)) + 1,
+                    "stimulus": stimulus,
+                    "scale_id": scale_id,
+                    "persona_summary": f"persona_type={journey.persona_type}",
+                })
+    return responses
+
+
+def ssr_responses(project_path, users, seed):
+    """SSR responses for a cohort: (responses, simulated)"""
+    if not SSR_AVAILABLE:
+        cohort = CohortGenerator(project_path)
+        journeys = [journey for _, journey in cohort.iter_models(users, seed=seed)]
+        return simulated_ssr_responses(journeys, seed), True
+
+    cohort = CohortGenerator(project_path, enable_ssr=True)
+    responses = [
+        response
+        for _, journey in cohort.iter_models(users, seed=seed)
+        for step in journey.steps
+        for response in step.ssr_responses.values()
+    ]
+    return responses, False
+
+
+def measure_in_memory(project_path, users, seed):
+    """Bytes retained per unit at each pipeline stage"""
+    cohort = CohortGenerator(project_path)
+
+    random.seed(seed)
+    personas = cohort.persona_gen.generate(users)
+    persona_bytes = retained_bytes(personas)
+    del personas
+
+    models = list(cohort.iter_models(users, seed=seed))
+    profiles = [user for user, _ in models]
+    journeys = [journey for _, journey in models]
+    steps = sum(len(journey.steps) for journey in journeys)
+    profile_bytes = retained_bytes(profiles)
+    journey_bytes = retained_bytes(journeys)
+    model_bytes = retained_bytes(models)
+    del models, profiles, journeys
+
+    records = list(cohort.iter_users(users, seed=seed))
+    record_bytes = retained_bytes(records)
+    del records
+
+    responses, simulated = ssr_responses(project_path, users, seed)
+    response_bytes = retained_bytes(responses)
+
+    return {
+        "users": users,
+        "steps": steps,
+        "ssr_responses": len(responses),
+        "ssr_simulated": simulated,
+        "bytes": {
+            "per_persona": persona_bytes / users,
+            "per_profile": profile_bytes / users,
+            "per_step": journey_bytes / steps,
+            "per_user_models": model_bytes / users,
+            "per_user_records": record_bytes / users,
+            "per_ssr_response": response_bytes / max(1, len(responses)),
+        },
+    }
+
+
+def measure_rss(project_path, users, seed, output_dir):
+    """Peak RSS growth holding a cohort in memory vs streaming it to JSONL"""
+    cohort = CohortGenerator(project_path)
+    # Streaming first: memory freed by the held cohort would be reused without growing RSS
+    gc.collect()
+    with RssSampler() as streamed:
+        with open_writer(Path(output_dir) / "memory_budget.jsonl", "jsonl") as writer:
+            for user, journey in cohort.iter_models(users, seed=seed):
+                writer.write_user(user, journey)
+
+    gc.collect()
+    with RssSampler() as held:
+        models = list(cohort.iter_models(users, seed=seed))
+    del models
+
+    return {
+        "in_memory_peak": held.peak - held.start,
+        "streaming_peak": streamed.peak - streamed.start,
+    }
+
+
+def trace_streaming(project_path, users, seed, output_dir, top):
+    """Peak traced memory of streaming to JSONL, and the top allocation sites of a held cohort"""
+    cohort = CohortGenerator(project_path)
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    with open_writer(Path(output_dir) / "memory_trace.jsonl", "jsonl") as writer:
+        for user, journey in cohort.iter_models(users, seed=seed):
+            writer.write_user(user, journey)
+    streaming_peak = tracemalloc.get_traced_memory()[1]
+
+    gc.collect()
+    base = tracemalloc.take_snapshot().filter_traces(ignore)
+    models = list(cohort.iter_models(users, seed=seed))
+    snapshot = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+    del models
+
+    sites = []
+    for stat in snapshot.compare_to(base, "lineno")[:top]:
+        frame = stat.traceback[0]
+        sites.append({
+            "site": f"{Path(frame.filename).name}:{frame.lineno}",
+            "bytes_per_user": stat.size_diff / users,
+            "count_per_user": stat.count_diff / users,
+        })
+    return streaming_peak, sites
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per persona, step and SSR response per pipeline stage")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--users", type=int, default=5_000, help="Users per measurement")
+    parser.add_argument("--trace-users", type=int, default=1_000,
+                        help="Users generated under tracemalloc for the allocation sites (slow)")
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to list")
+    parser.add_argument("--project-users", type=int, default=100_000, help="Cohort size to project memory for")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    project_path = Path("projects") / args.project
+    with tempfile.TemporaryDirectory() as output_dir:
+        # RSS first, while the process has not yet grown its heap
+        print(f"📈 Sampling RSS ({args.users:,} users, streaming and in-memory)...")
+        rss = measure_rss(project_path, args.users, args.seed, output_dir)
+        print(f"🧠 Retained bytes per stage ({args.users:,} users)...")
+        in_memory = measure_in_memory(project_path, args.users, args.seed)
+        print(f"🔍 Tracing allocations ({args.trace_users:,} users)...")
+        streaming_peak, sites = trace_streaming(project_path, args.trace_users, args.seed, output_dir, args.top)
+
+    per = in_memory["bytes"]
+    ssr_label = " (simulated: SSR extras not installed)" if in_memory["ssr_simulated"] else ""
+    print(f"\n📊 Bytes retained ({in_memory['steps'] / args.users:.1f} steps/user, "
+          f"{in_memory['ssr_responses'] / args.users:.1f} SSR responses/user)")
+    print(f"   {'persona':<22} {per['per_persona']:>10,.0f}")
+    print(f"   {'user profile':<22} {per['per_profile']:>10,.0f}")
+    print(f"   {'journey step':<22} {per['per_step']:>10,.0f}")
+    print(f"   {'user (models)':<22} {per['per_user_models']:>10,.0f}")
+    print(f"   {'user (to_dict record)':<22} {per['per_user_records']:>10,.0f}")
+    print(f"   {'SSR response':<22} {per['per_ssr_response']:>10,.0f}{ssr_label}")
+
+    n = args.project_users
+    ssr_per_user = per["per_ssr_response"] * in_memory["ssr_responses"] / args.users
+    print(f"\n💾 Memory for {n:,} users")
+    print(f"   {'in-memory models':<22} {format_size(per['per_user_models'] * n):>12}")
+    print(f"   {'in-memory records':<22} {format_size(per['per_user_records'] * n):>12}")
+    print(f"   {'  + SSR responses':<22} {format_size(ssr_per_user * n):>12}")
+    print(f"   {'streaming (JSONL)':<22} {format_size(streaming_peak):>12}  traced peak, flat in the cohort size")
+    print(f"   RSS growth for {args.users:,} users: in-memory {format_size(rss['in_memory_peak'])}, "
+          f"streaming {format_size(rss['streaming_peak'])} (process RSS {format_size(rss_bytes())})")
+
+    print(f"\n🔬 Top allocation sites of a held cohort ({args.trace_users:,} users)")
+    for site in sites:
+        print(f"   {site['site']:<40} {site['bytes_per_user']:>10,.0f} B/user {site['count_per_user']:>8,.1f} blocks/user")
+
+    if args.output:
+        report = {
+            "project": args.project,
+            "in_memory": in_memory,
+            "rss": rss,
+            "streaming_traced_peak": streaming_peak,
+            "top_sites": sites,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\n📁 Saved to: {Path(args.output).absolute()}")
+
+
+if __name__ == "__main__":
+    main()
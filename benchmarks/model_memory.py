@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+In-memory cohort footprint: slotted models vs the previous layout
+
+Generates the same seeded cohort in both layouts and counts, with
+tracemalloc, the bytes needed to hold every (UserProfile, Journey) pair:
+
+    legacy   plain dataclasses with a per-instance __dict__ and a fresh
+             empty dict/list for every unset container field
+    slotted  the current models (slots=True, shared EMPTY_DICT/EMPTY_LIST)
+
+Tracing the generator itself is ~7x slower, so the cohort is generated
+untraced and core.utils.memory.retained_bytes measures rebuilding it
+from a pickle.
+
+Usage:
+    python -m benchmarks.model_memory [--project private_language] [--users 100000]
+"""
+
+import argparse
+import gc
+import inspect
+import sys
+from contextlib import contextmanager
+from dataclasses import MISSING, field, fields, make_dataclass
+from pathlib import Path
+
+import core.generators.cohort_generator as cohort_module
+import core.generators.journey_generator as journey_module
+import core.generators.persona_generator as persona_module
+from core.generators.cohort_generator import CohortGenerator
+from core.models.defaults import FrozenDict, FrozenList
+from core.models.journey import Journey, JourneyPhase, JourneyStep
+from core.models.persona import Persona
+from core.models.user_profile import UserProfile
+from core.utils.memory import retained_bytes
+
+# Where the generators look the model classes up
+PATCH_TARGETS = {
+    UserProfile: [cohort_module],
+    Persona: [persona_module],
+    Journey: [journey_module],
+    JourneyStep: [journey_module],
+    JourneyPhase: [journey_module],
+}
+
+
+def legacy_class(cls):
+    """
+    Unslotted copy of a model that allocates its own empty containers
+
+    Registered as a module global (Legacy<Name>) so instances can be pickled.
+    """
+    specs = []
+    containers = {}
+    for f in fields(cls):
+        if isinstance(f.default, (FrozenDict, FrozenList)):
+            factory = dict if isinstance(f.default, FrozenDict) else list
+            containers[f.name] = factory
+            spec = field(default_factory=factory)
+        elif f.default is not MISSING:
+            spec = field(default=f.default)
+        elif f.default_factory is not MISSING:
+            spec = field(default_factory=f.default_factory)
+        else:
+            spec = field()
+        specs.append((f.name, f.type, spec))
+
+    def __post_init__(self):
+        # The generators pass shared empties explicitly; the old code passed {}
+        for name, factory in containers.items():
+            if isinstance(getattr(self, name), (FrozenDict, FrozenList)):
+                setattr(self, name, factory())
+
+    methods = {
+        name: value for name, value in vars(cls).items()
+        if inspect.isfunction(value) and not name.startswith("__")
+    }
+    name = f"Legacy{cls.__name__}"
+    legacy = make_dataclass(name, specs, namespace={**methods, "__post_init__": __post_init__})
+    legacy.__module__ = __name__
+    globals()[name] = legacy
+    return legacy
+
+
+@contextmanager
+def layout(name, legacy_classes):
+    """Point the generators at the legacy model classes for the duration"""
+    if name == "slotted":
+        yield
+        return
+    saved = []
+    for cls, modules in PATCH_TARGETS.items():
+        replacement = legacy_classes[cls]
+        for module in modules:
+            saved.append((module, cls.__name__, getattr(module, cls.__name__)))
+            setattr(module, cls.__name__, replacement)
+    try:
+        yield
+    finally:
+        for module, attr, original in saved:
+            setattr(module, attr, original)
+
+
+def instance_bytes(obj):
+    """Shallow size of one model instance (object plus its __dict__, if any)"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(project_path, users, seed, name, legacy_classes):
+    """Bytes allocated per retained user for one layout"""
+    with layout(name, legacy_classes):
+        cohort = CohortGenerator(project_path)
+        cohort_data = list(cohort.iter_models(users, seed=seed))
+    allocated = retained_bytes(cohort_data)
+
+    user, journey = cohort_data[0]
+    samples = {
+        "UserProfile": user,
+        "Journey": journey,
+        "JourneyStep": journey.steps[0],
+        "JourneyPhase": journey.phases[0],
+    }
+    steps = sum(len(j.steps) for _, j in cohort_data)
+    return {
+        "bytes_per_user": allocated / users,
+        "steps": steps,
+        "instances": {cls: instance_bytes(obj) for cls, obj in samples.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes per user for slotted vs legacy models")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--users", type=int, default=100_000, help="Users kept in memory")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    # Created up front so the pickled legacy instances resolve their classes
+    legacy_classes = {cls: legacy_class(cls) for cls in PATCH_TARGETS}
+
+    project_path = Path("projects") / args.project
+    results = {}
+    for name in ("legacy", "slotted"):
+        print(f"🧠 {name}: generating {args.users:,} users...")
+        results[name] = measure(project_path, args.users, args.seed, name, legacy_classes)
+        gc.collect()
+
+    legacy, slotted = results["legacy"], results["slotted"]
+    print(f"\n📊 In-memory cohort ({args.users:,} users, {slotted['steps']:,} steps)")
+    print(f"   {'':>14} {'legacy':>10} {'slotted':>10} {'saved':>8}")
+    print(
+        f"   {'bytes/user':>14} {legacy['bytes_per_user']:>10,.0f} {slotted['bytes_per_user']:>10,.0f} "
+        f"{1 - slotted['bytes_per_user'] / legacy['bytes_per_user']:>7.1%}"
+    )
+    print(
+        f"   {'total MB':>14} {legacy['bytes_per_user'] * args.users / 1e6:>10,.1f} "
+        f"{slotted['bytes_per_user'] * args.users / 1e6:>10,.1f}"
+    )
+    print("\n   Shallow instance size (bytes)")
+    for cls in legacy["instances"]:
+        print(f"   {cls:>14} {legacy['instances'][cls]:>10} {slotted['instances'][cls]:>10}")
+
+
+if __name__ == "__main__":
+    main()
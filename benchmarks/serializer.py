@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Dataset serializer benchmark: to_dict() + json.dumps vs direct model encoding
+
+Generates a cohort once, then times encoding every (UserProfile, Journey)
+pair as one JSONL record:
+
+    baseline   user.to_dict() + journey.to_dict() + json.dumps (the previous writer path)
+    <backend>  serializer.encode_user(user, journey) for each installed backend
+
+Usage:
+    python -m benchmarks.serializer [--project private_language] [--users 2000] [--repeats 5]
+
+Every backend's output is decoded and checked against the baseline record.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from core.dataset.codec import SERIALIZERS, get_serializer, loads
+from core.dataset.writers import user_record
+from core.generators.cohort_generator import CohortGenerator
+
+
+def _time(encode, models, repeats):
+    """Best-of-N seconds to encode every model pair, and the encoded size"""
+    best = float("inf")
+    size = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        size = sum(len(encode(user, journey)) for user, journey in models)
+        best = min(best, time.perf_counter() - start)
+    return best, size
+
+
+def _baseline(user, journey):
+    return json.dumps(user_record(user, journey))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dataset serializers")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--users", type=int, default=2000, help="Users to encode")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per backend (best is reported)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    args = parser.parse_args()
+
+    print(f"👥 Generating {args.users} users ({args.project})...")
+    cohort = CohortGenerator(Path("projects") / args.project)
+    models = list(cohort.iter_models(args.users, seed=args.seed))
+    steps = sum(len(journey.steps) for _, journey in models)
+
+    candidates = [("baseline", _baseline)]
+    for name in SERIALIZERS:
+        try:
+            candidates.append((name, get_serializer(name).encode_user))
+        except ImportError:
+            print(f"   (skipping {name}: not installed)")
+
+    print(f"\n⚡ Encoding {args.users} users / {steps} steps (best of {args.repeats})")
+    print(f"   {'backend':>10} {'users/sec':>11} {'steps/sec':>11} {'MB/sec':>8} {'MB':>7} {'speedup':>8}")
+    baseline_time = None
+    failed = []
+    for name, encode in candidates:
+        seconds, size = _time(encode, models, args.repeats)
+        baseline_time = baseline_time or seconds
+        print(
+            f"   {name:>10} {args.users / seconds:>11,.0f} {steps / seconds:>11,.0f} "
+            f"{size / seconds / 1e6:>8.1f} {size / 1e6:>7.1f} {baseline_time / seconds:>7.2f}x"
+        )
+        if name != "baseline":
+            if any(loads(encode(user, journey)) != user_record(user, journey) for user, journey in models[:100]):
+                failed.append(name)
+
+    if failed:
+        print(f"\n❌ Output differs from to_dict() for: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ All backends produce the to_dict() records")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Warm-path latency of the local generation service (core.service)
+
+Starts a GenerationService in-process with the project preloaded, sends
+one warm-up request, then times sequential /generate requests (each with
+its own seed, so none are coalesced) over real HTTP connections:
+
+    first byte   request sent -> response headers (first chunk generated)
+    last byte    request sent -> final chunk received
+
+and reports p50/p95/p99 of both, plus the latency of a cold process for
+comparison (interpreter start + config load + generation in a new process).
+
+Usage:
+    python -m benchmarks.service_latency [--project private_language] [--count 100] [--requests 200]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from core.service import GenerationService
+
+
+async def _timed_get(address, target):
+    """Seconds to the first response byte and to the end of the response, and the body size"""
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    first = await reader.read(1)
+    first_byte = time.perf_counter() - start
+    size = len(first) + len(await reader.read())
+    last_byte = time.perf_counter() - start
+    writer.close()
+    return first_byte, last_byte, size
+
+
+def percentile(samples, q):
+    """q-th percentile (nearest rank) of a list of samples"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+async def run(args):
+    service = GenerationService(args.projects_dir, workers=args.workers, chunk_size=args.chunk_size)
+    service.preload([args.project])
+    await service.start(port=0)
+    try:
+        target = f"/generate?project={args.project}&count={args.count}"
+        await _timed_get(service.address, target + "&seed=0")
+        results = [
+            await _timed_get(service.address, f"{target}&seed={seed}")
+            for seed in range(1, args.requests + 1)
+        ]
+    finally:
+        await service.close()
+    return results
+
+
+COLD_SCRIPT = """
+import sys
+from core.dataset.codec import get_serializer
+from core.generators.cohort_generator import CohortGenerator
+encode = get_serializer().encode_user
+for user, journey in CohortGenerator(sys.argv[1]).iter_models(int(sys.argv[2]), seed=1):
+    sys.stdout.write(encode(user, journey) + "\\n")
+"""
+
+
+def cold_latency(args):
+    """Seconds for a fresh interpreter to load the project and generate the same users"""
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPT, str(Path(args.projects_dir) / args.project), str(args.count)],
+        check=True, stdout=subprocess.DEVNULL
+    )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-path latency of the generation service")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--projects-dir", default="projects", help="Directory holding the projects")
+    parser.add_argument("--count", type=int, default=100, help="Users per request")
+    parser.add_argument("--requests", type=int, default=200, help="Timed requests")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Users per chunk")
+    parser.add_argument("--skip-cold", action="store_true", help="Do not time a cold process")
+    args = parser.parse_args()
+
+    print(f"🔥 Serving {args.project} warm, {args.requests} requests of {args.count} users...")
+    results = asyncio.run(run(args))
+    first = [r[0] * 1000 for r in results]
+    last = [r[1] * 1000 for r in results]
+
+    print(f"\n📊 Warm-path latency (ms, {args.count} users/request, {statistics.mean(r[2] for r in results) / 1e3:,.0f} kB)")
+    print(f"   {'':>11} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, samples in (("first byte", first), ("last byte", last)):
+        print(
+            f"   {name:>11} {percentile(samples, 50):>8.1f} {percentile(samples, 95):>8.1f} "
+            f"{percentile(samples, 99):>8.1f} {max(samples):>8.1f}"
+        )
+    print(f"   {'users/sec':>11} {args.count * len(last) / (sum(last) / 1000):>8,.0f}")
+
+    if not args.skip_cold:
+        cold = cold_latency(args) * 1000
+        print(f"\n   Cold process: {cold:,.0f} ms ({cold / percentile(last, 50):.0f}x the warm p50)")
+
+
+if __name__ == "__main__":
+    main()
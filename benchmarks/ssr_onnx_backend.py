@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+SSR embedding backend check: ONNX int8 vs torch
+
+1. Accuracy - PMF L1 distance between backends on the project's reference scales
+2. Throughput - sentences/sec for each backend at several batch sizes
+
+Usage:
+    python -m benchmarks.ssr_onnx_backend [--project private_language] [--tolerance 0.05]
+
+Exits non-zero if the mean L1 distance on any scale exceeds the tolerance.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from core.generators.embedding_registry import shared_registry
+from core.generators.onnx_encoder import compare_backends
+
+
+def _sample_texts(reference_config):
+    """Reference statements plus the simulated persona responses used in journeys"""
+    texts = [
+        point["statement"]
+        for scale in reference_config.values()
+        for point in scale.get("scale_points", {}).values()
+    ]
+    texts += [
+        "This is really interesting and relevant to my goals. I'm excited to continue.",
+        "It's okay, nothing exceptional but reasonably helpful.",
+        "I don't feel like I'm making much progress. It's frustrating.",
+        "This doesn't seem very relevant to my actual needs.",
+        "I'm feeling a bit overwhelmed but I'm making some progress, though it's slower than I hoped.",
+    ]
+    return texts
+
+
+def _throughput(encoder, texts, batch_size, repeats=5):
+    """Sentences per second for encoder.encode at a batch size"""
+    encoder.encode(texts[:batch_size], batch_size=batch_size)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeats):
+        encoder.encode(texts, batch_size=batch_size)
+    return repeats * len(texts) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ONNX int8 and torch SSR backends")
+    parser.add_argument("--project", default="private_language", help="Project name")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="Embedding model")
+    parser.add_argument("--tolerance", type=float, default=0.05, help="Max mean PMF L1 distance per scale")
+    parser.add_argument("--batch-sizes", default="1,8,32,128", help="Comma-separated batch sizes")
+    args = parser.parse_args()
+
+    scales_path = Path("projects") / args.project / "response_scales.yaml"
+
+    print(f"🎯 Accuracy: PMF L1 distance, onnx-int8 vs torch ({scales_path})")
+    import yaml
+    with open(scales_path) as f:
+        texts = _sample_texts(yaml.safe_load(f))
+
+    report = compare_backends(scales_path, texts, model_name=args.model, tolerance=args.tolerance)
+    for scale_id, stats in sorted(report["scales"].items()):
+        status = "✓" if stats["mean_l1"] <= args.tolerance else "✗"
+        print(f"   {status} {scale_id:20} mean {stats['mean_l1']:.4f}   max {stats['max_l1']:.4f}")
+
+    print(f"\n⚡ Throughput (sentences/sec, {len(texts)} sentences x 5 runs)")
+    torch_encoder = shared_registry.get(args.model, "cpu", "torch")
+    onnx_encoder = shared_registry.get(args.model, None, "onnx")
+    print(f"   {'batch':>6} {'torch':>10} {'onnx-int8':>10} {'speedup':>8}")
+    for batch_size in (int(b) for b in args.batch_sizes.split(",")):
+        torch_rate = _throughput(torch_encoder, texts, batch_size)
+        onnx_rate = _throughput(onnx_encoder, texts, batch_size)
+        print(f"   {batch_size:>6} {torch_rate:>10.0f} {onnx_rate:>10.0f} {onnx_rate / torch_rate:>7.2f}x")
+
+    if not report["passed"]:
+        print(f"\n❌ ONNX backend exceeds L1 tolerance {args.tolerance}")
+        sys.exit(1)
+    print(f"\n✅ ONNX backend within L1 tolerance {args.tolerance}")
+
+
+if __name__ == "__main__":
+    main()
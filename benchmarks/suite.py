@@ -0,0 +1,379 @@
+"""
+Benchmark matrix for a project
+
+Runs every stage at every cohort size with a fixed seed:
+
+    personas           PersonaGenerator.iter_generate
+    journeys:<type>    JourneyGenerator.generate for each JourneyType
+    serialize          user_record (to_dict) + json.dumps, and direct
+                       model encoding with the fastest installed serializer
+    ssr                journeys rated with SSR on simulated LLM responses
+    llm_stub           journeys on the real-LLM path (model routing included)
+                       with a stub client in place of the Anthropic API
+
+and reports users/sec, steps/sec, peak RSS and the time spent in each
+stage. Each cell runs in a fresh process so its peak RSS is its own. SSR
+cells need the SSR extras and load the embedding model; they are capped at
+--ssr-users users because every step embeds four responses.
+
+Results are saved as JSON with the machine fingerprint and git revision,
+so runs from different machines and commits can be compared.
+
+Usage:
+    python cli.py bench private_language [--sizes 1000 10000 100000] [--stages personas serialize]
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from importlib.metadata import PackageNotFoundError, version
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from core.models.journey import JourneyType
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+JOURNEY_STAGES = tuple(f"journeys:{journey_type.value}" for journey_type in JourneyType)
+STAGES = ("personas",) + JOURNEY_STAGES + ("serialize", "ssr", "llm_stub")
+SSR_STAGES = ("ssr", "llm_stub")
+
+# Versions recorded in the fingerprint (they change the numbers)
+PACKAGES = ("PyYAML", "Faker", "orjson", "msgspec", "numpy", "pyarrow", "torch",
+            "sentence-transformers", "onnxruntime")
+
+
+class StubLLMGenerator:
+    """Stands in for LLMResponseGenerator: canned responses after an optional fixed delay"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_response(
+        self,
+        persona: Dict,
+        stimulus: str,
+        scale_id: str,
+        phase: str,
+        emotional_state: str,
+        engagement_score: float,
+        model: Optional[str] = None
+    ) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        outlook = "really enjoying" if engagement_score > 0.7 else "unsure about" if engagement_score > 0.4 else "struggling with"
+        return f"Feeling {emotional_state}, I'm {outlook} {phase.lower()} ({scale_id})."
+
+
+class _Clock:
+    """Accumulated seconds per stage"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def _journey_generator(cohort, stage: str, llm_latency: float):
+    """JourneyGenerator a stage measures"""
+    from core.generators.journey_generator import JourneyGenerator
+    from core.generators.model_router import ModelRouter
+
+    journey_type = cohort.journey_type
+    if stage.startswith("journeys:"):
+        journey_type = JourneyType(stage.split(":", 1)[1])
+    ssr = stage in SSR_STAGES
+
+    generator = JourneyGenerator(
+        journey_type, cohort.journey_phases, cohort.emotional_states,
+        ssr_config_path=str(cohort.project_path / "response_scales.yaml") if ssr else None,
+        enable_ssr=ssr,
+        vocabulary=cohort.vocabulary
+    )
+    if stage == "llm_stub":
+        # The real-LLM path without the API: same routing, prompts come back canned
+        generator.use_real_llm = True
+        generator.llm_generator = StubLLMGenerator(llm_latency)
+        generator.model_router = ModelRouter.from_config(cohort.config.get("llm") or {})
+    return generator
+
+
+def run_cell(
+    project_path: Union[str, Path],
+    stage: str,
+    users: int,
+    seed: int = 42,
+    batch_size: int = 1_000,
+    llm_latency: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Run one stage at one cohort size
+
+    Users are generated in batches of `batch_size`, so memory stays bounded
+    at 100k users; the stage's own time excludes the earlier stages it
+    needs (e.g. personas for journeys), which are reported separately.
+
+    Returns:
+        Result row (see STAGES); rows for stages that cannot run here have
+        a "skipped" reason instead of timings
+    """
+    from core.dataset.codec import get_serializer, user_record
+    from core.generators.cohort_generator import CohortGenerator
+
+    setup_start = time.perf_counter()
+    cohort = CohortGenerator(project_path)
+    journey_gen = None
+    if stage != "personas":
+        try:
+            journey_gen = _journey_generator(cohort, stage, llm_latency)
+        except (ImportError, OSError) as e:
+            return {"stage": stage, "users": users, "skipped": str(e)}
+    serializer = get_serializer()
+    setup = time.perf_counter() - setup_start
+
+    random.seed(seed)
+    clock = _Clock()
+    steps = 0
+    done = 0
+    personas = cohort.persona_gen.iter_generate(users)
+    while done < users:
+        with clock.stage("personas"):
+            batch = list(islice(personas, batch_size))
+        if not batch:
+            break
+        if journey_gen is not None:
+            with clock.stage("journeys"):
+                journeys = [journey_gen.generate(persona, persona.id) for persona in batch]
+            steps += sum(len(journey.steps) for journey in journeys)
+        if stage == "serialize":
+            with clock.stage("profiles"):
+                profiles = [cohort.profile(persona, done + i) for i, persona in enumerate(batch)]
+            with clock.stage("to_dict"):
+                records = [user_record(user, journey) for user, journey in zip(profiles, journeys)]
+            with clock.stage("json.dumps"):
+                for record in records:
+                    json.dumps(record)
+            with clock.stage(f"encode:{serializer.name}"):
+                for user, journey in zip(profiles, journeys):
+                    serializer.encode_user(user, journey)
+        done += len(batch)
+
+    # The stage's own time: what its users/sec and steps/sec are measured on
+    if stage == "personas":
+        seconds = clock.seconds["personas"]
+    elif stage == "serialize":
+        seconds = clock.seconds["to_dict"] + clock.seconds["json.dumps"]
+    else:
+        seconds = clock.seconds["journeys"]
+
+    row = {
+        "stage": stage,
+        "users": done,
+        "steps": steps,
+        "seconds": round(seconds, 6),
+        "users_per_sec": round(done / seconds, 1) if seconds else None,
+        "steps_per_sec": round(steps / seconds, 1) if seconds and steps else None,
+        "stage_seconds": {name: round(value, 6) for name, value in clock.seconds.items()},
+        "setup_seconds": round(setup, 6),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+    if stage == "llm_stub":
+        row["llm_calls"] = journey_gen.llm_generator.calls
+    return row
+
+
+def _isolated(function, *args):
+    """Run a function in a fresh (spawned) interpreter and return its result"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(function, *args).result()
+
+
+def _cpu_model() -> str:
+    """CPU model name (platform.processor() is empty on most Linux systems)"""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def machine_fingerprint() -> Dict[str, Any]:
+    """Hardware, OS, interpreter and package versions; `id` hashes them all"""
+    import yaml
+
+    packages = {}
+    for name in PACKAGES:
+        try:
+            packages[name] = version(name)
+        except PackageNotFoundError:
+            pass
+    try:
+        memory_gb = round(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2**30, 1)
+    except (AttributeError, ValueError, OSError):
+        memory_gb = None
+
+    fingerprint = {
+        "cpu": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "memory_gb": memory_gb,
+        "os": platform.platform(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "libyaml": hasattr(yaml, "CSafeLoader"),
+        "packages": packages,
+    }
+    fingerprint["id"] = hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()[:16]
+    return fingerprint
+
+
+def git_revision(path: Union[str, Path] = REPO_ROOT) -> Dict[str, Any]:
+    """Commit being benchmarked and whether tracked files have local changes"""
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=path, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    try:
+        return {
+            "commit": git("rev-parse", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        }
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def run_suite(
+    project_path: Union[str, Path],
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    stages: Iterable[str] = STAGES,
+    seed: int = 42,
+    batch_size: int = 1_000,
+    ssr_users: int = 1_000,
+    llm_latency: float = 0.0,
+    isolate: bool = True,
+    progress=None
+) -> Dict[str, Any]:
+    """
+    Run the benchmark matrix
+
+    Args:
+        project_path: Project directory
+        sizes: Cohort sizes
+        stages: Stages to run (see STAGES)
+        seed: Seed of every cell
+        batch_size: Users generated per batch
+        ssr_users: Largest cohort for SSR stages (larger sizes are capped)
+        llm_latency: Seconds the stub LLM waits per call
+        isolate: Run each cell in a fresh process (peak RSS per cell)
+        progress: Called with each result row as it completes
+
+    Returns:
+        Report with the machine fingerprint, git revision and result rows
+
+    Raises:
+        ValueError: Unknown stage or a cohort size below 1
+    """
+    from core.generators.journey_generator import SSR_AVAILABLE
+    from core.utils.config_loader import config_hash
+
+    project_path = Path(project_path)
+    sizes, stages = sorted(set(sizes)), list(stages)
+    if not sizes or sizes[0] < 1:
+        raise ValueError(f"Cohort sizes must be at least 1, got {sizes}")
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"Unknown stages: {sorted(unknown)}. Available: {list(STAGES)}")
+
+    results = []
+    for stage in stages:
+        stage_sizes = sizes
+        if stage in SSR_STAGES:
+            stage_sizes = sorted({min(size, ssr_users) for size in stage_sizes})
+        for users in stage_sizes:
+            if stage in SSR_STAGES and not SSR_AVAILABLE:
+                row = {"stage": stage, "users": users, "skipped": "SSR extras are not installed"}
+            else:
+                args = (project_path, stage, users, seed, batch_size, llm_latency)
+                row = _isolated(run_cell, *args) if isolate else run_cell(*args)
+            results.append(row)
+            if progress is not None:
+                progress(row)
+
+    return {
+        "project": project_path.name,
+        "config_hash": config_hash(project_path),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "seed": seed,
+        "batch_size": batch_size,
+        "llm_latency": llm_latency,
+        "isolated": isolate,
+        "git": git_revision(),
+        "machine": machine_fingerprint(),
+        "results": results,
+    }
+
+
+def format_row(row: Dict[str, Any]) -> str:
+    """One line of the results table"""
+    label = f"{row['stage']:<26} {row['users']:>8,}"
+    if "skipped" in row:
+        return f"{label}   skipped: {row['skipped']}"
+    users_per_sec = f"{row['users_per_sec']:>11,.0f}" if row["users_per_sec"] else f"{'-':>11}"
+    steps_per_sec = f"{row['steps_per_sec']:>12,.0f}" if row["steps_per_sec"] else f"{'-':>12}"
+    rss = f"{row['peak_rss_mb']:>9,.0f}" if row["peak_rss_mb"] is not None else f"{'-':>9}"
+    breakdown = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in row["stage_seconds"].items())
+    return f"{label} {users_per_sec} {steps_per_sec} {rss}   {breakdown}"
+
+
+TABLE_HEADER = f"{'stage':<26} {'users':>8} {'users/sec':>11} {'steps/sec':>12} {'peak MB':>9}   stage time"
+
+
+def default_output(report: Dict[str, Any]) -> Path:
+    """output/bench/<project>-<timestamp>-<commit>.json"""
+    commit = (report["git"]["commit"] or "nogit")[:10]
+    stamp = report["created_at"].replace(":", "").replace("-", "")
+    return Path("output") / "bench" / f"{report['project']}-{stamp}-{commit}.json"
+
+
+def save_report(report: Dict[str, Any], path: Optional[Union[str, Path]] = None) -> Path:
+    """Write a report as JSON (default_output when no path is given)"""
+    path = Path(path) if path else default_output(report)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
+    return path
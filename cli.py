@@ -3,20 +3,33 @@
 Synth CLI - Multi-Domain Synthetic User Data Generator
 
 Usage:
-    python cli.py generate <project_name> [--count COUNT] [--output DIR]
+    python cli.py generate <project_name> [--count COUNT] [--output DIR] [--format json|jsonl|parquet] [--normalized] [--compress gzip|zstd]
+                                         [--shards N] [--workers N] [--seed SEED] [--append-to DATASET]
+                                         [--profile] [--profile-trace FILE] [--profile-pstats FILE]
+                                         [--memory-budget SIZE] [--config-cache [DIR]] [--ssr] [--ssr-backend torch|onnx]
+    python cli.py survey <dataset> [--group-by FIELD ...]
+    python cli.py export <dataset> --to sqlite|parquet [--output PATH]
+    python cli.py index <dataset.jsonl>
+    python cli.py verify-shards <dataset_dir> [--regenerate]
     python cli.py list-projects
     python cli.py validate <project_name>
+    python cli.py compile <project_name>
+    python cli.py serve [--host HOST] [--port PORT] [--workers N] [--preload PROJECT ...] [--ssr] [--ssr-backend torch|onnx]
+    python cli.py bench <project_name> [--sizes N ...] [--stages STAGE ...] [--seed SEED] [--output FILE]
 """
 
 import argparse
-import json
+import os
 from pathlib import Path
+import shutil
 import sys
+import time
+from typing import List, Optional
 
-from core.utils.config_loader import ConfigLoader
-from core.generators.persona_generator import PersonaGenerator
-from core.generators.journey_generator import JourneyGenerator
-from core.models.user_profile import UserProfile
+from core.utils.config_loader import DEFAULT_SNAPSHOT_DIR, ConfigLoader
+
+
+COMPRESS_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
 
 
 def main():
@@ -28,6 +41,69 @@ def main():
     generate_parser.add_argument("project", help="Project name")
     generate_parser.add_argument("--count", type=int, default=100, help="Number of users to generate")
     generate_parser.add_argument("--output", default="output", help="Output directory")
+    generate_parser.add_argument("--format", dest="output_format", choices=["json", "jsonl", "parquet", "sqlite"],
+                                 default="json",
+                                 help="Output format (jsonl/parquet stream users as they are generated; "
+                                      "parquet writes a directory of users/journeys/steps/ssr_responses tables, "
+                                      "sqlite a database with the same tables)")
+    generate_parser.add_argument("--flush-every", type=int, default=100,
+                                 help="Flush output to disk every N users")
+    generate_parser.add_argument("--normalized", action="store_true",
+                                 help="Write phase definitions once in a dataset header instead of "
+                                      "repeating them in every journey (json/jsonl)")
+    generate_parser.add_argument("--compress", choices=["gzip", "zstd"],
+                                 help="Stream-compress json/jsonl output (.gz / multithreaded .zst)")
+    generate_parser.add_argument("--shards", type=int, default=0,
+                                 help="Write N shard files plus manifest.json, generated in parallel")
+    generate_parser.add_argument("--workers", type=int, help="Worker processes for --shards (default: CPU count)")
+    generate_parser.add_argument("--seed", type=int, help="Random seed (recorded in the shard manifest)")
+    generate_parser.add_argument("--append-to", metavar="DATASET",
+                                 help="Add --count users to an existing JSONL or sharded dataset, allocated so "
+                                      "the combined persona and engagement-tier mix matches the targets")
+    generate_parser.add_argument("--profile", action="store_true",
+                                 help="Print time per stage (persona, journey, SSR, LLM, writing) when done")
+    generate_parser.add_argument("--profile-trace", metavar="FILE",
+                                 help="Also write a Chrome trace timeline (chrome://tracing, ui.perfetto.dev)")
+    generate_parser.add_argument("--profile-pstats", metavar="FILE",
+                                 help="Also run under cProfile and dump the stats (python -m pstats FILE)")
+    generate_parser.add_argument("--memory-budget", metavar="SIZE",
+                                 help="Stop early if the run is projected to exceed SIZE of RSS (e.g. 512M, 2G)")
+    generate_parser.add_argument("--config-cache", metavar="DIR", nargs="?", const=str(DEFAULT_SNAPSHOT_DIR),
+                                 help="Keep a compiled snapshot of the project config in DIR so later runs skip "
+                                      f"YAML parsing (default DIR: {DEFAULT_SNAPSHOT_DIR})")
+    generate_parser.add_argument("--ssr", action="store_true",
+                                 help="Rate every step on the project's response scales (requires the SSR extras) "
+                                      "and save survey statistics next to the summary")
+    generate_parser.add_argument("--ssr-backend", choices=["torch", "onnx"], default="torch",
+                                 help="Embedding backend for --ssr: onnx runs an int8-quantized export on CPU "
+                                      "(default: torch)")
+
+    # Export command
+    export_parser = subparsers.add_parser("export", help="Export a generated dataset to another format")
+    export_parser.add_argument("dataset", help="Generated dataset (.json or .jsonl)")
+    export_parser.add_argument("--to", dest="target", choices=["sqlite", "parquet"], required=True,
+                               help="Target format")
+    export_parser.add_argument("--output", help="Output path (default: dataset path with the target's extension)")
+    export_parser.add_argument("--batch-size", type=int, default=10000,
+                               help="Rows per executemany batch (sqlite)")
+
+    # Index command
+    index_parser = subparsers.add_parser("index", help="Build the offset index of a JSONL dataset")
+    index_parser.add_argument("dataset", help="Uncompressed JSONL dataset")
+
+    # Verify shards command
+    verify_parser = subparsers.add_parser("verify-shards", help="Check shard checksums against manifest.json")
+    verify_parser.add_argument("dataset", help="Sharded dataset directory")
+    verify_parser.add_argument("--regenerate", action="store_true", help="Regenerate missing or corrupt shards")
+    verify_parser.add_argument("--force", action="store_true",
+                               help="Regenerate even if the project config changed since generation")
+
+    # Survey command
+    survey_parser = subparsers.add_parser("survey", help="Report SSR survey statistics of a dataset generated with --ssr")
+    survey_parser.add_argument("dataset", help="Dataset file or sharded dataset directory")
+    survey_parser.add_argument("--group-by", nargs="+", default=["scale_id"], metavar="FIELD",
+                               help="Group fields: scale_id, persona_type, phase, engagement_tier "
+                                    "(default: scale_id)")
 
     # List projects command
     subparsers.add_parser("list-projects", help="List available projects")
@@ -36,20 +112,103 @@ def main():
     validate_parser = subparsers.add_parser("validate", help="Validate project configuration")
     validate_parser.add_argument("project", help="Project name")
 
+    # Compile command
+    compile_parser = subparsers.add_parser(
+        "compile", help="Validate a project and write its compiled config bundle"
+    )
+    compile_parser.add_argument("project", help="Project name")
+
+    # Serve command
+    serve_parser = subparsers.add_parser("serve", help="Serve on-demand generation over HTTP")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    serve_parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    serve_parser.add_argument("--chunk-size", type=int, default=500, help="Users per worker task")
+    serve_parser.add_argument("--preload", nargs="*", default=[], metavar="PROJECT",
+                              help="Projects to warm before accepting requests")
+    serve_parser.add_argument("--ssr", action="store_true",
+                              help="Also warm the SSR embedding model for the preloaded projects")
+    serve_parser.add_argument("--ssr-backend", choices=["torch", "onnx"], default="torch",
+                              help="Embedding backend for ssr=1 requests (default: torch)")
+
+    # Bench command
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the generation pipeline of a project")
+    bench_parser.add_argument("project", help="Project name")
+    bench_parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                              help="Cohort sizes (default: 1000 10000 100000)")
+    bench_parser.add_argument("--stages", nargs="+", metavar="STAGE",
+                              help="Stages to run: personas, journeys:time_based, journeys:session_based, "
+                                   "journeys:milestone_based, serialize, ssr, llm_stub (default: all)")
+    bench_parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    bench_parser.add_argument("--batch-size", type=int, default=1_000, help="Users generated per batch")
+    bench_parser.add_argument("--ssr-users", type=int, default=1_000, help="Largest cohort for the SSR stages")
+    bench_parser.add_argument("--llm-latency-ms", type=float, default=0.0,
+                              help="Simulated API latency per stub LLM call")
+    bench_parser.add_argument("--no-isolate", action="store_true",
+                              help="Run every cell in this process (faster; peak RSS becomes cumulative)")
+    bench_parser.add_argument("--output", help="Report file (default: output/bench/<project>-<time>-<commit>.json)")
+
     args = parser.parse_args()
 
     if args.command == "generate":
-        generate_users(args.project, args.count, args.output)
+        def generate():
+            generate_users(args.project, args.count, args.output, args.output_format, args.flush_every,
+                           args.normalized, args.compress, args.shards, args.workers, args.seed,
+                           args.append_to, args.memory_budget, args.config_cache, args.ssr, args.ssr_backend)
+
+        if args.profile or args.profile_trace or args.profile_pstats:
+            run_profiled(generate, args.profile_trace, args.profile_pstats)
+        else:
+            generate()
+    elif args.command == "export":
+        export_dataset(args.dataset, args.target, args.output, args.batch_size)
+    elif args.command == "index":
+        index_dataset(args.dataset)
+    elif args.command == "verify-shards":
+        verify_dataset_shards(args.dataset, args.regenerate, args.force)
+    elif args.command == "survey":
+        survey_report(args.dataset, args.group_by)
     elif args.command == "list-projects":
         list_projects()
     elif args.command == "validate":
         validate_project(args.project)
+    elif args.command == "compile":
+        compile_project(args.project)
+    elif args.command == "serve":
+        serve(args.host, args.port, args.workers, args.chunk_size, args.preload, args.ssr, args.ssr_backend)
+    elif args.command == "bench":
+        bench(args.project, args.sizes, args.stages, args.seed, args.batch_size, args.ssr_users,
+              args.llm_latency_ms, not args.no_isolate, args.output)
     else:
         parser.print_help()
 
 
-def generate_users(project_name: str, count: int, output_dir: str):
-    """Generate synthetic users for a project"""
+def generate_users(
+    project_name: str,
+    count: int,
+    output_dir: str,
+    output_format: str = "json",
+    flush_every: int = 100,
+    normalized: bool = False,
+    compress: Optional[str] = None,
+    shards: int = 0,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None,
+    append_to: Optional[str] = None,
+    memory_budget: Optional[str] = None,
+    config_cache: Optional[str] = None,
+    ssr: bool = False,
+    ssr_backend: str = "torch"
+):
+    """Generate synthetic users for a project, streaming each user to the output file"""
+    # Generators are imported here so list-projects/validate/--help start fast
+    from core.generators.cohort_generator import CohortGenerator
+    from core.dataset.writers import open_writer
+    from core.dataset.normalized import build_header
+    from core.dataset.summary import DatasetSummary, save_survey
+    from core.generators.ssr_aggregator import SurveyAggregator
+    from core.utils.memory import MemoryBudget, MemoryBudgetExceeded, format_size, parse_size
+
     print(f"🚀 Generating {count} synthetic users for {project_name}...")
 
     # Load project configuration
@@ -60,79 +219,343 @@ def generate_users(project_name: str, count: int, output_dir: str):
         sys.exit(1)
 
     try:
-        loader = ConfigLoader(project_path)
-
         # Load configurations
         print("📋 Loading configurations...")
-        config = loader.load_config()
-        personas = loader.load_personas()
-        journey_phases = loader.load_journey_phases()
-        emotional_states = loader.load_emotional_states()
-        journey_type = loader.get_journey_type()
+        # SSR responses are folded into survey statistics as they are generated
+        survey = SurveyAggregator() if ssr else None
+        cohort = CohortGenerator(project_path, snapshot_dir=config_cache, enable_ssr=ssr,
+                                 ssr_aggregator=survey, ssr_backend=ssr_backend)
 
-        print(f"   Found {len(personas)} persona types")
-        print(f"   Found {len(journey_phases)} journey phases")
-        print(f"   Journey type: {journey_type.value}")
+        print(f"   Found {len(cohort.personas)} persona types")
+        print(f"   Found {len(cohort.journey_phases)} journey phases")
+        print(f"   Journey type: {cohort.journey_type.value}")
 
-        # Generate personas
-        print(f"\n👥 Generating {count} persona instances...")
-        persona_gen = PersonaGenerator(personas)
-        generated_personas = persona_gen.generate(count)
+        if memory_budget and (append_to or shards):
+            raise ValueError("--memory-budget applies to single-file generation (not --append-to or --shards)")
 
-        # Generate journeys
-        print(f"🗺️  Generating user journeys...")
-        journey_gen = JourneyGenerator(journey_type, journey_phases, emotional_states)
-
-        # Create user profiles with journeys
-        users = []
-        for i, persona in enumerate(generated_personas):
-            if (i + 1) % 50 == 0:
-                print(f"   Progress: {i + 1}/{count}")
-
-            # Create user profile
-            user = UserProfile(
-                persona_type=persona.persona_type,
-                name=f"{persona.persona_type}_user_{i+1}",
-                age=persona.age,
-                gender=persona.gender,
-                education=persona.education,
-                engagement_level=persona.engagement_level,
-                action_tendency=persona.action_tendency,
-                anxiety_level=persona.anxiety_level,
-                attributes=persona.attributes
-            )
-
-            # Generate journey
-            journey = journey_gen.generate(persona, user.id)
-            user.journey_id = journey.id
-
-            # Combine user and journey data
-            user_data = user.to_dict()
-            user_data["journey"] = journey.to_dict()
+        if append_to:
+            append_users(cohort, append_to, count, flush_every, seed, survey)
+            return
 
-            users.append(user_data)
+        if compress and output_format not in ("json", "jsonl"):
+            raise ValueError(f"--compress applies to json/jsonl output, not {output_format}")
 
-        # Save to output
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        output_file = output_path / f"{project_name}_synthetic_users.json"
-        with open(output_file, 'w') as f:
-            json.dump(users, f, indent=2)
+        if shards:
+            generate_sharded(project_path, cohort, count, output_path / f"{project_name}_synthetic_users",
+                             output_format, normalized, compress, shards, workers, seed, config_cache, ssr,
+                             ssr_backend)
+            return
+
+        output_file = output_path / f"{project_name}_synthetic_users.{output_format}"
+        if compress:
+            output_file = output_file.with_name(output_file.name + COMPRESS_SUFFIXES[compress])
+
+        header = None
+        if normalized:
+            phases = [p.to_dict() for p in cohort.journey_gen.phases]
+            header = build_header(cohort.config, phases, cohort.journey_type.value)
+
+        # Generate personas and journeys
+        print(f"\n👥 Generating {count} persona instances...")
+        print(f"🗺️  Generating user journeys...")
 
-        print(f"\n✅ Generated {len(users)} users")
+        # Checked every few percent of the run (fails fast on a projected overrun)
+        budget = MemoryBudget(parse_size(memory_budget), count) if memory_budget else None
+
+        # Create user profiles with journeys, writing each one as it is generated
+        summary = DatasetSummary(project=project_name)
+        # Uncompressed JSONL gets a sidecar offset index for random access
+        index = output_format == "jsonl" and not compress
+        try:
+            with open_writer(output_file, output_format, flush_every, header=header, index=index,
+                             vocabulary=cohort.vocabulary) as writer:
+                users = cohort.iter_models(count, seed=seed)
+                for i, (user, journey) in enumerate(users):
+                    if (i + 1) % 50 == 0:
+                        print(f"   Progress: {i + 1}/{count}")
+
+                    writer.write_user(user, journey, include_phases=not normalized)
+                    summary.add_profile(user)
+                    if budget is not None:
+                        budget.check(i + 1)
+        except MemoryBudgetExceeded as e:
+            # The writer closed cleanly: keep the truncated dataset from passing for a complete one
+            partial = set_aside_partial(output_file)
+            raise MemoryBudgetExceeded(
+                f"{e}\n   Stopped after {writer.rows_written} of {count} users; partial output moved to {partial}"
+            ) from e
+
+        # Persona/tier counts next to the data, for top-ups without a full load
+        summary.save(output_file)
+        if survey is not None:
+            save_survey(survey, output_file)
+
+        total = writer.rows_written
+        print(f"\n✅ Generated {total} users")
         print(f"📁 Saved to: {output_file.absolute()}")
 
+        if survey is not None:
+            print(f"📈 Survey: {survey.n_responses} SSR responses (python cli.py survey {output_file})")
+        if budget is not None:
+            print(f"💾 Peak RSS: {format_size(budget.peak)} (budget {format_size(budget.limit)})")
+
         # Print summary
-        print("\n📊 Persona Distribution:")
-        persona_counts = {}
-        for user in users:
-            persona_type = user["persona_type"]
-            persona_counts[persona_type] = persona_counts.get(persona_type, 0) + 1
+        print_persona_distribution(summary.persona_counts, total)
+
+    except MemoryBudgetExceeded as e:
+        print(f"❌ Memory budget exceeded: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def set_aside_partial(output_file: Path) -> Path:
+    """Rename an incomplete dataset to <name>.partial and remove its sidecars (index, summary, survey)"""
+    from core.dataset.index import index_path
+    from core.dataset.summary import summary_path, survey_path
+
+    partial = output_file.with_name(output_file.name + ".partial")
+    if partial.is_dir():
+        shutil.rmtree(partial)
+    output_file.replace(partial)
+    for sidecar in (index_path(output_file), summary_path(output_file), survey_path(output_file)):
+        sidecar.unlink(missing_ok=True)
+    return partial
+
+
+def run_profiled(command, trace_file: Optional[str] = None, pstats_file: Optional[str] = None):
+    """Run a command with stage profiling (optionally also cProfile) and print the breakdown"""
+    from core.utils.profiling import Profiler, activate
+
+    profiler = Profiler(trace=bool(trace_file))
+    cprofile = None
+    if pstats_file:
+        import cProfile
+        cprofile = cProfile.Profile()
+
+    with activate(profiler):
+        if cprofile is not None:
+            cprofile.enable()
+        try:
+            command()
+        finally:
+            if cprofile is not None:
+                cprofile.disable()
+
+    print(f"\n⏱️  Stage breakdown ({profiler.elapsed:.2f}s wall, this process only)")
+    print(profiler.report())
+
+    if trace_file:
+        path = profiler.write_trace(trace_file)
+        truncated = f", truncated at {profiler.max_trace_events:,} events" if profiler.trace_truncated else ""
+        print(f"📈 Trace: {path.absolute()} ({len(profiler.events):,} events{truncated})")
+    if cprofile is not None:
+        import pstats
+        cprofile.dump_stats(pstats_file)
+        print(f"🔬 cProfile stats: {Path(pstats_file).absolute()} (top functions by cumulative time)")
+        pstats.Stats(cprofile).sort_stats("cumulative").print_stats(15)
+
+
+def generate_sharded(
+    project_path: Path,
+    cohort,
+    count: int,
+    dataset_dir: Path,
+    output_format: str,
+    normalized: bool,
+    compress: Optional[str],
+    shards: int,
+    workers: Optional[int],
+    seed: Optional[int],
+    config_cache: Optional[str] = None,
+    ssr: bool = False,
+    ssr_backend: str = "torch"
+):
+    """Generate shards in parallel worker processes and write manifest.json"""
+    from core.dataset.shards import write_sharded_dataset
+
+    if output_format not in ("json", "jsonl"):
+        raise ValueError(f"--shards supports json/jsonl output, not {output_format}")
+
+    print(f"\n🧩 Generating {shards} shards ({workers or os.cpu_count()} workers)...")
+
+    def on_shard(entry):
+        print(f"   ✓ {entry['file']}: {entry['rows']} users")
+
+    manifest = write_sharded_dataset(
+        project_path, dataset_dir, count, shards,
+        workers=workers, output_format=output_format, compress=compress,
+        seed=seed, normalized=normalized, on_shard=on_shard, snapshot_dir=config_cache, ssr=ssr,
+        ssr_backend=ssr_backend
+    )
+
+    print(f"\n✅ Generated {manifest['total_rows']} users in {len(manifest['shards'])} shards (seed {manifest['seed']})")
+    print(f"📁 Saved to: {dataset_dir.absolute()}")
+
+    print_persona_distribution(manifest["persona_counts"], manifest["total_rows"])
+
+
+def append_users(cohort, dataset: str, count: int, flush_every: int = 100, seed: Optional[int] = None,
+                 survey=None):
+    """Top up an existing dataset with users allocated to close persona/tier deficits"""
+    from core.dataset.index import index_path
+    from core.dataset.compression import data_suffix
+    from core.dataset.readers import read_header, resolve_dataset
+    from core.dataset.shards import append_shard, is_sharded, load_manifest
+    from core.dataset.summary import read_summary, read_survey, save_survey, survey_path
+    from core.dataset.writers import open_writer
+
+    dataset_path = resolve_dataset(dataset)
+    if not dataset_path.exists():
+        raise FileNotFoundError(f"Dataset not found: {dataset}")
+    sharded = is_sharded(dataset_path)
+    if not sharded and data_suffix(dataset_path) != ".jsonl":
+        raise ValueError("--append-to supports JSONL and sharded datasets "
+                         "(regenerate with --format jsonl or --shards)")
+
+    print(f"\n📊 Reading composition of {dataset_path}...")
+    summary = read_summary(dataset_path)
+    project_name = cohort.project_path.name
+    if summary.project and summary.project != project_name:
+        raise ValueError(f"Dataset was generated from project '{summary.project}', not '{project_name}'")
+    rated = load_manifest(dataset_path).get("ssr", False) if sharded else survey_path(dataset_path).exists()
+    if rated != (survey is not None):
+        raise ValueError(f"Dataset was generated {'with' if rated else 'without'} --ssr; append with the same setting")
+
+    persona_counts, tier_counts = cohort.persona_gen.top_up_counts(
+        summary.persona_counts, summary.engagement_tier_counts, count
+    )
+    print(f"   Existing users: {summary.rows}")
+    print(f"   New engagement tiers: " + ", ".join(f"{tier} {n}" for tier, n in sorted(tier_counts.items())))
+
+    print(f"\n👥 Generating {count} additional users...")
+    if sharded:
+        entry = append_shard(dataset_path, persona_counts, tier_counts, cohort.project_path)
+        print(f"   ✓ {entry['file']}: {entry['rows']} users")
+        summary = read_summary(dataset_path)
+    else:
+        normalized = read_header(dataset_path) is not None
+        index = index_path(dataset_path).exists()
+        with open_writer(dataset_path, "jsonl", flush_every, index=index, append=True) as writer:
+            users = cohort.iter_models(
+                count, persona_counts, start=summary.rows, seed=seed, engagement_tier_counts=tier_counts
+            )
+            for user, journey in users:
+                writer.write_user(user, journey, include_phases=not normalized)
+                summary.add_profile(user)
+        summary.project = project_name
+        summary.save(dataset_path)
+        if survey is not None:
+            save_survey(read_survey(dataset_path).merge(survey), dataset_path)
+
+    print(f"\n✅ Appended {count} users ({summary.rows} total)")
+    print(f"📁 Saved to: {dataset_path.absolute()}")
+
+    print_persona_distribution(summary.persona_counts, summary.rows)
+    print("\n📊 Engagement Tiers:")
+    for tier, tier_count in sorted(summary.engagement_tier_counts.items()):
+        print(f"   {tier}: {tier_count} ({tier_count / summary.rows * 100:.1f}%)")
+
+
+def print_persona_distribution(persona_counts, total: int):
+    """Print the persona summary of a generated cohort"""
+    print("\n📊 Persona Distribution:")
+    for persona_type, persona_count in sorted(persona_counts.items()):
+        percentage = (persona_count / total) * 100
+        print(f"   {persona_type}: {persona_count} ({percentage:.1f}%)")
+
+
+def verify_dataset_shards(dataset: str, regenerate: bool = False, force: bool = False):
+    """Verify shard checksums against manifest.json, optionally regenerating bad shards"""
+    from core.dataset.shards import load_manifest, regenerate_shard, verify_shards
+
+    print(f"🔍 Verifying {dataset}...")
+    try:
+        manifest = load_manifest(dataset)
+        bad = verify_shards(dataset)
+        print(f"   {len(manifest['shards']) - len(bad)}/{len(manifest['shards'])} shards OK")
+
+        if not bad:
+            print("\n✅ All shards match the manifest")
+            return
+
+        for index in bad:
+            print(f"   ✗ {manifest['shards'][index]['file']}")
+            if regenerate:
+                entry = regenerate_shard(dataset, index, force=force)
+                print(f"     ↻ regenerated ({entry['rows']} users)")
+
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if not regenerate:
+        print("\n❌ Shards do not match the manifest (rerun with --regenerate)")
+        sys.exit(1)
+    print("\n✅ Bad shards regenerated")
+
 
-        for persona_type, count in sorted(persona_counts.items()):
-            percentage = (count / len(users)) * 100
-            print(f"   {persona_type}: {count} ({percentage:.1f}%)")
+def survey_report(dataset: str, group_by: List[str]):
+    """Print SSR survey statistics of a dataset, merged across shards"""
+    from core.dataset.summary import read_survey
+
+    try:
+        survey = read_survey(dataset)
+        if survey is None:
+            raise ValueError(f"{dataset} has no survey statistics (generate it with --ssr)")
+        results = survey.results(group_by)
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    print(f"📈 Survey of {dataset}: {survey.n_responses} SSR responses")
+    print(f"\n   {' / '.join(group_by):<48} {'n':>8} {'mean':>6} {'var':>6}  pmf")
+    for key, stats in sorted(results.items()):
+        pmf = " ".join(f"{p:.2f}" for p in stats["aggregate_pmf"])
+        print(f"   {' / '.join(key):<48} {stats['n_responses']:>8} "
+              f"{stats['aggregate_expected_value']:>6.2f} {stats['expected_value_variance']:>6.2f}  {pmf}")
+
+
+def export_dataset(dataset: str, target: str, output: Optional[str] = None, batch_size: int = 10000):
+    """Stream a generated JSON/JSONL dataset into SQLite or Parquet tables"""
+    from core.dataset.compression import compression_for
+    from core.dataset.readers import iter_users
+
+    dataset_path = Path(dataset)
+    if not dataset_path.exists():
+        print(f"❌ Dataset not found: {dataset_path}")
+        sys.exit(1)
+
+    if output:
+        output_path = Path(output)
+    else:
+        # users.jsonl.zst -> users.sqlite
+        stem_path = dataset_path.with_suffix("") if compression_for(dataset_path) else dataset_path
+        output_path = stem_path.with_suffix(f".{target}")
+    print(f"📦 Exporting {dataset_path} to {target}...")
+
+    start = time.perf_counter()
+    try:
+        if target == "sqlite":
+            from core.dataset.sqlite import SqliteCohortWriter
+            writer = SqliteCohortWriter(output_path, batch_size=batch_size)
+        else:
+            from core.dataset.parquet import ParquetCohortWriter
+            writer = ParquetCohortWriter(output_path)
+
+        with writer:
+            for user_data in iter_users(dataset_path):
+                writer.write(user_data)
+                if writer.rows_written % 10000 == 0:
+                    print(f"   Progress: {writer.rows_written} users")
+            if target == "sqlite":
+                print("🗂️  Building indexes...")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -140,6 +563,28 @@ def generate_users(project_name: str, count: int, output_dir: str):
         traceback.print_exc()
         sys.exit(1)
 
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Exported {writer.rows_written} users in {elapsed:.1f}s")
+    print(f"📁 Saved to: {output_path.absolute()}")
+
+
+def index_dataset(dataset: str):
+    """Build the sidecar offset index for random access into a JSONL dataset"""
+    from core.dataset.index import IndexedDataset, build_index
+
+    print(f"🗂️  Indexing {dataset}...")
+    try:
+        index_file = build_index(dataset)
+        with IndexedDataset(dataset, build=False) as indexed:
+            print(f"\n✅ Indexed {len(indexed)} users")
+            for persona_type, persona_count in sorted(indexed.persona_counts().items()):
+                print(f"   {persona_type}: {persona_count}")
+    except (OSError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    print(f"📁 Saved to: {index_file.absolute()}")
+
 
 def list_projects():
     """List available projects"""
@@ -182,7 +627,8 @@ def validate_project(project_name: str):
         sys.exit(1)
 
     try:
-        loader = ConfigLoader(project_path)
+        # Validate the YAML files themselves, not a compiled bundle
+        loader = ConfigLoader(project_path, use_bundle=False)
 
         # Validate each config file
         print("✅ config.yaml loaded")
@@ -218,5 +664,98 @@ def validate_project(project_name: str):
         sys.exit(1)
 
 
+def compile_project(project_name: str):
+    """Validate all project YAML files and write the compiled config bundle"""
+    from core.utils.config_bundle import PROJECT_FILES, compile_bundle
+
+    print(f"🛠️  Compiling {project_name}...")
+
+    project_path = Path("projects") / project_name
+    if not project_path.exists():
+        print(f"❌ Project not found: {project_name}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    try:
+        bundle, warnings = compile_bundle(project_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Compilation failed: {e}")
+        sys.exit(1)
+
+    for warning in warnings:
+        print(f"⚠️  Warning: {warning}")
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Validated {len(PROJECT_FILES)} configuration files in {elapsed * 1000:.0f} ms")
+    print(f"📁 Saved to: {bundle.absolute()} ({bundle.stat().st_size / 1024:.0f} KiB)")
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: Optional[int] = None,
+    chunk_size: int = 500,
+    preload: Optional[list] = None,
+    ssr: bool = False,
+    ssr_backend: str = "torch"
+):
+    """Serve GET /generate?project=&count=&seed= as streamed JSONL from warm generators"""
+    import asyncio
+    from core.service import GenerationService, ServiceError
+
+    service = GenerationService(Path("projects"), workers=workers, chunk_size=chunk_size,
+                                ssr_backend=ssr_backend)
+    try:
+        for project in preload or []:
+            print(f"🔥 Warming {project}{' (with SSR)' if ssr else ''}...")
+            service.preload([project], ssr=ssr)
+    except (ServiceError, ImportError, ValueError) as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    print(f"🌐 Serving on http://{host}:{port} ({service.workers} workers)")
+    print(f"   GET /generate?project=<name>&count=<n>&seed=<seed>[&ssr=1]")
+    try:
+        asyncio.run(service.serve_forever(host, port))
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+
+
+def bench(
+    project_name: str,
+    sizes: List[int],
+    stages: Optional[List[str]] = None,
+    seed: int = 42,
+    batch_size: int = 1_000,
+    ssr_users: int = 1_000,
+    llm_latency_ms: float = 0.0,
+    isolate: bool = True,
+    output: Optional[str] = None
+):
+    """Run the benchmark matrix and save the report with the machine fingerprint and git revision"""
+    from benchmarks.suite import STAGES, TABLE_HEADER, format_row, run_suite, save_report
+
+    project_path = Path("projects") / project_name
+    if not project_path.exists():
+        print(f"❌ Project not found: {project_name}")
+        sys.exit(1)
+
+    stages = stages or list(STAGES)
+    print(f"⏱️  Benchmarking {project_name}: {', '.join(f'{n:,}' for n in sizes)} users")
+    print(TABLE_HEADER)
+    try:
+        report = run_suite(
+            project_path, sizes, stages, seed, batch_size, ssr_users, llm_latency_ms / 1000, isolate,
+            progress=lambda row: print(format_row(row), flush=True)
+        )
+    except (ValueError, AssertionError) as e:
+        print(f"❌ Benchmark failed: {e}")
+        sys.exit(1)
+
+    path = save_report(report, output)
+    machine = report["machine"]
+    print(f"\n🖥️  {machine['cpu']} ({machine['cpu_count']} CPUs), {machine['python']}, fingerprint {machine['id']}")
+    print(f"📁 Saved to: {path.absolute()}")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,24 @@
+"""Dataset writers and readers for generated cohorts"""
+
+from .writers import JsonArrayWriter, JsonlWriter, open_writer
+from .normalized import build_header, denormalize_user
+from .readers import iter_users, load_users, read_header, select_users
+from .index import IndexedDataset, build_index
+from .loader import CohortLoader, CohortRecord, load_cohort
+
+__all__ = [
+    "JsonArrayWriter",
+    "JsonlWriter",
+    "open_writer",
+    "build_header",
+    "denormalize_user",
+    "iter_users",
+    "load_users",
+    "read_header",
+    "select_users",
+    "IndexedDataset",
+    "build_index",
+    "CohortLoader",
+    "CohortRecord",
+    "load_cohort",
+]
@@ -0,0 +1,285 @@
+"""
+JSON encoding and decoding for datasets.
+
+Decoding: loads() parses with orjson when installed (several times faster
+than the stdlib json module; accepts str, bytes and memoryview, so
+memory-mapped rows are decoded without copying).
+
+Encoding: serializers write core model objects (UserProfile, Persona,
+Journey, JourneyStep, JourneyPhase) straight from their attributes instead
+of going through to_dict(). Datetimes and enums are handed to the backend
+as-is and encoded natively, so nothing calls isoformat() or .value per
+step. Backends, fastest first (python -m benchmarks.serializer):
+
+    msgspec  - pip install msgspec
+    orjson   - pip install orjson
+    json     - stdlib, always available (json.dumps(obj.to_dict()), as before)
+
+Every backend produces the same documents as to_dict(); the fast backends
+use compact separators and write non-ASCII characters as UTF-8.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Union
+
+from ..models.journey import Journey, JourneyPhase, JourneyStep
+from ..models.persona import Persona
+from ..models.user_profile import UserProfile
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Decode one JSON document with the fastest available decoder"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def decoder_name() -> str:
+    """Name of the decoder loads() uses"""
+    return "orjson" if orjson is not None else "json"
+
+
+# Model fields in to_dict() layout, with datetimes and enums left for the backend
+
+def _profile_fields(user: UserProfile) -> Dict[str, Any]:
+    return {
+        "id": user.id,
+        "persona_type": user.persona_type,
+        "created_at": user.created_at,
+        "name": user.name,
+        "age": user.age,
+        "gender": user.gender,
+        "education": user.education,
+        "location": user.location,
+        "engagement_level": user.engagement_level,
+        "action_tendency": user.action_tendency,
+        "anxiety_level": user.anxiety_level,
+        "attributes": user.attributes,
+        "journey_id": user.journey_id,
+        "metadata": user.metadata
+    }
+
+
+def _step_fields(step: JourneyStep) -> Dict[str, Any]:
+    data = {
+        "id": step.id,
+        "phase_id": step.phase_id,
+        "step_number": step.step_number,
+        "timestamp": step.timestamp,
+        "actions": step.actions,
+        "emotional_state": step.emotional_state,
+        "completion_status": step.completion_status,
+        "data_captured": step.data_captured,
+        "narrative_responses": step.narrative_responses,
+        "time_invested": step.time_invested,
+        "engagement_score": step.engagement_score
+    }
+    if step.ssr_responses:
+        data["ssr_responses"] = step.ssr_responses
+    return data
+
+
+def _journey_fields(journey: Journey, include_phases: bool = True) -> Dict[str, Any]:
+    data = {
+        "id": journey.id,
+        "user_id": journey.user_id,
+        "persona_type": journey.persona_type,
+        "journey_type": journey.journey_type,
+    }
+    if include_phases:
+        data["phases"] = [phase.to_dict() for phase in journey.phases]
+    else:
+        data["phase_ids"] = [phase.id for phase in journey.phases]
+    data["steps"] = [_step_fields(step) for step in journey.steps]
+    data["current_phase"] = journey.current_phase
+    data["overall_completion"] = journey.overall_completion
+    data["started_at"] = journey.started_at
+    data["last_activity"] = journey.last_activity
+    data["completed_at"] = journey.completed_at
+    return data
+
+
+MODEL_FIELDS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    UserProfile: _profile_fields,
+    Persona: Persona.to_dict,
+    Journey: _journey_fields,
+    JourneyStep: _step_fields,
+    JourneyPhase: JourneyPhase.to_dict,
+}
+
+
+def user_fields(
+    user: UserProfile,
+    journey: Optional[Journey] = None,
+    include_phases: bool = True
+) -> Dict[str, Any]:
+    """
+    User record in dataset layout (see user_record)
+
+    Datetimes and enums are left as objects; encode with a serializer.
+    """
+    data = _profile_fields(user)
+    if journey is not None:
+        data["journey"] = _journey_fields(journey, include_phases)
+    return data
+
+
+def user_record(
+    user: UserProfile,
+    journey: Optional[Journey] = None,
+    include_phases: bool = True
+) -> Dict[str, Any]:
+    """User dict as written to datasets (UserProfile.to_dict() plus the journey dict)"""
+    data = user.to_dict()
+    if journey is not None:
+        data["journey"] = journey.to_dict(include_phases=include_phases)
+    return data
+
+
+def _model_default(obj: Any) -> Any:
+    """Encode hook for model objects (and other dataclasses) nested in data"""
+    encode = MODEL_FIELDS.get(type(obj))
+    if encode is not None:
+        return encode(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_default(obj: Any) -> Any:
+    """json.dumps hook adding the types the fast backends handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return _model_default(obj)
+
+
+class JsonSerializer:
+    """Stdlib json backend (models are encoded through to_dict())"""
+
+    name = "json"
+
+    def dumps(self, data: Any) -> str:
+        """Encode plain data (dicts, lists, datetimes, enums, model objects)"""
+        return json.dumps(data, default=_stdlib_default)
+
+    def encode(self, obj: Any) -> str:
+        """Encode one model object in its to_dict() layout"""
+        return self.dumps(obj.to_dict())
+
+    def encode_user(
+        self,
+        user: UserProfile,
+        journey: Optional[Journey] = None,
+        include_phases: bool = True
+    ) -> str:
+        """
+        Encode a dataset record from model objects
+
+        Args:
+            user: User profile
+            journey: The user's journey (None = profile only)
+            include_phases: Embed phase definitions (False writes phase_ids
+                for normalized datasets)
+
+        Returns:
+            One-line JSON document
+        """
+        return self.dumps(user_record(user, journey, include_phases))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class NativeSerializer(JsonSerializer):
+    """Base for backends that encode datetimes and enums themselves"""
+
+    def encode(self, obj: Any) -> str:
+        return self.dumps(MODEL_FIELDS[type(obj)](obj))
+
+    def encode_user(
+        self,
+        user: UserProfile,
+        journey: Optional[Journey] = None,
+        include_phases: bool = True
+    ) -> str:
+        return self.dumps(user_fields(user, journey, include_phases))
+
+
+class OrjsonSerializer(NativeSerializer):
+    """orjson backend (datetimes and enums are encoded natively)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("The orjson serializer requires orjson. Install with: pip install orjson")
+        # Model dataclasses go through MODEL_FIELDS instead of orjson's field dump
+        self._option = orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(self, data: Any) -> str:
+        return orjson.dumps(data, default=_model_default, option=self._option).decode()
+
+
+class MsgspecSerializer(NativeSerializer):
+    """msgspec backend (datetimes and enums are encoded natively)"""
+
+    name = "msgspec"
+
+    def __init__(self):
+        try:
+            import msgspec
+        except ImportError:
+            raise ImportError("The msgspec serializer requires msgspec. Install with: pip install msgspec")
+        self._encoder = msgspec.json.Encoder(enc_hook=_model_default)
+
+    def dumps(self, data: Any) -> str:
+        # msgspec encodes dataclasses itself (all fields), so model objects
+        # nested in plain data are not routed through MODEL_FIELDS; use
+        # encode() / encode_user() for models
+        return self._encoder.encode(data).decode()
+
+
+# Preference order for get_serializer()
+SERIALIZERS = {
+    "msgspec": MsgspecSerializer,
+    "orjson": OrjsonSerializer,
+    "json": JsonSerializer,
+}
+
+_instances: Dict[str, JsonSerializer] = {}
+
+
+def get_serializer(name: Optional[str] = None) -> JsonSerializer:
+    """
+    Get a serializer backend
+
+    Args:
+        name: "msgspec", "orjson" or "json" (None = fastest installed)
+
+    Returns:
+        Shared serializer instance
+    """
+    if name is None:
+        for candidate in SERIALIZERS:
+            try:
+                return get_serializer(candidate)
+            except ImportError:
+                continue
+
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer '{name}'. Available: {list(SERIALIZERS)}")
+    if name not in _instances:
+        _instances[name] = SERIALIZERS[name]()
+    return _instances[name]
@@ -0,0 +1,146 @@
+"""
+Transparent streaming compression for dataset files, chosen by extension.
+
+    users.jsonl.zst   zstd (multithreaded compression, requires zstandard)
+    users.json.gz     gzip (stdlib)
+    users.jsonl       uncompressed
+
+open_text() returns a text file object for any of these, so writers and
+readers stream through compression without buffering the whole dataset.
+Appending starts a new gzip member / zstd frame; readers decode across them.
+"""
+
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".zst": "zstd",
+}
+
+DEFAULT_LEVELS = {
+    "gzip": 6,
+    "zstd": 3,
+}
+
+
+def compression_for(path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect compression from the file extension
+
+    Args:
+        path: Dataset path
+
+    Returns:
+        "gzip", "zstd" or None
+    """
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix)
+
+
+def data_suffix(path: Union[str, Path]) -> str:
+    """Extension of the uncompressed data, e.g. ".jsonl" for users.jsonl.zst"""
+    path = Path(path)
+    if compression_for(path):
+        path = path.with_suffix("")
+    return path.suffix
+
+
+def resolve_path(path: Union[str, Path]) -> Path:
+    """
+    Find a dataset file, falling back to its compressed variants
+
+    Lets scripts keep referring to users.json after the dataset has been
+    shipped as users.json.zst or users.json.gz.
+
+    Args:
+        path: Dataset path as referenced by the caller
+
+    Returns:
+        Existing path (the original path if no variant exists)
+    """
+    path = Path(path)
+    if path.exists() or compression_for(path):
+        return path
+    for suffix in COMPRESSION_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def _zstandard():
+    """Import zstandard with an installation hint"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires the zstandard package. "
+            "Install with: pip install zstandard"
+        )
+    return zstandard
+
+
+def open_text(
+    path: Union[str, Path],
+    mode: str = "r",
+    level: Optional[int] = None,
+    threads: int = -1
+) -> IO[str]:
+    """
+    Open a possibly compressed file in text mode
+
+    Args:
+        path: File path; .gz and .zst are compressed transparently
+        mode: "r", "w" or "a"
+        level: Compression level (None = DEFAULT_LEVELS)
+        threads: zstd compression worker threads (-1 = one per CPU, 0 = single-threaded)
+
+    Returns:
+        Text file object (UTF-8)
+    """
+    if mode not in ("r", "w", "a"):
+        raise ValueError(f"Unsupported mode '{mode}'. Use 'r', 'w' or 'a'")
+
+    compression = compression_for(path)
+    if compression is None:
+        return open(path, mode, encoding="utf-8")
+
+    if level is None:
+        level = DEFAULT_LEVELS[compression]
+
+    if compression == "gzip":
+        if mode == "r":
+            return gzip.open(path, "rt", encoding="utf-8")
+        return gzip.open(path, mode + "t", compresslevel=level, encoding="utf-8")
+
+    zstandard = _zstandard()
+    raw = open(path, mode + "b")
+    if mode == "r":
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+    else:
+        compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+        stream = compressor.stream_writer(raw, closefd=True)
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """json.load() for plain, .gz or .zst files (see resolve_path)"""
+    with open_text(resolve_path(path)) as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: Union[str, Path], **kwargs) -> None:
+    """
+    json.dump() to a plain, .gz or .zst file
+
+    Args:
+        data: JSON-serializable object
+        path: Output path; compression is chosen by extension
+        **kwargs: Passed to json.dump (indent, default, ...)
+    """
+    with open_text(path, "w") as f:
+        json.dump(data, f, **kwargs)
@@ -0,0 +1,255 @@
+"""
+Sidecar offset index for random access into JSONL datasets.
+
+users.jsonl.idx records the byte offset of every row together with its
+user id and persona type, so single users (or all users of one persona
+type) can be read from a memory-mapped users.jsonl without parsing the
+rest of the file. The index is written by JsonlWriter(index=True) while
+generating, or afterwards with build_index().
+
+Only uncompressed JSONL can be indexed (offsets into a compressed stream
+are not seekable).
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .codec import loads
+from .compression import compression_for
+from .normalized import denormalize_user, phase_index
+from .writers import HEADER_KEY
+
+
+INDEX_FORMAT = "synth.offset_index"
+INDEX_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+
+def index_path(path: Union[str, Path]) -> Path:
+    """Sidecar index path for a JSONL dataset (users.jsonl -> users.jsonl.idx)"""
+    path = Path(path)
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+class OffsetIndexBuilder:
+    """Collect row offsets while a JSONL dataset is written"""
+
+    def __init__(self):
+        """Initialize an empty index"""
+        self.ids: List[str] = []
+        self.offsets: List[int] = []
+        self.persona_rows: Dict[str, List[int]] = {}
+        self.header_offset: Optional[int] = None
+
+    def add(self, record: Dict[str, Any], offset: int) -> None:
+        """
+        Record one user row
+
+        Args:
+            record: User dict written at this offset
+            offset: Byte offset of the row's first byte
+        """
+        row = len(self.offsets)
+        self.ids.append(record.get("id"))
+        self.offsets.append(offset)
+        self.persona_rows.setdefault(record.get("persona_type"), []).append(row)
+
+    @classmethod
+    def load(cls, data_path: Union[str, Path]) -> "OffsetIndexBuilder":
+        """
+        Resume the index of an existing dataset (for appending rows)
+
+        Args:
+            data_path: Indexed JSONL file; indexed first if the sidecar is missing
+
+        Returns:
+            Builder holding the existing rows
+        """
+        sidecar = index_path(data_path)
+        if not sidecar.exists():
+            build_index(data_path)
+        with open(sidecar) as f:
+            index = json.load(f)
+
+        data_size = Path(data_path).stat().st_size
+        if index["data_size"] != data_size:
+            raise ValueError(f"Stale offset index {sidecar}; rebuild with build_index()")
+
+        builder = cls()
+        builder.ids = index["ids"]
+        builder.offsets = index["offsets"][:-1]
+        builder.persona_rows = index["persona_types"]
+        builder.header_offset = index.get("header_offset")
+        return builder
+
+    def save(self, data_path: Union[str, Path], data_size: int) -> Path:
+        """
+        Write the sidecar index
+
+        Args:
+            data_path: Indexed JSONL file
+            data_size: Size of the JSONL file in bytes (end offset of the last row)
+
+        Returns:
+            Path of the written index
+        """
+        path = index_path(data_path)
+        with open(path, "w") as f:
+            json.dump({
+                "format": INDEX_FORMAT,
+                "version": INDEX_VERSION,
+                "data_file": Path(data_path).name,
+                "data_size": data_size,
+                "rows": len(self.offsets),
+                "header_offset": self.header_offset,
+                "ids": self.ids,
+                # One extra entry so row i spans offsets[i]:offsets[i + 1]
+                "offsets": self.offsets + [data_size],
+                "persona_types": self.persona_rows,
+            }, f)
+        return path
+
+
+def build_index(path: Union[str, Path]) -> Path:
+    """
+    Index an existing JSONL dataset
+
+    Args:
+        path: Uncompressed JSONL file (legacy or normalized)
+
+    Returns:
+        Path of the written index
+    """
+    path = Path(path)
+    if compression_for(path):
+        raise ValueError(f"Cannot index compressed dataset {path}; decompress it first")
+
+    builder = OffsetIndexBuilder()
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                record = loads(line)
+                if HEADER_KEY in record:
+                    builder.header_offset = offset
+                else:
+                    builder.add(record, offset)
+            offset += len(line)
+    return builder.save(path, offset)
+
+
+class IndexedDataset:
+    """Random-access reader over a memory-mapped JSONL dataset and its offset index"""
+
+    def __init__(self, path: Union[str, Path], denormalize: bool = True, build: bool = True):
+        """
+        Open an indexed dataset
+
+        Args:
+            path: JSONL dataset
+            denormalize: Expand phase references of normalized datasets
+            build: Build the index if the sidecar is missing
+
+        Raises:
+            FileNotFoundError: If the index is missing and build is False
+            ValueError: If the index does not match the dataset (stale)
+        """
+        self.path = Path(path)
+        self.denormalize = denormalize
+
+        sidecar = index_path(self.path)
+        if not sidecar.exists():
+            if not build:
+                raise FileNotFoundError(f"No offset index for {self.path} (expected {sidecar})")
+            build_index(self.path)
+
+        with open(sidecar) as f:
+            index = json.load(f)
+
+        data_size = self.path.stat().st_size
+        if index.get("format") != INDEX_FORMAT or index["data_size"] != data_size:
+            raise ValueError(
+                f"Stale offset index {sidecar} ({index.get('data_size')} bytes indexed, "
+                f"{data_size} on disk); rebuild with build_index()"
+            )
+
+        self.ids: List[str] = index["ids"]
+        self._offsets: List[int] = index["offsets"]
+        self._persona_rows: Dict[str, List[int]] = index["persona_types"]
+        self._rows_by_id: Optional[Dict[str, int]] = None
+
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if data_size else b""
+
+        self.header: Optional[Dict[str, Any]] = None
+        if index.get("header_offset") is not None:
+            start = index["header_offset"]
+            end = self._mmap.find(b"\n", start)
+            self.header = loads(self._mmap[start:end if end != -1 else None])[HEADER_KEY]
+        self._phases_by_id = phase_index(self.header) if self.header else None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, row: int) -> Dict[str, Any]:
+        """Read the user at a row number"""
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(f"Row {row} out of range for {len(self)} users")
+
+        user = loads(self._mmap[self._offsets[row]:self._offsets[row + 1]])
+        if self.denormalize and self.header:
+            denormalize_user(user, self.header, self._phases_by_id)
+        return user
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for row in range(len(self)):
+            yield self[row]
+
+    def row_of(self, user_id: str) -> Optional[int]:
+        """Row number of a user id (None if absent)"""
+        if self._rows_by_id is None:
+            self._rows_by_id = {user_id: row for row, user_id in enumerate(self.ids)}
+        return self._rows_by_id.get(user_id)
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Read a single user by id (None if absent)"""
+        row = self.row_of(user_id)
+        return None if row is None else self[row]
+
+    def iter_persona(self, persona_type: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Read the users of one persona type
+
+        Args:
+            persona_type: Persona type to select
+            limit: Stop after this many users
+
+        Yields:
+            User dictionaries in file order
+        """
+        rows = self._persona_rows.get(persona_type, [])
+        for row in rows[:limit] if limit is not None else rows:
+            yield self[row]
+
+    def persona_counts(self) -> Dict[str, int]:
+        """Number of users per persona type (from the index alone)"""
+        return {persona_type: len(rows) for persona_type, rows in self._persona_rows.items()}
+
+    def close(self) -> None:
+        """Release the memory map and file handle"""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "IndexedDataset":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"IndexedDataset(path={self.path}, users={len(self)})"
@@ -0,0 +1,302 @@
+"""
+Typed loading of generated datasets.
+
+CohortLoader streams a dataset back into model objects - UserProfile,
+Persona (with its PersonaConfig reattached from the project) and Journey -
+or into columnar polars frames:
+
+    loader = CohortLoader("output/users.jsonl", project_path="projects/private_language")
+    for record in loader:
+        journey_gen.generate(record.persona, record.profile.id)
+
+    frames = loader.frames()          # {"users": DataFrame, "steps": ..., ...}
+
+JSON/JSONL datasets (legacy, normalized, compressed or sharded) are decoded
+with orjson when it is installed; Parquet cohort directories are read in
+record batches and reassembled in file order. Phase definitions are built
+once per dataset and shared by every journey, and categorical strings
+(persona_type, emotional_state, actions, ...) are interned against the
+project vocabulary, so every object references one string per value.
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from ..models.journey import Journey, JourneyPhase
+from ..models.persona import Persona, PersonaConfig
+from ..models.user_profile import UserProfile
+from ..models.vocabulary import Vocabulary
+from .codec import loads
+from .readers import iter_users, read_header, resolve_dataset
+from .shards import is_sharded, load_manifest
+from .tables import TABLES, TIMESTAMP_COLUMNS, flatten_user
+
+
+@dataclass(slots=True)
+class CohortRecord:
+    """One dataset user rehydrated into model objects"""
+
+    profile: UserProfile
+    persona: Persona
+    journey: Optional[Journey] = None
+
+
+def is_parquet_cohort(path: Union[str, Path]) -> bool:
+    """Check whether a path is a directory written by ParquetCohortWriter"""
+    path = Path(path)
+    return path.is_dir() and (path / "users.parquet").exists()
+
+
+class CohortLoader:
+    """Stream a generated dataset as typed model objects or columnar frames"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        project_path: Optional[Union[str, Path]] = None,
+        journeys: bool = True
+    ):
+        """
+        Initialize loader
+
+        Args:
+            path: Dataset file, sharded dataset directory or Parquet cohort directory
+            project_path: Project directory used to reattach PersonaConfig (and,
+                for Parquet, phase definitions); defaults to the project recorded
+                in a sharded dataset's manifest
+            journeys: Decode journeys (False skips them for persona-only consumers)
+        """
+        self.path = Path(path) if is_parquet_cohort(path) else resolve_dataset(path)
+        self.journeys = journeys
+
+        if project_path is None and is_sharded(self.path):
+            recorded = load_manifest(self.path).get("project_path")
+            if recorded and Path(recorded).exists():
+                project_path = recorded
+        self.project_path = Path(project_path) if project_path else None
+
+        self._persona_configs: Optional[Dict[str, PersonaConfig]] = None
+        self._vocabulary: Optional[Vocabulary] = None
+        self._phases: Dict[str, JourneyPhase] = {}
+
+    @property
+    def persona_configs(self) -> Dict[str, PersonaConfig]:
+        """PersonaConfig by persona type (empty without a project)"""
+        if self._persona_configs is None:
+            self._persona_configs = {}
+            if self.project_path is not None:
+                from ..utils.config_loader import ConfigLoader
+                self._persona_configs = ConfigLoader(self.project_path).load_personas()
+        return self._persona_configs
+
+    @property
+    def vocabulary(self) -> Vocabulary:
+        """Vocabulary loaded strings are interned against (the project's, or built from the data)"""
+        if self._vocabulary is None:
+            self._vocabulary = Vocabulary()
+            if self.project_path is not None:
+                from ..utils.config_loader import ConfigLoader
+                self._vocabulary = ConfigLoader(self.project_path).load_vocabulary()
+        return self._vocabulary
+
+    def __iter__(self) -> Iterator[CohortRecord]:
+        """Yield every user in dataset order"""
+        if is_parquet_cohort(self.path):
+            self._phases = self._project_phases()
+            return (self._record(user) for user in _iter_parquet_users(self.path, list(self._phases)))
+
+        header = read_header(self.path)
+        if header:
+            self._phases = {p["id"]: JourneyPhase.from_dict(p) for p in header.get("phases", [])}
+        return (self._record(user) for user in iter_users(self.path, denormalize=False))
+
+    def load(self) -> List[CohortRecord]:
+        """Load every user into a list"""
+        return list(self)
+
+    def personas(self) -> Iterator[Persona]:
+        """Yield only the personas (journeys are not decoded)"""
+        journeys, self.journeys = self.journeys, False
+        try:
+            for record in self:
+                yield record.persona
+        finally:
+            self.journeys = journeys
+
+    def _record(self, user: Dict[str, Any]) -> CohortRecord:
+        """Build model objects from one user dict"""
+        _intern_user(user, self.vocabulary, self.journeys)
+        profile = UserProfile.from_dict(user)
+        persona = Persona.from_dict(user, self.persona_configs.get(user["persona_type"]))
+        # Share one attributes dict between profile and persona
+        persona.attributes = profile.attributes
+
+        journey = None
+        journey_data = user.get("journey")
+        if self.journeys and journey_data:
+            for phase in journey_data.get("phases", ()):
+                if phase["id"] not in self._phases:
+                    self._phases[phase["id"]] = JourneyPhase.from_dict(phase)
+            journey = Journey.from_dict(journey_data, self._phases)
+        return CohortRecord(profile, persona, journey)
+
+    def _project_phases(self) -> Dict[str, JourneyPhase]:
+        """Phase definitions as JourneyGenerator builds them from the project"""
+        if self.project_path is None:
+            return {}
+        from ..utils.config_loader import ConfigLoader
+
+        phases = {}
+        for i, config in enumerate(ConfigLoader(self.project_path).load_journey_phases()):
+            phase = JourneyPhase.from_dict({**config, "id": f"phase_{i+1}", "order": i})
+            phases[phase.id] = phase
+        return phases
+
+    def frames(self) -> Dict[str, Any]:
+        """
+        Load the dataset as columnar frames (requires polars)
+
+        Returns:
+            Dictionary mapping table name (see core.dataset.tables) to a
+            polars DataFrame with native timestamp columns
+        """
+        import polars as pl
+
+        if is_parquet_cohort(self.path):
+            from .parquet import scan_cohort
+            return {table: frame.collect() for table, frame in scan_cohort(self.path).items()}
+
+        columns: Dict[str, Dict[str, List[Any]]] = {table: {} for table in TABLES}
+        for user in iter_users(self.path, denormalize=False):
+            for table, row in flatten_user(user):
+                table_columns = columns[table]
+                if not table_columns:
+                    table_columns.update((name, []) for name in row)
+                for name, value in row.items():
+                    table_columns[name].append(value)
+
+        frames = {}
+        for table, data in columns.items():
+            if not data:
+                continue
+            frame = pl.DataFrame(data, strict=False)
+            frames[table] = frame.with_columns(
+                pl.col(column).cast(pl.String).str.to_datetime(time_unit="us")
+                for column in TIMESTAMP_COLUMNS[table]
+            )
+        return frames
+
+    def __repr__(self) -> str:
+        return f"CohortLoader(path={self.path}, project={self.project_path})"
+
+
+def load_cohort(
+    path: Union[str, Path],
+    project_path: Optional[Union[str, Path]] = None,
+    journeys: bool = True
+) -> List[CohortRecord]:
+    """
+    Load a dataset as typed records (see CohortLoader)
+
+    Args:
+        path: Dataset file or directory
+        project_path: Project directory used to reattach PersonaConfig
+        journeys: Decode journeys
+
+    Returns:
+        CohortRecord per user in dataset order
+    """
+    return CohortLoader(path, project_path, journeys).load()
+
+
+def _intern_user(user: Dict[str, Any], vocabulary: Vocabulary, journeys: bool = True) -> None:
+    """Replace the categorical strings of a user dict with the vocabulary's instances"""
+    intern = vocabulary.intern
+    for field in ("persona_type", "gender", "education"):
+        if user.get(field) is not None:
+            user[field] = intern(field, user[field])
+
+    attributes = user.get("attributes")
+    if attributes:
+        for field in ("engagement_tier", "capture_behavior"):
+            if attributes.get(field) is not None:
+                attributes[field] = intern(field, attributes[field])
+
+    journey = user.get("journey")
+    if not (journeys and journey):
+        return
+    journey["persona_type"] = intern("persona_type", journey["persona_type"])
+    phase_id = vocabulary["phase_id"].intern
+    emotional_state = vocabulary["emotional_state"].intern
+    action = vocabulary["action"].intern
+    for step in journey.get("steps", ()):
+        step["phase_id"] = phase_id(step["phase_id"])
+        step["emotional_state"] = emotional_state(step["emotional_state"])
+        step["actions"] = [action(name) for name in step.get("actions", ())]
+
+
+class _GroupCursor:
+    """Walk rows that are contiguous by a key column, in file order"""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]], key: str):
+        self._groups = groupby(rows, itemgetter(key))
+        self._current = next(self._groups, None)
+
+    def take(self, value: Any) -> List[Dict[str, Any]]:
+        """Rows of the group with this key (empty if the next group differs)"""
+        if self._current is None or self._current[0] != value:
+            return []
+        rows = list(self._current[1])
+        self._current = next(self._groups, None)
+        return rows
+
+
+def _parquet_rows(path: Path, table: str) -> Iterator[Dict[str, Any]]:
+    """Stream the rows of one cohort table in record batches"""
+    import pyarrow.parquet as pq
+
+    file = path / f"{table}.parquet"
+    if not file.exists():
+        return
+    for batch in pq.ParquetFile(file).iter_batches():
+        yield from batch.to_pylist()
+
+
+def _iter_parquet_users(path: Path, phase_ids: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Reassemble user dicts (UserProfile.to_dict() shape) from a Parquet cohort
+
+    ParquetCohortWriter writes every table in user order, so journeys, steps
+    and SSR responses are merged with a single forward pass over each file.
+    Timestamps stay datetimes; narrative responses are not exported.
+    """
+    journeys = _GroupCursor(_parquet_rows(path, "journeys"), "user_id")
+    steps = _GroupCursor(_parquet_rows(path, "steps"), "journey_id")
+    responses = _GroupCursor(_parquet_rows(path, "ssr_responses"), "step_id")
+
+    for user in _parquet_rows(path, "users"):
+        del user["engagement_tier"], user["capture_behavior"]
+        user["attributes"] = loads(user["attributes"])
+        user["metadata"] = loads(user["metadata"])
+
+        for journey in journeys.take(user["id"]):
+            del journey["n_steps"]
+            journey["phase_ids"] = phase_ids
+            journey["steps"] = journey_steps = []
+            for step in steps.take(journey["id"]):
+                step["data_captured"] = loads(step["data_captured"])
+                step["ssr_responses"] = {
+                    response["scale_id"]: {
+                        "pmf": response["pmf"],
+                        "expected_value": response["expected_value"],
+                        "most_likely_rating": response["most_likely_rating"],
+                        "text_response": response["text_response"],
+                    }
+                    for response in responses.take(step["id"])
+                }
+                journey_steps.append(step)
+            user["journey"] = journey
+        yield user
@@ -0,0 +1,94 @@
+"""
+Normalized dataset layout.
+
+Legacy datasets embed the full phase definitions (objectives,
+data_to_collect, ...) in every user's journey. Normalized datasets write
+them once in a header block and journeys reference phases by id:
+
+    JSONL:  first line {"_header": {...}}, then one user per line
+    JSON:   {"_header": {...}, "users": [...]}
+
+    journey: {..., "phase_ids": ["phase_1", "phase_2", ...], "steps": [...]}
+
+denormalize_user() restores the legacy shape for consumers that expect
+journey["phases"]; readers build the phase_index() of a header once and
+pass it for every user.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .writers import HEADER_KEY
+
+
+NORMALIZED_FORMAT = "synth.normalized"
+NORMALIZED_VERSION = 1
+
+
+def build_header(
+    project_config: Dict[str, Any],
+    phases: List[Dict[str, Any]],
+    journey_type: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the header block for a normalized dataset
+
+    Args:
+        project_config: Parsed project config.yaml
+        phases: Phase dictionaries (JourneyPhase.to_dict())
+        journey_type: Journey type value shared by all journeys
+
+    Returns:
+        Header dictionary
+    """
+    return {
+        "format": NORMALIZED_FORMAT,
+        "version": NORMALIZED_VERSION,
+        "project": project_config,
+        "journey_type": journey_type,
+        "phases": phases
+    }
+
+
+def is_header_record(record: Dict[str, Any]) -> bool:
+    """Check whether a JSONL record is the dataset header line"""
+    return HEADER_KEY in record
+
+
+def phase_index(header: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Phase definitions of a dataset header by id"""
+    return {phase["id"]: phase for phase in header.get("phases", [])}
+
+
+def denormalize_user(
+    user: Dict[str, Any],
+    header: Dict[str, Any],
+    phases_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Expand phase references in a user's journey back to full phase dicts
+
+    Each journey gets its own copies of the phase dicts, as in the legacy
+    layout, so editing one user's phases leaves the header and every
+    other user unchanged.
+
+    Args:
+        user: User dict from a normalized dataset (modified in place)
+        header: Dataset header
+        phases_by_id: phase_index(header), when denormalizing many users
+
+    Returns:
+        The same user dict in the legacy layout
+    """
+    journey = user.get("journey")
+    if not journey or "phase_ids" not in journey:
+        return user
+
+    if phases_by_id is None:
+        phases_by_id = phase_index(header)
+    journey["phases"] = [_copy_phase(phases_by_id[phase_id]) for phase_id in journey.pop("phase_ids")]
+    return user
+
+
+def _copy_phase(phase: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a phase dict (values are strings, numbers and lists of strings)"""
+    return {key: list(value) if isinstance(value, list) else value for key, value in phase.items()}
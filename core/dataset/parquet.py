@@ -0,0 +1,288 @@
+"""
+Columnar Parquet export of generated cohorts.
+
+A cohort is normalized into four Parquet files in one directory:
+
+- users.parquet          one row per user
+- journeys.parquet       one row per journey
+- steps.parquet          one row per JourneyStep
+- ssr_responses.parquet  one row per step x scale, PMF as a fixed-size list
+
+Low-cardinality string columns (persona_type, phase_id, emotional_state, ...)
+are dictionary-encoded: the vocabulary fields of core.models.vocabulary are
+buffered as integer codes and written as dictionary indices against the
+vocabulary's values, the rest are encoded by Arrow. Files are
+zstd-compressed, and rows are buffered and written as row groups while
+generation is still running.
+
+Requires pyarrow; scan_cohort() additionally requires polars.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from ..models.journey import Journey
+from ..models.user_profile import UserProfile
+from ..models.vocabulary import Vocabulary
+from ..utils import profiling
+from .tables import TABLES, TIMESTAMP_COLUMNS, flatten_user
+from .writers import user_record
+
+
+PMF_POINTS = 5
+
+# Columns holding vocabulary codes while buffered: table -> column -> field
+CATEGORY_COLUMNS = {
+    "users": {
+        "persona_type": "persona_type",
+        "gender": "gender",
+        "education": "education",
+        "engagement_tier": "engagement_tier",
+        "capture_behavior": "capture_behavior",
+    },
+    "journeys": {"persona_type": "persona_type"},
+    "steps": {
+        "persona_type": "persona_type",
+        "phase_id": "phase_id",
+        "actions": "action",  # list of codes
+        "emotional_state": "emotional_state",
+        "completion_status": "completion_status",
+    },
+    "ssr_responses": {"persona_type": "persona_type", "phase_id": "phase_id"},
+}
+
+
+def _schemas():
+    """Arrow schemas for the cohort tables (built lazily so pyarrow is optional)"""
+    import pyarrow as pa
+
+    category = pa.dictionary(pa.int32(), pa.string())
+    timestamp = pa.timestamp("us")
+
+    return {
+        "users": pa.schema([
+            ("id", pa.string()),
+            ("persona_type", category),
+            ("created_at", timestamp),
+            ("name", pa.string()),
+            ("age", pa.int32()),
+            ("gender", category),
+            ("education", category),
+            ("location", pa.string()),
+            ("engagement_level", pa.float64()),
+            ("action_tendency", pa.float64()),
+            ("anxiety_level", pa.float64()),
+            ("engagement_tier", category),
+            ("capture_behavior", category),
+            ("attributes", pa.string()),  # JSON: keys vary by persona type
+            ("journey_id", pa.string()),
+            ("metadata", pa.string()),
+        ]),
+        "journeys": pa.schema([
+            ("id", pa.string()),
+            ("user_id", pa.string()),
+            ("persona_type", category),
+            ("journey_type", category),
+            ("current_phase", pa.int32()),
+            ("overall_completion", pa.float64()),
+            ("started_at", timestamp),
+            ("last_activity", timestamp),
+            ("completed_at", timestamp),
+            ("n_steps", pa.int32()),
+        ]),
+        "steps": pa.schema([
+            ("id", pa.string()),
+            ("journey_id", pa.string()),
+            ("user_id", pa.string()),
+            ("persona_type", category),
+            ("phase_id", category),
+            ("step_number", pa.int32()),
+            ("timestamp", timestamp),
+            ("actions", pa.list_(category)),
+            ("emotional_state", category),
+            ("completion_status", category),
+            ("data_captured", pa.string()),  # JSON
+            ("time_invested", pa.int32()),
+            ("engagement_score", pa.float64()),
+        ]),
+        "ssr_responses": pa.schema([
+            ("step_id", pa.string()),
+            ("journey_id", pa.string()),
+            ("user_id", pa.string()),
+            ("persona_type", category),
+            ("phase_id", category),
+            ("scale_id", category),
+            ("pmf", pa.list_(pa.float64(), PMF_POINTS)),
+            ("expected_value", pa.float64()),
+            ("most_likely_rating", pa.int8()),
+            ("text_response", pa.string()),
+        ]),
+    }
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an isoformat timestamp from a model dict"""
+    return datetime.fromisoformat(value) if value else None
+
+
+class ParquetCohortWriter:
+    """Stream user dicts (user + nested journey) into normalized Parquet tables"""
+
+    TABLES = TABLES
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_every: int = 100,
+        row_group_size: int = 65536,
+        compression: str = "zstd",
+        compression_level: Optional[int] = None,
+        vocabulary: Optional[Vocabulary] = None
+    ):
+        """
+        Initialize writer
+
+        Args:
+            path: Output directory (created if missing)
+            flush_every: Accepted for writer-interface compatibility; rows are
+                flushed per row group instead
+            row_group_size: Rows buffered per table before a row group is written
+            compression: Parquet compression codec
+            compression_level: Codec level (None = codec default)
+            vocabulary: Project vocabulary for categorical codes (see
+                ConfigLoader.load_vocabulary; values are added on first sight
+                without one)
+        """
+        import pyarrow.parquet as pq
+
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = row_group_size
+        self.vocabulary = vocabulary or Vocabulary()
+        self.rows_written = 0
+
+        self._schemas = _schemas()
+        self._buffers: Dict[str, Dict[str, List[Any]]] = {
+            table: {name: [] for name in self._schemas[table].names}
+            for table in self.TABLES
+        }
+        self._writers = {
+            table: pq.ParquetWriter(
+                self.path / f"{table}.parquet",
+                self._schemas[table],
+                compression=compression,
+                compression_level=compression_level,
+                use_dictionary=True
+            )
+            for table in self.TABLES
+        }
+        self._closed = False
+
+    def write(self, user_data: Dict[str, Any]) -> None:
+        """
+        Write one user and its journey
+
+        Args:
+            user_data: UserProfile.to_dict() with the journey dict under "journey"
+        """
+        vocabulary = self.vocabulary
+        with profiling.stage("write.encode"):
+            for table, row in flatten_user(user_data):
+                for column in TIMESTAMP_COLUMNS[table]:
+                    row[column] = _timestamp(row[column])
+                for column, field in CATEGORY_COLUMNS[table].items():
+                    value = row[column]
+                    if column == "actions":
+                        encode = vocabulary[field].encode
+                        row[column] = [encode(action) for action in value]
+                    elif value is not None:
+                        row[column] = vocabulary.encode(field, value)
+                self._append(table, row)
+
+        self.rows_written += 1
+
+    def write_user(self, user: UserProfile, journey: Optional[Journey] = None, include_phases: bool = True) -> None:
+        """Write a user from model objects (phases are not stored in the tables)"""
+        with profiling.stage("write.encode"):
+            record = user_record(user, journey, include_phases=False)
+        self.write(record)
+
+    def _append(self, table: str, row: Dict[str, Any]) -> None:
+        """Buffer a row and write a row group when the buffer is full"""
+        buffer = self._buffers[table]
+        for name, column in buffer.items():
+            column.append(row[name])
+        if len(next(iter(buffer.values()))) >= self.row_group_size:
+            self._flush_table(table)
+
+    def _flush_table(self, table: str) -> None:
+        """Write buffered rows of a table as one row group"""
+        import pyarrow as pa
+
+        buffer = self._buffers[table]
+        if not next(iter(buffer.values())):
+            return
+
+        with profiling.stage("write.io"):
+            columns = dict(buffer)
+            for column, field in CATEGORY_COLUMNS[table].items():
+                columns[column] = self._decode_column(buffer[column], field, list_column=column == "actions")
+            batch = pa.Table.from_pydict(columns, schema=self._schemas[table])
+            self._writers[table].write_table(batch, row_group_size=self.row_group_size)
+        for column in buffer.values():
+            column.clear()
+
+    def _decode_column(self, codes: List[Any], field: str, list_column: bool = False):
+        """Dictionary array of buffered codes against the vocabulary's values"""
+        import pyarrow as pa
+
+        dictionary = pa.array(self.vocabulary[field].values, pa.string())
+        if not list_column:
+            return pa.DictionaryArray.from_arrays(pa.array(codes, pa.int32()), dictionary)
+
+        offsets = [0]
+        for entry in codes:
+            offsets.append(offsets[-1] + len(entry))
+        flat = pa.array([code for entry in codes for code in entry], pa.int32())
+        return pa.ListArray.from_arrays(
+            pa.array(offsets, pa.int32()), pa.DictionaryArray.from_arrays(flat, dictionary)
+        )
+
+    def close(self) -> None:
+        """Write remaining rows and finalize the Parquet files"""
+        if self._closed:
+            return
+        for table in self.TABLES:
+            self._flush_table(table)
+            self._writers[table].close()
+        self._closed = True
+
+    def __enter__(self) -> "ParquetCohortWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ParquetCohortWriter(path={self.path}, rows={self.rows_written})"
+
+
+def scan_cohort(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Lazily scan an exported cohort for columnar analysis
+
+    Args:
+        path: Directory written by ParquetCohortWriter
+
+    Returns:
+        Dictionary mapping table name to a polars LazyFrame
+    """
+    import polars as pl
+
+    path = Path(path)
+    return {
+        table: pl.scan_parquet(path / f"{table}.parquet")
+        for table in ParquetCohortWriter.TABLES
+        if (path / f"{table}.parquet").exists()
+    }
@@ -0,0 +1,196 @@
+"""Readers for generated user datasets (legacy and normalized, JSON and JSONL, single-file and sharded)"""
+
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from .codec import loads
+from .compression import data_suffix, open_text, resolve_path
+from .normalized import denormalize_user, phase_index
+from .shards import is_sharded, iter_sharded_users, map_shards, shard_paths
+from .writers import HEADER_KEY
+
+
+def resolve_dataset(path: Union[str, Path]) -> Path:
+    """
+    Find a dataset by the path scripts refer to it with
+
+    Falls back to a .zst/.gz variant of the file, then to the JSONL
+    dataset of the same name (users.json -> users.jsonl, also compressed),
+    then to a sharded dataset directory (users.json -> users/manifest.json).
+
+    Args:
+        path: Dataset path
+
+    Returns:
+        Existing dataset file or directory (the original path if none exists)
+    """
+    path = resolve_path(path)
+    if not path.exists():
+        if path.suffix == ".json":
+            jsonl = resolve_path(path.with_suffix(".jsonl"))
+            if jsonl.exists():
+                return jsonl
+        directory = path.with_suffix("")
+        if is_sharded(directory):
+            return directory
+    return path
+
+
+def _is_jsonl(path: Path) -> bool:
+    """JSONL datasets are identified by extension (ignoring .gz/.zst)"""
+    return data_suffix(path) == ".jsonl"
+
+
+def read_header(path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read the header block of a normalized dataset
+
+    Args:
+        path: Dataset file
+
+    Returns:
+        Header dictionary, or None for legacy datasets
+    """
+    path = resolve_dataset(path)
+    if is_sharded(path):
+        # Every shard of a normalized dataset carries the same header
+        return read_header(shard_paths(path)[0])
+    if _is_jsonl(path):
+        with open_text(path) as f:
+            first_line = f.readline()
+        if not first_line.strip():
+            return None
+        return loads(first_line).get(HEADER_KEY)
+
+    with open_text(path) as f:
+        data = loads(f.read())
+    return data.get(HEADER_KEY) if isinstance(data, dict) else None
+
+
+def iter_users(path: Union[str, Path], denormalize: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over users in a dataset
+
+    JSONL files are streamed line by line; JSON files are loaded whole;
+    sharded datasets are read shard by shard. See resolve_dataset() for
+    the fallbacks applied to missing paths.
+
+    Args:
+        path: Dataset file (.json or .jsonl, optionally .gz/.zst compressed,
+            legacy or normalized) or sharded dataset directory
+        denormalize: Expand phase references into full phase dicts for
+            consumers expecting the legacy layout
+
+    Yields:
+        User dictionaries (with nested journey)
+    """
+    path = resolve_dataset(path)
+    if is_sharded(path):
+        yield from iter_sharded_users(path, denormalize)
+        return
+
+    if _is_jsonl(path):
+        header = phases_by_id = None
+        with open_text(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = loads(line)
+                if HEADER_KEY in record:
+                    header = record[HEADER_KEY]
+                    phases_by_id = phase_index(header)
+                    continue
+                yield denormalize_user(record, header, phases_by_id) if denormalize and header else record
+        return
+
+    with open_text(path) as f:
+        data = loads(f.read())
+
+    if isinstance(data, list):
+        yield from data
+        return
+
+    header = data.get(HEADER_KEY)
+    phases_by_id = phase_index(header) if header else None
+    for user in data.get("users", []):
+        yield denormalize_user(user, header, phases_by_id) if denormalize and header else user
+
+
+def load_users(
+    path: Union[str, Path],
+    denormalize: bool = True,
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load every user of a dataset into a list (legacy json.load replacement)
+
+    Args:
+        path: Dataset file or sharded dataset directory
+        denormalize: Expand phase references of normalized datasets
+        workers: Processes used to parse the shards of a sharded dataset in
+            parallel (None = one per CPU, 1 = sequential)
+
+    Returns:
+        User dictionaries in dataset order
+    """
+    path = resolve_dataset(path)
+    if is_sharded(path) and workers != 1:
+        shards = map_shards(path, partial(_load_file, denormalize=denormalize), workers)
+        return [user for shard in shards for user in shard]
+    return list(iter_users(path, denormalize))
+
+
+def _load_file(path: Path, denormalize: bool = True) -> List[Dict[str, Any]]:
+    """Load one dataset file (module-level so shard workers can unpickle it)"""
+    return list(iter_users(path, denormalize))
+
+
+def select_users(
+    path: Union[str, Path],
+    persona_type: Optional[str] = None,
+    limit: Optional[int] = None,
+    denormalize: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Select a few users without loading the whole dataset where possible
+
+    Uncompressed JSONL with an offset index is read through a memory map
+    (only the selected rows are parsed); other JSONL is streamed until
+    `limit` matches are found; JSON arrays are loaded whole.
+
+    Args:
+        path: Dataset file
+        persona_type: Only users of this persona type (None = any)
+        limit: Maximum number of users (None = all matches)
+        denormalize: Expand phase references of normalized datasets
+
+    Returns:
+        Matching user dictionaries in file order
+    """
+    from .index import IndexedDataset, index_path
+
+    path = resolve_dataset(path)
+    if is_sharded(path):
+        selected = []
+        for shard_file in shard_paths(path):
+            remaining = None if limit is None else limit - len(selected)
+            if remaining == 0:
+                break
+            selected.extend(select_users(shard_file, persona_type, remaining, denormalize))
+        return selected
+
+    if _is_jsonl(path) and index_path(path).exists():
+        with IndexedDataset(path, denormalize=denormalize, build=False) as dataset:
+            if persona_type is not None:
+                return list(dataset.iter_persona(persona_type, limit))
+            rows = range(len(dataset) if limit is None else min(limit, len(dataset)))
+            return [dataset[row] for row in rows]
+
+    selected = []
+    for user in iter_users(path, denormalize):
+        if limit is not None and len(selected) >= limit:
+            break
+        if persona_type is None or user.get("persona_type") == persona_type:
+            selected.append(user)
+    return selected
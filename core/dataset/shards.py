@@ -0,0 +1,480 @@
+"""
+Sharded dataset output with a manifest.
+
+A sharded dataset is a directory:
+
+    <name>/manifest.json
+    <name>/shard-00000.jsonl.zst
+    <name>/shard-00001.jsonl.zst
+    ...
+
+Each shard is generated independently (in parallel worker processes) from
+its own user range, seed and persona counts. manifest.json records these
+together with per-shard row counts and SHA-256 checksums, the project
+config hash and the generator version, so consumers can process shards in
+parallel and a corrupt or missing shard can be verified and regenerated on
+its own. Datasets generated with SSR ratings keep each shard's survey
+statistics in a sidecar next to it (shard-00000.jsonl.zst.survey.json, see
+core.dataset.summary.read_survey).
+"""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import as_completed
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, Union
+
+from ..utils.config_loader import config_hash
+from .compression import compression_for
+from .normalized import build_header
+from .summary import DatasetSummary, save_survey, survey_path
+from .writers import open_writer
+
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_FORMAT = "synth.sharded"
+MANIFEST_VERSION = 1
+
+T = TypeVar("T")
+
+
+@dataclass
+class ShardSpec:
+    """Everything needed to (re)generate one shard"""
+
+    index: int
+    file: str
+    start: int  # index of the shard's first user in the cohort
+    count: int
+    seed: int
+    persona_counts: Dict[str, int]
+    engagement_tiers: Optional[Dict[str, int]] = None  # exact tier counts (None = drawn per user)
+
+
+def file_checksum(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def plan_shards(
+    persona_counts: Dict[str, int],
+    shards: int,
+    seed: int,
+    suffix: str = ".jsonl"
+) -> List[ShardSpec]:
+    """
+    Split a cohort's persona counts into shards of near-equal size
+
+    Args:
+        persona_counts: Users per persona type for the whole cohort
+        shards: Number of shards
+        seed: Base seed; per-shard seeds are drawn from it
+        suffix: Shard file suffix (e.g. ".jsonl.zst")
+
+    Returns:
+        Shard specifications in user order
+    """
+    if shards < 1:
+        raise ValueError(f"Need at least one shard, got {shards}")
+
+    allocations: List[Dict[str, int]] = [{} for _ in range(shards)]
+    offset = 0
+    for persona_type, total in sorted(persona_counts.items()):
+        base, extra = divmod(total, shards)
+        for i in range(shards):
+            # Rotate remainders so shard totals stay within one user of each other
+            share = base + (1 if (i - offset) % shards < extra else 0)
+            if share:
+                allocations[i][persona_type] = share
+        offset = (offset + extra) % shards
+
+    seeds = random.Random(seed)
+    specs = []
+    start = 0
+    for i, allocation in enumerate(allocations):
+        count = sum(allocation.values())
+        specs.append(ShardSpec(
+            index=i,
+            file=f"shard-{i:05d}{suffix}",
+            start=start,
+            count=count,
+            seed=seeds.getrandbits(32),
+            persona_counts=allocation
+        ))
+        start += count
+    return specs
+
+
+def write_shard(
+    project_path: Union[str, Path],
+    spec: ShardSpec,
+    output_dir: Union[str, Path],
+    output_format: str = "jsonl",
+    normalized: bool = False,
+    snapshot_dir: Optional[Union[str, Path]] = None,
+    ssr: bool = False,
+    ssr_backend: str = "torch"
+) -> Dict[str, Any]:
+    """
+    Generate one shard (runs in a worker process)
+
+    Args:
+        project_path: Project directory
+        spec: Shard to generate
+        output_dir: Dataset directory
+        output_format: "json" or "jsonl"
+        normalized: Write phase definitions once in a shard header
+        snapshot_dir: Configuration snapshot directory (None parses YAML)
+        ssr: Rate every step with SSR and save the shard's survey statistics
+        ssr_backend: Embedding backend for SSR ratings ("torch" or "onnx")
+
+    Returns:
+        Manifest entry for the shard
+    """
+    # Imported here so reading sharded datasets does not load the generators
+    from ..generators.cohort_generator import CohortGenerator
+    from ..generators.ssr_aggregator import SurveyAggregator
+
+    survey = SurveyAggregator() if ssr else None
+    cohort = CohortGenerator(
+        project_path, snapshot_dir=snapshot_dir, enable_ssr=ssr, ssr_aggregator=survey, ssr_backend=ssr_backend
+    )
+    header = None
+    if normalized:
+        phases = [phase.to_dict() for phase in cohort.journey_gen.phases]
+        header = build_header(cohort.config, phases, cohort.journey_type.value)
+
+    path = Path(output_dir) / spec.file
+    index = output_format == "jsonl" and not compression_for(path)
+    summary = DatasetSummary()
+    with open_writer(path, output_format, flush_every=0, header=header, index=index) as writer:
+        users = cohort.iter_models(
+            spec.count, spec.persona_counts, spec.start, spec.seed,
+            engagement_tier_counts=spec.engagement_tiers
+        )
+        for user, journey in users:
+            writer.write_user(user, journey, include_phases=not normalized)
+            summary.add_profile(user)
+    if survey is not None:
+        save_survey(survey, path)
+
+    return {
+        **asdict(spec),
+        "engagement_tier_counts": dict(summary.engagement_tier_counts),
+        "rows": writer.rows_written,
+        "bytes": path.stat().st_size,
+        "sha256": file_checksum(path),
+    }
+
+
+def manifest_path(path: Union[str, Path]) -> Path:
+    """Manifest of a sharded dataset given its directory or manifest file"""
+    path = Path(path)
+    return path if path.name == MANIFEST_NAME else path / MANIFEST_NAME
+
+
+def is_sharded(path: Union[str, Path]) -> bool:
+    """Check whether a path is a sharded dataset (directory or manifest)"""
+    return manifest_path(path).exists()
+
+
+def load_manifest(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read the manifest of a sharded dataset"""
+    with open(manifest_path(path)) as f:
+        manifest = json.load(f)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        raise ValueError(f"{manifest_path(path)} is not a sharded dataset manifest")
+    return manifest
+
+
+def save_manifest(path: Union[str, Path], manifest: Dict[str, Any]) -> Path:
+    """Write a manifest atomically (readers never see a partial file)"""
+    target = manifest_path(path)
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp, target)
+    return target
+
+
+def shard_paths(path: Union[str, Path]) -> List[Path]:
+    """Shard files of a sharded dataset in user order"""
+    directory = manifest_path(path).parent
+    return [directory / shard["file"] for shard in load_manifest(path)["shards"]]
+
+
+def write_sharded_dataset(
+    project_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    count: int,
+    shards: int,
+    workers: Optional[int] = None,
+    output_format: str = "jsonl",
+    compress: Optional[str] = None,
+    seed: Optional[int] = None,
+    normalized: bool = False,
+    on_shard: Optional[Callable[[Dict[str, Any]], None]] = None,
+    snapshot_dir: Optional[Union[str, Path]] = None,
+    ssr: bool = False,
+    ssr_backend: str = "torch"
+) -> Dict[str, Any]:
+    """
+    Generate a cohort as parallel shards plus manifest.json
+
+    Args:
+        project_path: Project directory
+        output_dir: Dataset directory (created if missing)
+        count: Total number of users
+        shards: Number of shards
+        workers: Worker processes (None = one per CPU)
+        output_format: "json" or "jsonl"
+        compress: None, "gzip" or "zstd"
+        seed: Base seed (None = random, recorded in the manifest)
+        normalized: Write phase definitions once per shard header
+        on_shard: Called with each manifest entry as its shard finishes
+        snapshot_dir: Configuration snapshot directory shared with the workers
+            (default: a temporary one removed when the run finishes)
+        ssr: Rate every step with SSR; each shard saves its survey statistics
+        ssr_backend: Embedding backend for SSR ratings ("torch" or "onnx"),
+            recorded in the manifest for regenerated and appended shards
+
+    Returns:
+        The written manifest
+    """
+    # Imported here so reading sharded datasets does not load the generators
+    from ..generators.cohort_generator import CohortGenerator
+    from ..generators.embedding_registry import FORK_WORKERS, shared_registry
+    from .. import __version__
+
+    if output_format not in ("json", "jsonl"):
+        raise ValueError(f"Sharded output supports json/jsonl, not {output_format}")
+
+    project_path = Path(project_path)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    suffix = f".{output_format}" + {None: "", "gzip": ".gz", "zstd": ".zst"}[compress]
+
+    with tempfile.TemporaryDirectory(prefix="synth-config-") as scratch:
+        # Workers load the snapshot the parent writes here instead of each parsing YAML
+        snapshot_dir = scratch if snapshot_dir is None else snapshot_dir
+        # Forked workers inherit the SSR model loaded here (through shared_registry)
+        # copy-on-write instead of each loading their own
+        cohort = CohortGenerator(
+            project_path, snapshot_dir=snapshot_dir, enable_ssr=ssr and FORK_WORKERS, ssr_backend=ssr_backend
+        )
+        specs = plan_shards(cohort.persona_gen.persona_counts(count), shards, seed, suffix)
+
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(specs)
+        with shared_registry.fork_executor(workers) as pool:
+            futures = {
+                pool.submit(
+                    write_shard, project_path, spec, output_dir, output_format, normalized, snapshot_dir, ssr,
+                    ssr_backend
+                ): spec.index
+                for spec in specs
+            }
+            for future in as_completed(futures):
+                entry = future.result()
+                entries[futures[future]] = entry
+                if on_shard:
+                    on_shard(entry)
+
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "version": MANIFEST_VERSION,
+        "project": project_path.name,
+        "project_path": str(project_path),
+        "config_hash": config_hash(project_path),
+        "generator_version": __version__,
+        "created_at": datetime.now().isoformat(),
+        "seed": seed,
+        "output_format": output_format,
+        "normalized": normalized,
+        "ssr": ssr,
+        "ssr_backend": ssr_backend,
+        "shards": entries,
+    }
+    save_manifest(output_dir, _update_totals(manifest))
+    return manifest
+
+
+def _update_totals(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute dataset-level row, persona and engagement-tier counts from the shard entries"""
+    summary = DatasetSummary()
+    for shard in manifest["shards"]:
+        summary.persona_counts.update(shard["persona_counts"])
+        summary.engagement_tier_counts.update(shard.get("engagement_tier_counts", {}))
+    manifest["total_rows"] = sum(shard["rows"] for shard in manifest["shards"])
+    manifest["persona_counts"] = dict(sorted(summary.persona_counts.items()))
+    manifest["engagement_tier_counts"] = dict(sorted(summary.engagement_tier_counts.items()))
+    return manifest
+
+
+def _check_config(manifest: Dict[str, Any], project_path: Path, force: bool) -> None:
+    """Refuse to add users generated from a different project config"""
+    if not force and config_hash(project_path) != manifest["config_hash"]:
+        raise ValueError(
+            f"Config of {project_path} changed since the dataset was generated; "
+            "new users would mix configurations (use force=True to override)"
+        )
+
+
+def verify_shards(path: Union[str, Path]) -> List[int]:
+    """
+    Check every shard against its manifest entry
+
+    Args:
+        path: Dataset directory or manifest
+
+    Returns:
+        Indexes of shards that are missing, whose size/checksum differ or
+        (SSR datasets) whose survey sidecar is missing
+    """
+    directory = manifest_path(path).parent
+    manifest = load_manifest(path)
+    bad = []
+    for shard in manifest["shards"]:
+        shard_file = directory / shard["file"]
+        if (
+            not shard_file.exists()
+            or shard_file.stat().st_size != shard["bytes"]
+            or file_checksum(shard_file) != shard["sha256"]
+            or (manifest.get("ssr") and not survey_path(shard_file).exists())
+        ):
+            bad.append(shard["index"])
+    return bad
+
+
+def regenerate_shard(
+    path: Union[str, Path],
+    index: int,
+    project_path: Optional[Union[str, Path]] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Regenerate one shard from its manifest entry and update the manifest
+
+    The shard gets the same user range, persona counts and seed (so persona
+    attributes and journey structure are reproduced); user ids and
+    timestamps are fresh, so the checksum is recomputed.
+
+    Args:
+        path: Dataset directory or manifest
+        index: Shard index
+        project_path: Project directory (default: the one recorded in the manifest)
+        force: Regenerate even if the project config changed since generation
+
+    Returns:
+        The updated manifest entry
+    """
+    manifest = load_manifest(path)
+    project_path = Path(project_path or manifest["project_path"])
+    _check_config(manifest, project_path, force)
+
+    shard = manifest["shards"][index]
+    spec = ShardSpec(**{field: shard[field] for field in ShardSpec.__dataclass_fields__ if field in shard})
+    entry = write_shard(
+        project_path, spec, manifest_path(path).parent, manifest["output_format"], manifest["normalized"],
+        ssr=manifest.get("ssr", False), ssr_backend=manifest.get("ssr_backend", "torch")
+    )
+
+    manifest["shards"][index] = entry
+    save_manifest(path, _update_totals(manifest))
+    return entry
+
+
+def append_shard(
+    path: Union[str, Path],
+    persona_counts: Dict[str, int],
+    engagement_tier_counts: Optional[Dict[str, int]] = None,
+    project_path: Optional[Union[str, Path]] = None,
+    force: bool = False
+) -> Dict[str, Any]:
+    """
+    Add users to a sharded dataset as one new shard
+
+    Args:
+        path: Dataset directory or manifest
+        persona_counts: New users per persona type
+        engagement_tier_counts: New users per engagement tier (None = drawn per user)
+        project_path: Project directory (default: the one recorded in the manifest)
+        force: Append even if the project config changed since generation
+
+    Returns:
+        Manifest entry of the new shard
+    """
+    manifest = load_manifest(path)
+    project_path = Path(project_path or manifest["project_path"])
+    _check_config(manifest, project_path, force)
+
+    index = len(manifest["shards"])
+    first_file = manifest["shards"][0]["file"]
+    spec = ShardSpec(
+        index=index,
+        file=f"shard-{index:05d}{first_file[first_file.index('.'):]}",
+        start=manifest["total_rows"],
+        count=sum(persona_counts.values()),
+        seed=random.Random(manifest["seed"] + index).getrandbits(32),
+        persona_counts={key: value for key, value in persona_counts.items() if value},
+        engagement_tiers=engagement_tier_counts
+    )
+    entry = write_shard(
+        project_path, spec, manifest_path(path).parent, manifest["output_format"], manifest["normalized"],
+        ssr=manifest.get("ssr", False), ssr_backend=manifest.get("ssr_backend", "torch")
+    )
+
+    manifest["shards"].append(entry)
+    save_manifest(path, _update_totals(manifest))
+    return entry
+
+
+def iter_sharded_users(path: Union[str, Path], denormalize: bool = True) -> Iterator[Dict[str, Any]]:
+    """Iterate over the users of every shard in order"""
+    from .readers import iter_users
+
+    for shard_file in shard_paths(path):
+        yield from iter_users(shard_file, denormalize)
+
+
+def map_shards(
+    path: Union[str, Path],
+    fn: Callable[[Path], T],
+    workers: Optional[int] = None
+) -> List[T]:
+    """
+    Apply a function to every shard in parallel worker processes
+
+    Typical use is map-reduce over a large cohort: `fn` reads one shard
+    (e.g. with iter_users) and returns a small partial result.
+
+    Args:
+        path: Sharded dataset, or a single dataset file (fn is then called once)
+        fn: Picklable (module-level) function taking a shard path
+        workers: Worker processes (None = one per CPU)
+
+    Returns:
+        Results in shard order
+    """
+    from ..generators.embedding_registry import shared_registry
+    from .readers import resolve_dataset
+
+    path = resolve_dataset(path)
+    if not is_sharded(path):
+        return [fn(path)]
+
+    paths = shard_paths(path)
+    # Workers are forked where possible, so models loaded by the caller are shared
+    with shared_registry.fork_executor(workers) as pool:
+        return list(pool.map(fn, paths))
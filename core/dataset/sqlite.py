@@ -0,0 +1,248 @@
+"""
+SQLite database seeding from generated cohorts.
+
+Users are flattened into the same four tables as the Parquet export
+(users, journeys, steps, ssr_responses). Loading is tuned for bulk seeding:
+
+- WAL journal, synchronous=NORMAL, large page cache
+- rows buffered per table and inserted with executemany
+- one transaction per `commit_every` users
+- secondary indexes created after the load (one sort instead of
+  per-row B-tree maintenance), followed by ANALYZE
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..models.journey import Journey
+from ..models.user_profile import UserProfile
+from ..utils import profiling
+from .tables import TABLES, flatten_user
+from .writers import user_record
+
+
+PMF_POINTS = 5
+
+SCHEMA = {
+    "users": """
+        CREATE TABLE users (
+            id TEXT PRIMARY KEY,
+            persona_type TEXT NOT NULL,
+            created_at TEXT,
+            name TEXT,
+            age INTEGER,
+            gender TEXT,
+            education TEXT,
+            location TEXT,
+            engagement_level REAL,
+            action_tendency REAL,
+            anxiety_level REAL,
+            engagement_tier TEXT,
+            capture_behavior TEXT,
+            attributes TEXT,
+            journey_id TEXT,
+            metadata TEXT
+        )""",
+    "journeys": """
+        CREATE TABLE journeys (
+            id TEXT PRIMARY KEY,
+            user_id TEXT NOT NULL REFERENCES users(id),
+            persona_type TEXT NOT NULL,
+            journey_type TEXT,
+            current_phase INTEGER,
+            overall_completion REAL,
+            started_at TEXT,
+            last_activity TEXT,
+            completed_at TEXT,
+            n_steps INTEGER
+        )""",
+    "steps": """
+        CREATE TABLE steps (
+            id TEXT PRIMARY KEY,
+            journey_id TEXT NOT NULL REFERENCES journeys(id),
+            user_id TEXT NOT NULL REFERENCES users(id),
+            persona_type TEXT NOT NULL,
+            phase_id TEXT NOT NULL,
+            step_number INTEGER,
+            timestamp TEXT,
+            actions TEXT,
+            emotional_state TEXT,
+            completion_status TEXT,
+            data_captured TEXT,
+            time_invested INTEGER,
+            engagement_score REAL
+        )""",
+    "ssr_responses": """
+        CREATE TABLE ssr_responses (
+            step_id TEXT NOT NULL REFERENCES steps(id),
+            journey_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            persona_type TEXT NOT NULL,
+            phase_id TEXT NOT NULL,
+            scale_id TEXT NOT NULL,
+            {pmf_columns},
+            expected_value REAL,
+            most_likely_rating INTEGER,
+            text_response TEXT,
+            PRIMARY KEY (step_id, scale_id)
+        )""".format(pmf_columns=",\n            ".join(f"pmf_{i} REAL" for i in range(1, PMF_POINTS + 1))),
+}
+
+# Created after loading
+INDEXES = [
+    ("users", ("persona_type",)),
+    ("journeys", ("user_id",)),
+    ("journeys", ("persona_type",)),
+    ("steps", ("journey_id",)),
+    ("steps", ("persona_type",)),
+    ("steps", ("phase_id",)),
+    ("steps", ("emotional_state",)),
+    ("steps", ("timestamp",)),
+    ("ssr_responses", ("user_id",)),
+    ("ssr_responses", ("scale_id", "persona_type")),
+    ("ssr_responses", ("phase_id",)),
+]
+
+
+def _sqlite_row(table: str, row: Dict[str, Any], columns: List[str]) -> Tuple[Any, ...]:
+    """Convert a flattened row to a parameter tuple in table column order"""
+    if table == "steps":
+        row["actions"] = json.dumps(row["actions"])
+    elif table == "ssr_responses":
+        pmf = row.pop("pmf")
+        for i in range(PMF_POINTS):
+            row[f"pmf_{i + 1}"] = float(pmf[i])
+    return tuple(row[column] for column in columns)
+
+
+class SqliteCohortWriter:
+    """Stream user dicts (user + nested journey) into a normalized SQLite database"""
+
+    TABLES = TABLES
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_every: int = 100,
+        batch_size: int = 10000,
+        commit_every: int = 50000,
+        create_indexes: bool = True
+    ):
+        """
+        Initialize writer
+
+        Args:
+            path: Database file (replaced if it exists)
+            flush_every: Accepted for writer-interface compatibility; rows are
+                inserted per batch instead
+            batch_size: Rows buffered per table before an executemany
+            commit_every: Users per transaction
+            create_indexes: Build secondary indexes on close
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.create_indexes = create_indexes
+        self.rows_written = 0
+
+        for stale in (self.path, Path(f"{self.path}-wal"), Path(f"{self.path}-shm")):
+            if stale.exists():
+                stale.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Transactions are managed explicitly
+        self._conn = sqlite3.connect(self.path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-262144")  # 256 MiB
+
+        self._columns: Dict[str, List[str]] = {}
+        for table in self.TABLES:
+            self._conn.execute(SCHEMA[table])
+            self._columns[table] = [
+                info[1] for info in self._conn.execute(f"PRAGMA table_info({table})")
+            ]
+        self._inserts = {
+            table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            for table, columns in self._columns.items()
+        }
+        self._buffers: Dict[str, List[Tuple[Any, ...]]] = {table: [] for table in self.TABLES}
+
+        self._conn.execute("BEGIN")
+        self._closed = False
+
+    def write(self, user_data: Dict[str, Any]) -> None:
+        """
+        Write one user and its journey
+
+        Args:
+            user_data: UserProfile.to_dict() with the journey dict under "journey"
+        """
+        with profiling.stage("write.encode"):
+            for table, row in flatten_user(user_data):
+                buffer = self._buffers[table]
+                buffer.append(_sqlite_row(table, row, self._columns[table]))
+                if len(buffer) >= self.batch_size:
+                    self._flush_table(table)
+
+        self.rows_written += 1
+        if self.commit_every and self.rows_written % self.commit_every == 0:
+            self._commit()
+
+    def write_user(self, user: UserProfile, journey: Optional[Journey] = None, include_phases: bool = True) -> None:
+        """Write a user from model objects (phases are not stored in the tables)"""
+        with profiling.stage("write.encode"):
+            record = user_record(user, journey, include_phases=False)
+        self.write(record)
+
+    def _flush_table(self, table: str) -> None:
+        """Insert buffered rows of a table"""
+        buffer = self._buffers[table]
+        if buffer:
+            with profiling.stage("write.io"):
+                self._conn.executemany(self._inserts[table], buffer)
+            buffer.clear()
+
+    def _commit(self) -> None:
+        """Flush every table and start a new transaction"""
+        for table in self.TABLES:
+            self._flush_table(table)
+        with profiling.stage("write.io"):
+            self._conn.execute("COMMIT")
+            self._conn.execute("BEGIN")
+
+    def build_indexes(self) -> None:
+        """Create secondary indexes and refresh planner statistics"""
+        for table, columns in INDEXES:
+            name = f"idx_{table}_{'_'.join(columns)}"
+            self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+        self._conn.execute("ANALYZE")
+
+    def close(self) -> None:
+        """Insert remaining rows, build indexes and close the database"""
+        if self._closed:
+            return
+        for table in self.TABLES:
+            self._flush_table(table)
+        self._conn.execute("COMMIT")
+
+        if self.create_indexes:
+            self._conn.execute("BEGIN")
+            self.build_indexes()
+            self._conn.execute("COMMIT")
+
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        self._conn.close()
+        self._closed = True
+
+    def __enter__(self) -> "SqliteCohortWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"SqliteCohortWriter(path={self.path}, rows={self.rows_written})"
@@ -0,0 +1,190 @@
+"""
+Dataset summary sidecar.
+
+users.jsonl.summary.json records row, persona and engagement-tier counts
+of a generated dataset so tools that only need the composition (e.g.
+top-up generation) do not have to read the users:
+
+    {"project": "private_language", "rows": 5000,
+     "persona_counts": {...}, "engagement_tier_counts": {...}}
+
+Sharded datasets keep the same counts in manifest.json.
+
+Datasets generated with SSR ratings (`cli.py generate --ssr`) also get a
+users.jsonl.survey.json sidecar (one per shard for sharded datasets)
+holding the SurveyAggregator state of their responses; read_survey()
+merges the shards' states into cohort-level statistics.
+"""
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+from ..models.user_profile import UserProfile
+
+if TYPE_CHECKING:
+    from ..generators.ssr_aggregator import SurveyAggregator
+
+SUMMARY_SUFFIX = ".summary.json"
+SURVEY_SUFFIX = ".survey.json"
+
+
+def summary_path(path: Union[str, Path]) -> Path:
+    """Sidecar summary path for a dataset (users.jsonl -> users.jsonl.summary.json)"""
+    path = Path(path)
+    return path.with_name(path.name + SUMMARY_SUFFIX)
+
+
+def survey_path(path: Union[str, Path]) -> Path:
+    """Sidecar survey state path for a dataset or shard (users.jsonl -> users.jsonl.survey.json)"""
+    path = Path(path)
+    return path.with_name(path.name + SURVEY_SUFFIX)
+
+
+class DatasetSummary:
+    """Running persona and engagement-tier counts of a dataset"""
+
+    def __init__(
+        self,
+        project: Optional[str] = None,
+        persona_counts: Optional[Dict[str, int]] = None,
+        engagement_tier_counts: Optional[Dict[str, int]] = None
+    ):
+        """
+        Initialize summary
+
+        Args:
+            project: Project name the dataset was generated from
+            persona_counts: Initial users per persona type
+            engagement_tier_counts: Initial users per engagement tier
+        """
+        self.project = project
+        self.persona_counts = Counter(persona_counts or {})
+        self.engagement_tier_counts = Counter(engagement_tier_counts or {})
+
+    @property
+    def rows(self) -> int:
+        """Number of users counted"""
+        return sum(self.persona_counts.values())
+
+    def add(self, user_data: Dict[str, Any]) -> None:
+        """Count one user dict"""
+        self._count(user_data["persona_type"], user_data.get("attributes", {}))
+
+    def add_profile(self, user: UserProfile) -> None:
+        """Count one user profile"""
+        self._count(user.persona_type, user.attributes)
+
+    def _count(self, persona_type: str, attributes: Dict[str, Any]) -> None:
+        self.persona_counts[persona_type] += 1
+        tier = attributes.get("engagement_tier")
+        if tier is not None:
+            self.engagement_tier_counts[tier] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary to dictionary"""
+        return {
+            "project": self.project,
+            "rows": self.rows,
+            "persona_counts": dict(sorted(self.persona_counts.items())),
+            "engagement_tier_counts": dict(sorted(self.engagement_tier_counts.items())),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DatasetSummary":
+        """Create summary from dictionary (summary sidecar or shard manifest)"""
+        return cls(
+            project=data.get("project"),
+            persona_counts=data.get("persona_counts"),
+            engagement_tier_counts=data.get("engagement_tier_counts")
+        )
+
+    def save(self, dataset_path: Union[str, Path]) -> Path:
+        """Write the sidecar next to a dataset"""
+        path = summary_path(dataset_path)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def __repr__(self) -> str:
+        return f"DatasetSummary(project={self.project}, rows={self.rows})"
+
+
+def read_summary(path: Union[str, Path], scan: bool = True) -> Optional[DatasetSummary]:
+    """
+    Read a dataset's persona and engagement-tier counts
+
+    Uses the manifest of sharded datasets or the summary sidecar; without
+    either, the dataset is streamed once (users are counted, not kept) and
+    the sidecar is written for next time.
+
+    Args:
+        path: Dataset file or sharded dataset directory
+        scan: Stream the dataset when no summary exists
+
+    Returns:
+        Summary, or None if none exists and scan is False
+    """
+    from .readers import iter_users, resolve_dataset
+    from .shards import is_sharded, load_manifest
+
+    path = resolve_dataset(path)
+    if is_sharded(path):
+        return DatasetSummary.from_dict(load_manifest(path))
+
+    sidecar = summary_path(path)
+    if sidecar.exists():
+        with open(sidecar) as f:
+            return DatasetSummary.from_dict(json.load(f))
+
+    if not scan:
+        return None
+    summary = DatasetSummary()
+    for user_data in iter_users(path, denormalize=False):
+        summary.add(user_data)
+    summary.save(path)
+    return summary
+
+
+def save_survey(aggregator: "SurveyAggregator", dataset_path: Union[str, Path]) -> Path:
+    """Write the survey state sidecar next to a dataset or shard"""
+    path = survey_path(dataset_path)
+    with open(path, "w") as f:
+        json.dump(aggregator.to_state(), f)
+    return path
+
+
+def read_survey(path: Union[str, Path]) -> Optional["SurveyAggregator"]:
+    """
+    Read the survey statistics of a dataset generated with SSR ratings
+
+    Args:
+        path: Dataset file or sharded dataset directory
+
+    Returns:
+        Aggregator with every response of the dataset (the shards' states
+        merged for sharded datasets), or None if it has no survey sidecar
+
+    Raises:
+        FileNotFoundError: A shard of an SSR dataset has no survey sidecar
+    """
+    from ..generators.ssr_aggregator import SurveyAggregator
+    from .readers import resolve_dataset
+    from .shards import is_sharded, load_manifest, shard_paths
+
+    path = resolve_dataset(path)
+    if not is_sharded(path):
+        sidecar = survey_path(path)
+        if not sidecar.exists():
+            return None
+        with open(sidecar) as f:
+            return SurveyAggregator.from_state(json.load(f))
+
+    if not load_manifest(path).get("ssr"):
+        return None
+    aggregator = SurveyAggregator()
+    for shard_file in shard_paths(path):
+        with open(survey_path(shard_file)) as f:
+            aggregator.merge(SurveyAggregator.from_state(json.load(f)))
+    return aggregator
@@ -0,0 +1,109 @@
+"""
+Normalized table layout shared by the columnar and SQL exporters.
+
+A user dict (UserProfile.to_dict() with the journey under "journey") is
+flattened into rows of four tables:
+
+- users          one row per user
+- journeys       one row per journey
+- steps          one row per JourneyStep
+- ssr_responses  one row per step x scale
+"""
+
+import json
+from typing import Any, Dict, Iterator, Tuple
+
+
+TABLES = ("users", "journeys", "steps", "ssr_responses")
+
+# Columns holding isoformat timestamps (converted by exporters with native types)
+TIMESTAMP_COLUMNS = {
+    "users": ("created_at",),
+    "journeys": ("started_at", "last_activity", "completed_at"),
+    "steps": ("timestamp",),
+    "ssr_responses": (),
+}
+
+
+def flatten_user(user_data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Flatten one user and its journey into table rows
+
+    Args:
+        user_data: UserProfile.to_dict() with the journey dict under "journey"
+
+    Yields:
+        (table name, row dict) tuples; timestamps stay isoformat strings and
+        free-form fields (attributes, metadata, data_captured) are JSON text
+    """
+    user_id = user_data["id"]
+    persona_type = user_data["persona_type"]
+    attributes = user_data.get("attributes", {})
+    journey = user_data.get("journey") or {}
+    steps = journey.get("steps", [])
+
+    yield "users", {
+        "id": user_id,
+        "persona_type": persona_type,
+        "created_at": user_data.get("created_at"),
+        "name": user_data.get("name"),
+        "age": user_data.get("age"),
+        "gender": user_data.get("gender"),
+        "education": user_data.get("education"),
+        "location": user_data.get("location"),
+        "engagement_level": user_data.get("engagement_level"),
+        "action_tendency": user_data.get("action_tendency"),
+        "anxiety_level": user_data.get("anxiety_level"),
+        "engagement_tier": attributes.get("engagement_tier"),
+        "capture_behavior": attributes.get("capture_behavior"),
+        "attributes": json.dumps(attributes),  # keys vary by persona type
+        "journey_id": user_data.get("journey_id"),
+        "metadata": json.dumps(user_data.get("metadata", {})),
+    }
+
+    if not journey:
+        return
+
+    yield "journeys", {
+        "id": journey["id"],
+        "user_id": user_id,
+        "persona_type": persona_type,
+        "journey_type": journey.get("journey_type"),
+        "current_phase": journey.get("current_phase"),
+        "overall_completion": journey.get("overall_completion"),
+        "started_at": journey.get("started_at"),
+        "last_activity": journey.get("last_activity"),
+        "completed_at": journey.get("completed_at"),
+        "n_steps": len(steps),
+    }
+
+    for step in steps:
+        yield "steps", {
+            "id": step["id"],
+            "journey_id": journey["id"],
+            "user_id": user_id,
+            "persona_type": persona_type,
+            "phase_id": step["phase_id"],
+            "step_number": step["step_number"],
+            "timestamp": step.get("timestamp"),
+            "actions": step.get("actions", []),
+            "emotional_state": step.get("emotional_state"),
+            "completion_status": step.get("completion_status"),
+            "data_captured": json.dumps(step.get("data_captured", {})),
+            "time_invested": step.get("time_invested"),
+            "engagement_score": step.get("engagement_score"),
+        }
+
+        for scale_id, response in step.get("ssr_responses", {}).items():
+            yield "ssr_responses", {
+                "step_id": step["id"],
+                "journey_id": journey["id"],
+                "user_id": user_id,
+                "persona_type": persona_type,
+                "phase_id": step["phase_id"],
+                "scale_id": scale_id,
+                "pmf": response["pmf"],
+                "expected_value": response.get("expected_value"),
+                "most_likely_rating": response.get("most_likely_rating"),
+                "text_response": response.get("text_response"),
+            }
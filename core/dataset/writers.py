@@ -0,0 +1,254 @@
+"""Streaming writers for generated user datasets"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..models.journey import Journey
+from ..models.user_profile import UserProfile
+from ..models.vocabulary import Vocabulary
+from ..utils import profiling
+from .codec import get_serializer, user_record
+from .compression import compression_for, open_text
+
+
+# Key of the header block in normalized datasets (see core.dataset.normalized)
+HEADER_KEY = "_header"
+
+
+class JsonlWriter:
+    """Write one JSON record per line as users are generated"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_every: int = 100,
+        header: Optional[Dict[str, Any]] = None,
+        index: bool = False,
+        append: bool = False,
+        serializer: Optional[str] = None
+    ):
+        """
+        Initialize writer
+
+        Args:
+            path: Output file path (conventionally *.jsonl; .gz/.zst suffixes compress)
+            flush_every: Flush to disk every N records (0 = only on close)
+            header: Dataset header for normalized output, written as the first line
+            index: Write a sidecar offset index (<path>.idx) on close; uncompressed only
+            append: Add records to an existing file (no header is written; an
+                existing offset index is extended)
+            serializer: JSON backend (see core.dataset.codec; None = fastest installed)
+        """
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.header = header
+        self.rows_written = 0
+        self.serializer = get_serializer(serializer)
+
+        self._index = None
+        # Bytes in the file so far
+        self._offset = self.path.stat().st_size if append and self.path.exists() else 0
+        if index:
+            if compression_for(self.path):
+                raise ValueError(f"Offset index requires uncompressed output, got {self.path}")
+            from .index import OffsetIndexBuilder
+            self._index = OffsetIndexBuilder.load(self.path) if append else OffsetIndexBuilder()
+
+        self._file = open_text(self.path, "a" if append else "w")
+        if not append:
+            self._write_header()
+
+    def _write_header(self) -> None:
+        """Write the header line (normalized datasets only)"""
+        if self.header is not None:
+            if self._index is not None:
+                self._index.header_offset = self._offset
+            self._write_line(self.serializer.dumps({HEADER_KEY: self.header}))
+
+    def _write_line(self, line: str) -> None:
+        """Write one line and advance the byte offset"""
+        self._file.write(line)
+        self._file.write("\n")
+        # isascii() is O(1); only non-ASCII lines need encoding to count bytes
+        self._offset += (len(line) if line.isascii() else len(line.encode("utf-8"))) + 1
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write a single record"""
+        with profiling.stage("write.encode"):
+            line = self.serializer.dumps(record)
+        with profiling.stage("write.io"):
+            if self._index is not None:
+                self._index.add(record, self._offset)
+            self._write_line(line)
+            self._after_write()
+
+    def write_user(self, user: UserProfile, journey: Optional[Journey] = None, include_phases: bool = True) -> None:
+        """
+        Write a user straight from model objects (no intermediate to_dict())
+
+        Args:
+            user: User profile
+            journey: The user's journey
+            include_phases: Embed phase definitions (False for normalized datasets)
+        """
+        with profiling.stage("write.encode"):
+            line = self.serializer.encode_user(user, journey, include_phases)
+        with profiling.stage("write.io"):
+            if self._index is not None:
+                self._index.add({"id": user.id, "persona_type": user.persona_type}, self._offset)
+            self._write_line(line)
+            self._after_write()
+
+    def _after_write(self) -> None:
+        """Count the record and flush on the configured interval"""
+        self.rows_written += 1
+        if self.flush_every and self.rows_written % self.flush_every == 0:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the output file (and write the offset index)"""
+        if not self._file.closed:
+            self._file.close()
+            if self._index is not None:
+                self._index.save(self.path, self._offset)
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={self.path}, rows={self.rows_written})"
+
+
+class JsonArrayWriter(JsonlWriter):
+    """
+    Stream records into a pretty-printed JSON array (same layout as json.dump(indent=2))
+
+    With a header the file is an object instead: {"_header": {...}, "users": [...]}.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_every: int = 100,
+        header: Optional[Dict[str, Any]] = None,
+        indent: Optional[int] = 2
+    ):
+        """
+        Initialize writer
+
+        Args:
+            path: Output file path (conventionally *.json; .gz/.zst suffixes compress)
+            flush_every: Flush to disk every N records (0 = only on close)
+            header: Dataset header for normalized output
+            indent: Indentation passed to json.dumps (None for compact output)
+        """
+        self.indent = indent
+        # Array elements sit one level deeper when wrapped in a header object
+        self._depth = 1 if header is None else 2
+        super().__init__(path, flush_every, header)
+
+    def _write_header(self) -> None:
+        """Open the array (and the wrapping object for normalized output)"""
+        if self.header is None:
+            self._file.write("[")
+            return
+
+        if self.indent is None:
+            self._file.write(f'{{"{HEADER_KEY}": {json.dumps(self.header)}, "users": [')
+            return
+
+        pad = " " * self.indent
+        encoded = json.dumps(self.header, indent=self.indent).replace("\n", "\n" + pad)
+        self._file.write(f'{{\n{pad}"{HEADER_KEY}": {encoded},\n{pad}"users": [')
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write a single array element"""
+        with profiling.stage("write.encode"):
+            if self.indent is None:
+                separator = ", " if self.rows_written else ""
+                encoded = json.dumps(record)
+            else:
+                pad = " " * (self.indent * self._depth)
+                separator = ",\n" if self.rows_written else "\n"
+                encoded = "\n".join(pad + line for line in json.dumps(record, indent=self.indent).split("\n"))
+        with profiling.stage("write.io"):
+            self._file.write(separator)
+            self._file.write(encoded)
+            self._after_write()
+
+    def write_user(self, user: UserProfile, journey: Optional[Journey] = None, include_phases: bool = True) -> None:
+        """Write a user from model objects (pretty-printed through to_dict())"""
+        with profiling.stage("write.encode"):
+            record = user_record(user, journey, include_phases)
+        self.write(record)
+
+    def close(self) -> None:
+        """Close the array and the output file"""
+        if not self._file.closed:
+            if self.indent is not None and self.rows_written:
+                self._file.write("\n" + " " * (self.indent * (self._depth - 1)))
+            self._file.write("]")
+            if self.header is not None:
+                self._file.write("\n}" if self.indent is not None else "}")
+        super().close()
+
+
+WRITERS = {
+    "json": JsonArrayWriter,
+    "jsonl": JsonlWriter,
+}
+
+
+def open_writer(
+    path: Union[str, Path],
+    output_format: str = "json",
+    flush_every: int = 100,
+    header: Optional[Dict[str, Any]] = None,
+    index: bool = False,
+    append: bool = False,
+    serializer: Optional[str] = None,
+    vocabulary: Optional[Vocabulary] = None
+) -> JsonlWriter:
+    """
+    Open a streaming dataset writer
+
+    Args:
+        path: Output file path
+        output_format: "json" (single array), "jsonl" (one user per line),
+            "parquet" (directory of normalized Parquet tables) or "sqlite"
+            (normalized SQLite database)
+        flush_every: Flush to disk every N records
+        header: Dataset header for normalized JSON/JSONL output (Parquet and
+            SQLite tables never repeat phase definitions)
+        index: Write a sidecar offset index alongside uncompressed JSONL output
+        append: Append to an existing JSONL file
+        serializer: JSON backend for JSONL output (None = fastest installed)
+        vocabulary: Project vocabulary for the categorical codes of Parquet output
+
+    Returns:
+        Writer usable as a context manager
+    """
+    if output_format == "parquet":
+        # pyarrow is only needed for the columnar export
+        from .parquet import ParquetCohortWriter
+        return ParquetCohortWriter(path, flush_every=flush_every, vocabulary=vocabulary)
+
+    if output_format == "sqlite":
+        from .sqlite import SqliteCohortWriter
+        return SqliteCohortWriter(path, flush_every=flush_every)
+
+    if output_format not in WRITERS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. Available: {list(WRITERS) + ['parquet', 'sqlite']}"
+        )
+    if output_format == "jsonl":
+        return JsonlWriter(
+            path, flush_every=flush_every, header=header, index=index, append=append, serializer=serializer
+        )
+    if append:
+        raise ValueError(f"Appending is supported for jsonl output, not {output_format}")
+    return WRITERS[output_format](path, flush_every=flush_every, header=header)
@@ -3,5 +3,6 @@
 from .persona_generator import PersonaGenerator
 from .journey_generator import JourneyGenerator
 from .narrative_generator import NarrativeGenerator
+from .cohort_generator import CohortGenerator
 
-__all__ = ["PersonaGenerator", "JourneyGenerator", "NarrativeGenerator"]
+__all__ = ["PersonaGenerator", "JourneyGenerator", "NarrativeGenerator", "CohortGenerator"]
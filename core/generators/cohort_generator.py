@@ -0,0 +1,144 @@
+"""Generate complete user records (profile + journey) for a project"""
+
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from ..models.journey import Journey
+from ..models.persona import Persona
+from ..models.user_profile import UserProfile
+from ..utils import profiling
+from ..utils.config_loader import ConfigLoader
+from .journey_generator import JourneyGenerator
+from .persona_generator import PersonaGenerator
+from .ssr_aggregator import SurveyAggregator
+
+
+class CohortGenerator:
+    """Load a project's configuration once and stream user records with journeys"""
+
+    def __init__(
+        self,
+        project_path: Union[str, Path],
+        snapshot_dir: Optional[Union[str, Path]] = None,
+        enable_ssr: bool = False,
+        ssr_aggregator: Optional[SurveyAggregator] = None,
+        ssr_backend: str = "torch"
+    ):
+        """
+        Initialize generator
+
+        Args:
+            project_path: Project directory (projects/<name>)
+            snapshot_dir: Directory of compiled configuration snapshots, so
+                repeated runs and shard workers skip YAML parsing (default:
+                None, always parse YAML; see ConfigLoader)
+            enable_ssr: Rate every step on the project's response_scales.yaml
+                (loads the embedding model; requires the SSR extras)
+            ssr_aggregator: Folds every SSR response into cohort-level running
+                statistics (optional)
+            ssr_backend: Embedding backend for SSR ratings: "torch" or "onnx"
+                (int8-quantized onnxruntime, CPU only)
+        """
+        self.project_path = Path(project_path)
+        with profiling.stage("config.load"):
+            loader = ConfigLoader(self.project_path, snapshot_dir=snapshot_dir)
+
+            self.config = loader.load_config()
+            self.personas = loader.load_personas()
+            self.journey_phases = loader.load_journey_phases()
+            self.emotional_states = loader.load_emotional_states()
+            self.journey_type = loader.get_journey_type()
+            self.vocabulary = loader.load_vocabulary()
+
+        self.persona_gen = PersonaGenerator(self.personas, self.vocabulary)
+        self.journey_gen = JourneyGenerator(
+            self.journey_type, self.journey_phases, self.emotional_states,
+            ssr_config_path=str(self.project_path / "response_scales.yaml") if enable_ssr else None,
+            enable_ssr=enable_ssr,
+            ssr_aggregator=ssr_aggregator,
+            vocabulary=self.vocabulary,
+            ssr_backend=ssr_backend
+        )
+
+    def iter_models(
+        self,
+        count: int,
+        persona_counts: Optional[Dict[str, int]] = None,
+        start: int = 0,
+        seed: Optional[int] = None,
+        engagement_tier_counts: Optional[Dict[str, int]] = None
+    ) -> Iterator[Tuple[UserProfile, Journey]]:
+        """
+        Stream users as model objects (for writers that encode them directly)
+
+        Args:
+            count: Number of users
+            persona_counts: Exact number per persona type (overrides the distribution)
+            start: Index of the first user (users are named <persona_type>_user_<index + 1>)
+            seed: Seed for the random module (persona attributes and journey
+                structure; ids and timestamps are not seeded)
+            engagement_tier_counts: Exact number per engagement tier (overrides
+                ENGAGEMENT_LEVELS sampling)
+
+        Yields:
+            (UserProfile, Journey) tuples
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        for i, persona in enumerate(self.persona_gen.iter_generate(count, persona_counts, engagement_tier_counts), start):
+            user = self.profile(persona, i)
+
+            # Generate journey
+            journey = self.journey_gen.generate(persona, user.id)
+            user.journey_id = journey.id
+            yield user, journey
+
+    @staticmethod
+    def profile(persona: Persona, index: int) -> UserProfile:
+        """User profile of the index-th generated persona (named <persona_type>_user_<index + 1>)"""
+        return UserProfile(
+            persona_type=persona.persona_type,
+            name=f"{persona.persona_type}_user_{index + 1}",
+            age=persona.age,
+            gender=persona.gender,
+            education=persona.education,
+            engagement_level=persona.engagement_level,
+            action_tendency=persona.action_tendency,
+            anxiety_level=persona.anxiety_level,
+            attributes=persona.attributes
+        )
+
+    def iter_users(
+        self,
+        count: int,
+        persona_counts: Optional[Dict[str, int]] = None,
+        start: int = 0,
+        seed: Optional[int] = None,
+        include_phases: bool = True,
+        engagement_tier_counts: Optional[Dict[str, int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream user records as written by cli.py generate
+
+        Args:
+            count: Number of users
+            persona_counts: Exact number per persona type (overrides the distribution)
+            start: Index of the first user (users are named <persona_type>_user_<index + 1>)
+            seed: Seed for the random module (see iter_models)
+            include_phases: Embed phase definitions in each journey (False for
+                normalized datasets)
+            engagement_tier_counts: Exact number per engagement tier
+
+        Yields:
+            UserProfile dicts with the journey dict under "journey"
+        """
+        for user, journey in self.iter_models(count, persona_counts, start, seed, engagement_tier_counts):
+            # Combine user and journey data
+            user_data = user.to_dict()
+            user_data["journey"] = journey.to_dict(include_phases=include_phases)
+            yield user_data
+
+    def __repr__(self) -> str:
+        return f"CohortGenerator(project={self.project_path.name}, personas={len(self.personas)})"
@@ -0,0 +1,205 @@
+"""
+Process-wide registry of sentence embedding models.
+
+Every SSRResponseGenerator used to load its own SentenceTransformer through
+ResponseRater, so several projects or reference configs in one process (or
+many worker processes) each held a copy of the same weights. The registry
+keeps one model per (model_name, device, backend) and shares it across
+generators.
+
+On Linux, load models in the parent and then start workers with fork_pool()
+(or fork_executor() for concurrent.futures): children inherit the
+already-loaded weights copy-on-write instead of each loading their own.
+"""
+
+import gc
+import multiprocessing
+import multiprocessing.pool
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+ModelKey = Tuple[str, Optional[str], str]  # (model_name, device, backend)
+
+# Workers are forked (and inherit loaded models) only on Linux
+FORK_WORKERS = sys.platform.startswith("linux")
+
+
+def _load_sentence_transformer(model_name: str, device: Optional[str]) -> Any:
+    """Default loader: a sentence-transformers model"""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, device=device)
+
+
+def _load_onnx_encoder(model_name: str, device: Optional[str]) -> Any:
+    """Quantized ONNX loader (CPU only, device is ignored)"""
+    from .onnx_encoder import OnnxSentenceEncoder
+
+    return OnnxSentenceEncoder(model_name)
+
+
+BACKEND_LOADERS: Dict[str, Callable[[str, Optional[str]], Any]] = {
+    "torch": _load_sentence_transformer,
+    "onnx": _load_onnx_encoder,
+}
+
+
+def _limit_worker_threads() -> None:
+    """Pool initializer: one intra-op thread per forked worker"""
+    # Forked children share the parent's CPU budget; letting every worker
+    # spin up a full torch thread pool oversubscribes the machine.
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(1)
+
+
+def _init_worker(initializer: Optional[Callable[..., None]], *args) -> None:
+    """Pool initializer: limit threads, then run the caller's initializer"""
+    # Module-level so spawned (non-fork) workers can unpickle it too
+    _limit_worker_threads()
+    if initializer is not None:
+        initializer(*args)
+
+
+class EmbeddingModelRegistry:
+    """Share loaded embedding models across SSR generators in a process"""
+
+    def __init__(self, loaders: Optional[Dict[str, Callable[[str, Optional[str]], Any]]] = None):
+        """
+        Initialize registry
+
+        Args:
+            loaders: Extra/overriding backend loaders, each a callable
+                (model_name, device) -> model with an `encode` method
+        """
+        self.loaders = {**BACKEND_LOADERS, **(loaders or {})}
+        self._models: Dict[ModelKey, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, model_name: str, device: Optional[str] = None, backend: str = "torch") -> Any:
+        """
+        Get a shared model, loading it on first use
+
+        Args:
+            model_name: Model identifier (e.g. "all-MiniLM-L6-v2")
+            device: Device to run on ('cpu', 'cuda', ...), None for auto-detect
+            backend: "torch" (sentence-transformers) or "onnx" (quantized onnxruntime)
+
+        Returns:
+            Loaded model instance shared by all callers with the same key
+        """
+        if backend not in self.loaders:
+            raise ValueError(f"Unknown embedding backend '{backend}'. Available: {list(self.loaders)}")
+
+        key = (model_name, device, backend)
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock:
+            # Another thread may have loaded it while we waited for the lock
+            if key not in self._models:
+                self._models[key] = self.loaders[backend](model_name, device)
+            return self._models[key]
+
+    def register(self, model_name: str, device: Optional[str], model: Any, backend: str = "torch") -> None:
+        """Register an already-constructed model"""
+        with self._lock:
+            self._models[(model_name, device, backend)] = model
+
+    def preload(self, models: List[ModelKey]) -> None:
+        """Load models up front, e.g. in the parent before forking workers"""
+        for model_name, device, backend in models:
+            self.get(model_name, device, backend)
+
+    def loaded(self) -> List[ModelKey]:
+        """Keys of models currently held by the registry"""
+        return list(self._models)
+
+    def clear(self) -> None:
+        """Drop all models (they are freed once no generator references them)"""
+        with self._lock:
+            self._models.clear()
+
+    def fork_pool(
+        self,
+        processes: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = ()
+    ) -> multiprocessing.pool.Pool:
+        """
+        Create a worker pool that inherits loaded models copy-on-write
+
+        Load models (or construct SSRResponseGenerators) before calling this.
+        On Linux the pool uses the fork start method and freezes the GC so
+        collections in the children do not touch (and copy) inherited pages.
+        Elsewhere fork is unsafe or unavailable, so the default start method
+        is used and each worker loads its own copy on first use.
+
+        Args:
+            processes: Number of workers (default: os.cpu_count())
+            initializer: Extra per-worker initializer
+            initargs: Arguments for initializer
+
+        Returns:
+            multiprocessing Pool
+        """
+        initargs = (initializer, *initargs)
+        if FORK_WORKERS:
+            gc.collect()
+            gc.freeze()
+            try:
+                return multiprocessing.get_context("fork").Pool(
+                    processes, initializer=_init_worker, initargs=initargs
+                )
+            finally:
+                gc.unfreeze()
+
+        return multiprocessing.Pool(processes, initializer=_init_worker, initargs=initargs)
+
+    def fork_executor(
+        self,
+        max_workers: Optional[int] = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple = ()
+    ) -> ProcessPoolExecutor:
+        """
+        ProcessPoolExecutor counterpart of fork_pool
+
+        On Linux every worker is forked before this returns, while the GC is
+        frozen, so later work in the parent does not leak into the children.
+
+        Args:
+            max_workers: Number of workers (default: os.cpu_count())
+            initializer: Extra per-worker initializer
+            initargs: Arguments for initializer
+
+        Returns:
+            ProcessPoolExecutor
+        """
+        initargs = (initializer, *initargs)
+        if not FORK_WORKERS:
+            return ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=initargs)
+
+        gc.collect()
+        gc.freeze()
+        try:
+            executor = ProcessPoolExecutor(
+                max_workers, mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker, initargs=initargs
+            )
+            # A fork-context executor starts all of its workers on the first submit
+            executor.submit(_limit_worker_threads).result()
+            return executor
+        finally:
+            gc.unfreeze()
+
+    def __repr__(self) -> str:
+        return f"EmbeddingModelRegistry(models={self.loaded()})"
+
+
+# Registry shared by every SSRResponseGenerator unless one is passed explicitly
+shared_registry = EmbeddingModelRegistry()
@@ -1,12 +1,16 @@
 """Generate user journeys through phases"""
 
 import random
+import time
 import uuid
+from importlib.util import find_spec
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from ..models.defaults import EMPTY_DICT
 from ..models.persona import Persona
+from ..models.vocabulary import Vocabulary
 from ..models.journey import (
     Journey,
     JourneyPhase,
@@ -14,18 +18,21 @@ from ..models.journey import (
     JourneyType,
     CompletionStatus
 )
+from ..utils import hooks, profiling
+from .model_router import ModelRouter
+from .ssr_aggregator import SurveyAggregator
 
-try:
-    from .ssr_response_generator import SSRResponseGenerator
-    SSR_AVAILABLE = True
-except ImportError:
-    SSR_AVAILABLE = False
 
-try:
-    from .llm_response_generator import LLMResponseGenerator
-    LLM_AVAILABLE = True
-except ImportError:
-    LLM_AVAILABLE = False
+# SSR (polars, numpy, sentence-transformers/torch) and LLM (anthropic) backends
+# are heavy to import, so only check they are installed here and import them
+# on first use in JourneyGenerator.__init__.
+def _modules_available(*module_names: str) -> bool:
+    """Check that top-level modules are installed without importing them"""
+    return all(find_spec(name) is not None for name in module_names)
+
+
+SSR_AVAILABLE = _modules_available("polars", "numpy", "semantic_similarity_rating")
+LLM_AVAILABLE = _modules_available("anthropic", "dotenv")
 
 
 class JourneyGenerator:
@@ -39,7 +46,11 @@ class JourneyGenerator:
         ssr_config_path: Optional[str] = None,
         enable_ssr: bool = False,
         use_real_llm: bool = False,
-        llm_model: str = "claude-sonnet-4-5-20250929"
+        llm_model: str = "claude-sonnet-4-5-20250929",
+        model_router: Optional[ModelRouter] = None,
+        ssr_aggregator: Optional[SurveyAggregator] = None,
+        vocabulary: Optional[Vocabulary] = None,
+        ssr_backend: str = "torch"
     ):
         """
         Initialize journey generator
@@ -52,11 +63,30 @@ class JourneyGenerator:
             enable_ssr: Whether to generate SSR-based responses (requires ssr_config_path)
             use_real_llm: Whether to use real LLM API calls instead of simulated responses
             llm_model: LLM model to use (default: claude-sonnet-4-5-20250929 - Claude Sonnet 4.5)
+            model_router: Routes scale prompts to model tiers (optional, overrides llm_model per call)
+            ssr_aggregator: Folds every SSR response into cohort-level running statistics (optional)
+            vocabulary: Categorical vocabulary whose strings steps share (see
+                ConfigLoader.load_vocabulary; an empty one by default)
+            ssr_backend: Embedding backend for SSR ratings: "torch" or "onnx"
+                (int8-quantized onnxruntime, CPU only)
         """
         self.journey_type = journey_type
         self.phases_config = phases_config
-        self.emotional_states = emotional_states
+        self.vocabulary = vocabulary or Vocabulary()
+        # Steps pick emotional states and actions from these lists, so intern them once
+        self.emotional_states = {
+            persona_type: {
+                phase_name: [self.vocabulary.intern("emotional_state", state) for state in states]
+                for phase_name, states in by_phase.items()
+            }
+            for persona_type, by_phase in emotional_states.items()
+        }
+        self.default_emotions = [
+            self.vocabulary.intern("emotional_state", state) for state in ("neutral", "engaged", "motivated")
+        ]
         self.use_real_llm = use_real_llm
+        self.model_router = model_router
+        self.ssr_aggregator = ssr_aggregator
 
         # Build phases
         self.phases = self._build_phases()
@@ -74,8 +104,11 @@ class JourneyGenerator:
             if not ssr_config_path:
                 raise ValueError("ssr_config_path required when enable_ssr=True")
 
+            from .ssr_response_generator import SSRResponseGenerator
+
             self.ssr_generator = SSRResponseGenerator(
-                reference_config_path=ssr_config_path
+                reference_config_path=ssr_config_path,
+                backend=ssr_backend
             )
 
         # Initialize LLM generator if requested
@@ -86,18 +119,21 @@ class JourneyGenerator:
                     "LLM support requires anthropic package. "
                     "Install with: pip install anthropic"
                 )
+            from .llm_response_generator import LLMResponseGenerator
+
             self.llm_generator = LLMResponseGenerator(model=llm_model)
 
     def _build_phases(self) -> List[JourneyPhase]:
         """Build JourneyPhase objects from configuration"""
         phases = []
 
+        vocabulary = self.vocabulary
         for i, config in enumerate(self.phases_config):
             phase = JourneyPhase(
-                id=f"phase_{i+1}",
+                id=vocabulary.intern("phase_id", f"phase_{i+1}"),
                 name=config["name"],
                 order=i,
-                objectives=config.get("objectives", []),
+                objectives=[vocabulary.intern("action", objective) for objective in config.get("objectives", [])],
                 emotional_objectives=config.get("emotional_objectives", []),
                 data_to_collect=config.get("data_to_collect", []),
                 completion_threshold=config.get("completion_threshold", 0.7),
@@ -120,6 +156,15 @@ class JourneyGenerator:
         Returns:
             Journey instance
         """
+        with profiling.stage("journey.generate"):
+            journey = self._generate(persona, user_id)
+        profiling.count("journeys")
+        profiling.count("steps", len(journey.steps))
+        hooks.emit("on_journey_complete", persona, journey)
+        return journey
+
+    def _generate(self, persona: Persona, user_id: str) -> Journey:
+        """Build a journey and its steps (see generate)"""
         journey = Journey(
             id=str(uuid.uuid4()),
             user_id=user_id,
@@ -314,7 +359,7 @@ class JourneyGenerator:
         )
         phase_emotions = persona_emotions.get(
             phase.name,
-            ["neutral", "engaged", "motivated"]
+            self.default_emotions
         )
         emotional_state = random.choice(phase_emotions)
 
@@ -348,8 +393,8 @@ class JourneyGenerator:
         ):
             data_captured[field] = f"generated_{field}_value"
 
-        # Generate SSR-based responses if enabled
-        ssr_responses = {}
+        # Generate SSR-based responses if enabled (steps without ratings share one empty dict)
+        ssr_responses = EMPTY_DICT
         if self.ssr_enabled and self.ssr_generator:
             ssr_responses = self._generate_ssr_responses(
                 persona=persona,
@@ -357,6 +402,13 @@ class JourneyGenerator:
                 emotional_state=emotional_state,
                 engagement_score=engagement_score
             )
+            if self.ssr_aggregator is not None:
+                self.ssr_aggregator.add_step_responses(
+                    ssr_responses,
+                    persona_type=persona.persona_type,
+                    phase=phase.name,
+                    engagement_tier=persona.attributes.get('engagement_tier', 'standard')
+                )
 
         step = JourneyStep(
             id=str(uuid.uuid4()),
@@ -368,12 +420,10 @@ class JourneyGenerator:
             completion_status=status,
             data_captured=data_captured,
             time_invested=time_invested,
-            engagement_score=engagement_score
+            engagement_score=engagement_score,
+            ssr_responses=ssr_responses
         )
-
-        # Add SSR responses to step if available
-        if ssr_responses:
-            step.ssr_responses = ssr_responses
+        hooks.emit("on_step", persona, step)
 
         return step
 
@@ -415,12 +465,13 @@ class JourneyGenerator:
 
             # Get response text (real LLM or simulated)
             if self.use_real_llm and self.llm_generator:
+                start = time.perf_counter()
                 try:
-                    response_text = self.llm_generator.generate_response(
-                        persona=persona.attributes,
+                    response_text = self._call_llm(
+                        persona=persona,
                         stimulus=stimulus,
                         scale_id=scale_id,
-                        phase=phase.name,
+                        phase=phase,
                         emotional_state=emotional_state,
                         engagement_score=engagement_score
                     )
@@ -429,6 +480,9 @@ class JourneyGenerator:
                     # Fallback to simulated
                     responses = self._simulate_llm_responses(persona, emotional_state, engagement_score)
                     response_text = responses.get(scale_id, responses.get('default', ''))
+                else:
+                    # Outside the try: a subscriber's exception is not an API error
+                    hooks.emit("on_llm_call", persona, scale_id, response_text, time.perf_counter() - start)
             else:
                 # Use simulated responses
                 responses = self._simulate_llm_responses(persona, emotional_state, engagement_score)
@@ -445,9 +499,55 @@ class JourneyGenerator:
             except Exception as e:
                 # Silently skip scales that fail
                 continue
+            hooks.emit("on_ssr_rating", persona, scale_id, ssr_response)
 
         return ssr_data
 
+    def _call_llm(
+        self,
+        persona: Persona,
+        stimulus: str,
+        scale_id: str,
+        phase: JourneyPhase,
+        emotional_state: str,
+        engagement_score: float
+    ) -> str:
+        """Get a free-text response from the LLM, routed to a model tier if configured"""
+        with profiling.stage("llm.call"):
+            return self._request_llm(persona, stimulus, scale_id, phase, emotional_state, engagement_score)
+
+    def _request_llm(
+        self,
+        persona: Persona,
+        stimulus: str,
+        scale_id: str,
+        phase: JourneyPhase,
+        emotional_state: str,
+        engagement_score: float
+    ) -> str:
+        """Route and send one LLM request (waits for a free tier slot)"""
+        if not self.model_router:
+            return self.llm_generator.generate_response(
+                persona=persona.attributes,
+                stimulus=stimulus,
+                scale_id=scale_id,
+                phase=phase.name,
+                emotional_state=emotional_state,
+                engagement_score=engagement_score
+            )
+
+        tier = self.model_router.route(scale_id, phase.name, persona.persona_type)
+        with self.model_router.slot(tier, scale_id):
+            return self.llm_generator.generate_response(
+                persona=persona.attributes,
+                stimulus=stimulus,
+                scale_id=scale_id,
+                phase=phase.name,
+                emotional_state=emotional_state,
+                engagement_score=engagement_score,
+                model=tier.model
+            )
+
     def _simulate_llm_responses(
         self,
         persona: Persona,
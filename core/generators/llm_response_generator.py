@@ -10,6 +10,8 @@ from typing import Dict, Optional
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from ..utils import profiling
+
 
 class LLMResponseGenerator:
     """
@@ -50,7 +52,8 @@ class LLMResponseGenerator:
         scale_id: str,
         phase: str,
         emotional_state: str,
-        engagement_score: float
+        engagement_score: float,
+        model: Optional[str] = None
     ) -> str:
         """
         Generate a persona-appropriate free-text response to a stimulus.
@@ -62,6 +65,7 @@ class LLMResponseGenerator:
             phase: Current journey phase name
             emotional_state: Current emotional state
             engagement_score: Engagement level (0-1)
+            model: Model override for this call (e.g. from a ModelRouter tier)
 
         Returns:
             Free-text response string
@@ -105,15 +109,21 @@ Question: {scale_prompt}
 Respond naturally as the persona described, reflecting your current emotional state and engagement level."""
 
         # Call Anthropic API
-        message = self.client.messages.create(
-            model=self.model,
-            max_tokens=200,
-            temperature=0.8,
-            system=system_prompt,
-            messages=[
-                {"role": "user", "content": user_prompt}
-            ]
-        )
+        with profiling.stage("llm.request"):
+            message = self.client.messages.create(
+                model=model or self.model,
+                max_tokens=200,
+                temperature=0.8,
+                system=system_prompt,
+                messages=[
+                    {"role": "user", "content": user_prompt}
+                ]
+            )
+        profiling.count("llm_requests")
+        usage = getattr(message, "usage", None)
+        if usage is not None:
+            profiling.count("llm_input_tokens", usage.input_tokens)
+            profiling.count("llm_output_tokens", usage.output_tokens)
 
         # Extract response text
         response_text = message.content[0].text
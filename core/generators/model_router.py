@@ -0,0 +1,245 @@
+"""
+Model tiering and routing for LLM scale prompts.
+
+Short Likert-style replies for scales such as "relevance" do not need the
+largest model. The router maps (scale_id, phase, persona_type) to a model
+tier defined in the project's config.yaml, caps concurrent calls per tier
+and records per-tier telemetry.
+
+Example config.yaml section:
+
+    llm:
+      default_tier: standard
+      tiers:
+        fast:
+          model: "claude-haiku-4-5-20251001"
+          max_concurrency: 16
+        standard:
+          model: "claude-sonnet-4-5-20250929"
+          max_concurrency: 4
+      routing:
+        - scale_id: relevance
+          tier: fast
+        - phase: mature_use
+          persona_type: department_head
+          tier: standard
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+
+WILDCARD = "*"
+
+
+@dataclass
+class ModelTier:
+    """A named model tier with its concurrency limit"""
+
+    name: str
+    model: str
+    max_concurrency: int = 4
+
+    def __post_init__(self):
+        if self.max_concurrency < 1:
+            raise ValueError(
+                f"Tier '{self.name}' max_concurrency must be >= 1, got {self.max_concurrency}"
+            )
+
+
+@dataclass
+class RoutingRule:
+    """Route matching scale/phase/persona combinations to a tier ("*" matches anything)"""
+
+    tier: str
+    scale_id: str = WILDCARD
+    phase: str = WILDCARD
+    persona_type: str = WILDCARD
+
+    def matches(self, scale_id: str, phase: str, persona_type: str) -> bool:
+        """Check whether this rule applies to a prompt"""
+        return (
+            self.scale_id in (WILDCARD, scale_id)
+            and self.phase in (WILDCARD, phase)
+            and self.persona_type in (WILDCARD, persona_type)
+        )
+
+
+@dataclass
+class TierTelemetry:
+    """Call counters and timings for a single tier"""
+
+    calls: int = 0
+    errors: int = 0
+    total_latency: float = 0.0  # seconds spent in the LLM call
+    total_wait: float = 0.0  # seconds spent waiting for a concurrency slot
+    in_flight: int = 0
+    max_in_flight: int = 0
+    by_scale: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert telemetry to dictionary"""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_latency": self.total_latency / self.calls if self.calls else 0.0,
+            "total_latency": self.total_latency,
+            "total_wait": self.total_wait,
+            "max_in_flight": self.max_in_flight,
+            "by_scale": dict(self.by_scale)
+        }
+
+
+class ModelRouter:
+    """Route LLM scale prompts to model tiers with per-tier concurrency limits"""
+
+    def __init__(
+        self,
+        tiers: Dict[str, ModelTier],
+        rules: Optional[List[RoutingRule]] = None,
+        default_tier: Optional[str] = None
+    ):
+        """
+        Initialize router
+
+        Args:
+            tiers: Tier definitions by name
+            rules: Ordered routing rules (first match wins)
+            default_tier: Tier used when no rule matches (defaults to the first tier)
+        """
+        if not tiers:
+            raise ValueError("ModelRouter requires at least one tier")
+
+        self.tiers = tiers
+        self.rules = rules or []
+        self.default_tier = default_tier or next(iter(tiers))
+
+        for tier_name in [self.default_tier] + [rule.tier for rule in self.rules]:
+            if tier_name not in self.tiers:
+                raise ValueError(
+                    f"Unknown model tier '{tier_name}'. Available: {list(self.tiers)}"
+                )
+
+        self._slots = {
+            name: threading.BoundedSemaphore(tier.max_concurrency)
+            for name, tier in self.tiers.items()
+        }
+        self._telemetry = {name: TierTelemetry() for name in self.tiers}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        llm_config: Dict[str, Any],
+        default_model: str = "claude-sonnet-4-5-20250929"
+    ) -> "ModelRouter":
+        """
+        Build a router from the `llm` section of a project config
+
+        Args:
+            llm_config: Parsed `llm` config section (may be empty)
+            default_model: Model for the implicit tier when no tiers are configured
+
+        Returns:
+            ModelRouter instance
+        """
+        tiers_config = llm_config.get("tiers") or {
+            "default": {"model": default_model}
+        }
+
+        tiers = {
+            name: ModelTier(
+                name=name,
+                model=tier_config["model"],
+                max_concurrency=tier_config.get("max_concurrency", 4)
+            )
+            for name, tier_config in tiers_config.items()
+        }
+
+        rules = [
+            RoutingRule(
+                tier=rule["tier"],
+                scale_id=rule.get("scale_id", WILDCARD),
+                phase=rule.get("phase", WILDCARD),
+                persona_type=rule.get("persona_type", WILDCARD)
+            )
+            for rule in llm_config.get("routing", [])
+        ]
+
+        return cls(tiers, rules, llm_config.get("default_tier"))
+
+    def route(self, scale_id: str, phase: str, persona_type: str) -> ModelTier:
+        """
+        Pick the model tier for a scale prompt
+
+        Args:
+            scale_id: Scale being measured
+            phase: Current journey phase name
+            persona_type: Persona type of the user
+
+        Returns:
+            Matching ModelTier
+        """
+        for rule in self.rules:
+            if rule.matches(scale_id, phase, persona_type):
+                return self.tiers[rule.tier]
+        return self.tiers[self.default_tier]
+
+    @contextmanager
+    def slot(self, tier: ModelTier, scale_id: str = "") -> Iterator[ModelTier]:
+        """
+        Hold a concurrency slot for a tier while an LLM call runs
+
+        Blocks until the tier has a free slot, then records latency and
+        errors for the wrapped call.
+
+        Args:
+            tier: Tier returned by route()
+            scale_id: Scale being measured (for per-scale call counts)
+        """
+        telemetry = self._telemetry[tier.name]
+        semaphore = self._slots[tier.name]
+
+        wait_start = time.perf_counter()
+        semaphore.acquire()
+        call_start = time.perf_counter()
+
+        with self._lock:
+            telemetry.total_wait += call_start - wait_start
+            telemetry.in_flight += 1
+            telemetry.max_in_flight = max(telemetry.max_in_flight, telemetry.in_flight)
+
+        failed = False
+        try:
+            yield tier
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - call_start
+            semaphore.release()
+            with self._lock:
+                telemetry.in_flight -= 1
+                telemetry.calls += 1
+                telemetry.total_latency += elapsed
+                if failed:
+                    telemetry.errors += 1
+                if scale_id:
+                    telemetry.by_scale[scale_id] = telemetry.by_scale.get(scale_id, 0) + 1
+
+    def get_telemetry(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-tier telemetry keyed by tier name"""
+        with self._lock:
+            return {
+                name: {"model": self.tiers[name].model, **telemetry.to_dict()}
+                for name, telemetry in self._telemetry.items()
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"ModelRouter(tiers={list(self.tiers)}, "
+            f"rules={len(self.rules)}, default={self.default_tier})"
+        )
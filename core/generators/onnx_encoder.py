@@ -0,0 +1,229 @@
+"""
+Quantized ONNX CPU backend for SSR sentence embeddings.
+
+Exports a sentence-transformers model (mean pooling, optional L2 normalize,
+e.g. all-MiniLM-L6-v2) to ONNX, applies int8 dynamic quantization and runs
+it through onnxruntime. OnnxSentenceEncoder.encode() matches the subset of
+SentenceTransformer.encode() that SSRResponseGenerator uses, so ResponseRater
+and get_response_pmfs are unchanged.
+
+Requires the optional packages: pip install onnx onnxruntime
+(sentence-transformers/torch are only needed for the one-off export).
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+
+# Under the repository root, so the export is shared whatever the working directory
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".synth_cache" / "onnx"
+
+INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+def export_quantized_model(
+    model_name: str,
+    output_dir: Union[str, Path],
+    opset_version: int = 14
+) -> Path:
+    """
+    Export a sentence-transformers model to int8-quantized ONNX
+
+    Args:
+        model_name: sentence-transformers model name (e.g. "all-MiniLM-L6-v2")
+        output_dir: Directory for model.onnx, model.int8.onnx, tokenizer and metadata
+        opset_version: ONNX opset to export with
+
+    Returns:
+        Path to the export directory
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+    from sentence_transformers.models import Normalize, Pooling
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    st_model = SentenceTransformer(model_name, device="cpu")
+    pooling = next((m for m in st_model if isinstance(m, Pooling)), None)
+    if pooling is None or pooling.get_pooling_mode_str() != "mean":
+        raise ValueError(f"ONNX backend only supports mean-pooling models, got: {model_name}")
+
+    transformer = st_model[0].auto_model.eval()
+    tokenizer = st_model.tokenizer
+    dummy = tokenizer(["export sentence"], return_tensors="pt")
+    input_names = [name for name in INPUT_NAMES if name in dummy]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    fp32_path = output_dir / "model.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer,
+            tuple(dummy[name] for name in input_names),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset_version
+        )
+
+    quantize_dynamic(str(fp32_path), str(output_dir / "model.int8.onnx"), weight_type=QuantType.QInt8)
+
+    tokenizer.save_pretrained(str(output_dir))
+    metadata = {
+        "model_name": model_name,
+        "input_names": input_names,
+        "max_seq_length": st_model.max_seq_length,
+        "normalize": any(isinstance(m, Normalize) for m in st_model)
+    }
+    with open(output_dir / "metadata.json", "w") as f:
+        json.dump(metadata, f, indent=2)
+
+    return output_dir
+
+
+class OnnxSentenceEncoder:
+    """Sentence encoder running a quantized ONNX export through onnxruntime"""
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        quantized: bool = True,
+        num_threads: Optional[int] = None
+    ):
+        """
+        Initialize encoder, exporting the model on first use
+
+        Args:
+            model_name: sentence-transformers model name
+            cache_dir: Directory holding exported models (one subdirectory per model)
+            quantized: Use the int8 model (False runs the fp32 export)
+            num_threads: onnxruntime intra-op threads (None = onnxruntime default)
+        """
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        self.model_name = model_name
+        self.export_dir = Path(cache_dir) / model_name.replace("/", "__")
+
+        if not (self.export_dir / "metadata.json").exists():
+            export_quantized_model(model_name, self.export_dir)
+
+        with open(self.export_dir / "metadata.json") as f:
+            self.metadata = json.load(f)
+
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.export_dir))
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+
+        model_file = "model.int8.onnx" if quantized else "model.onnx"
+        self.session = ort.InferenceSession(
+            str(self.export_dir / model_file),
+            options,
+            providers=["CPUExecutionProvider"]
+        )
+
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        **kwargs
+    ) -> np.ndarray:
+        """
+        Embed sentences (mean pooling over tokens, L2-normalized if the model is)
+
+        Args:
+            sentences: Sentences to embed
+            batch_size: Sentences per onnxruntime call
+            convert_to_numpy: Accepted for SentenceTransformer compatibility (always numpy)
+
+        Returns:
+            Array of shape (len(sentences), embedding_dim)
+        """
+        input_names = self.metadata["input_names"]
+        batches = []
+
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.metadata["max_seq_length"],
+                return_tensors="np"
+            )
+            feed = {name: tokens[name].astype(np.int64) for name in input_names}
+            hidden = self.session.run(["last_hidden_state"], feed)[0]
+
+            mask = tokens["attention_mask"][..., np.newaxis].astype(hidden.dtype)
+            embeddings = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+
+            if self.metadata["normalize"]:
+                norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+                embeddings = embeddings / np.clip(norms, 1e-12, None)
+
+            batches.append(embeddings.astype(np.float32))
+
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.concatenate(batches)
+
+    def __repr__(self) -> str:
+        return f"OnnxSentenceEncoder(model={self.model_name}, dir={self.export_dir})"
+
+
+def compare_backends(
+    reference_config_path: Union[str, Path],
+    texts: Optional[List[str]] = None,
+    model_name: str = "all-MiniLM-L6-v2",
+    tolerance: float = 0.05
+) -> Dict:
+    """
+    Compare SSR PMFs from the ONNX backend against the torch backend
+
+    Rates every text on every reference scale with both backends and
+    measures the L1 distance between the resulting PMFs.
+
+    Args:
+        reference_config_path: Path to the project's response_scales.yaml
+        texts: Responses to rate (default: every reference statement in the config)
+        model_name: Embedding model to compare
+        tolerance: Maximum allowed mean L1 distance per scale
+
+    Returns:
+        Dictionary with per-scale mean/max L1 distance and overall `passed` flag
+    """
+    from .ssr_response_generator import SSRResponseGenerator
+
+    torch_gen = SSRResponseGenerator(reference_config_path, model_name=model_name, device="cpu")
+    onnx_gen = SSRResponseGenerator(reference_config_path, model_name=model_name, backend="onnx")
+
+    if texts is None:
+        texts = [
+            point["statement"]
+            for scale in torch_gen.reference_config.values()
+            for point in scale.get("scale_points", {}).values()
+        ]
+
+    results = {}
+    for scale_id in torch_gen.available_scales:
+        torch_pmfs = torch_gen.rater.get_response_pmfs(scale_id, torch_gen._encode(texts))
+        onnx_pmfs = onnx_gen.rater.get_response_pmfs(scale_id, onnx_gen._encode(texts))
+        l1 = np.abs(np.asarray(torch_pmfs) - np.asarray(onnx_pmfs)).sum(axis=1)
+        results[scale_id] = {"mean_l1": float(l1.mean()), "max_l1": float(l1.max())}
+
+    return {
+        "tolerance": tolerance,
+        "n_texts": len(texts),
+        "scales": results,
+        "passed": all(r["mean_l1"] <= tolerance for r in results.values())
+    }
@@ -2,10 +2,12 @@
 
 import random
 import uuid
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from faker import Faker
 
-from ..models.persona import Persona, PersonaConfig
+from ..models.persona import CAPTURE_BEHAVIORS, ENGAGEMENT_LEVELS, Persona, PersonaConfig
+from ..models.vocabulary import Vocabulary
+from ..utils import hooks, profiling
 
 
 class PersonaGenerator:
@@ -30,29 +32,21 @@ class PersonaGenerator:
         }
     }
 
-    # Engagement stratification: 20% high, 60% standard, 20% low
-    ENGAGEMENT_LEVELS = {
-        'high': 0.20,
-        'standard': 0.60,
-        'low': 0.20
-    }
-
-    # Knowledge capture behaviors
-    CAPTURE_BEHAVIORS = {
-        'systematic': 0.25,
-        'opportunistic': 0.35,
-        'crisis_driven': 0.25,
-        'experimental': 0.15
-    }
+    # Engagement stratification and capture behaviors (shared with the vocabulary)
+    ENGAGEMENT_LEVELS = ENGAGEMENT_LEVELS
+    CAPTURE_BEHAVIORS = CAPTURE_BEHAVIORS
 
-    def __init__(self, persona_configs: Dict[str, PersonaConfig]):
+    def __init__(self, persona_configs: Dict[str, PersonaConfig], vocabulary: Optional[Vocabulary] = None):
         """
         Initialize generator with persona configurations
 
         Args:
             persona_configs: Dictionary mapping persona type to configuration
+            vocabulary: Categorical vocabulary whose strings personas share
+                (see ConfigLoader.load_vocabulary; an empty one by default)
         """
         self.configs = persona_configs
+        self.vocabulary = vocabulary or Vocabulary()
         self.fake = Faker()
 
         # Validate configurations
@@ -70,54 +64,117 @@ class PersonaGenerator:
         Returns:
             List of Persona instances
         """
-        personas = []
+        return list(self.iter_generate(count))
+
+    def iter_generate(
+        self,
+        count: int,
+        persona_counts: Optional[Dict[str, int]] = None,
+        engagement_tier_counts: Optional[Dict[str, int]] = None
+    ) -> Iterator[Persona]:
+        """
+        Lazily generate persona instances in shuffled order
 
-        # Calculate distribution
-        persona_counts = self._calculate_distribution(count)
+        Only the shuffled sequence of persona types is held in memory, so
+        streaming writers can consume personas one at a time.
 
-        # Generate personas for each type
-        for persona_type, target_count in persona_counts.items():
-            config = self.configs[persona_type]
+        Args:
+            count: Number of personas to generate
+            persona_counts: Exact number per persona type (e.g. a shard's
+                allocation); overrides the configured distribution
+            engagement_tier_counts: Exact number per engagement tier (e.g. a
+                top-up allocation); tiers are drawn from ENGAGEMENT_LEVELS otherwise
 
-            for _ in range(target_count):
-                persona = self._generate_single(persona_type, config)
-                personas.append(persona)
+        Yields:
+            Persona instances
+        """
+        # Calculate distribution
+        if persona_counts is None:
+            persona_counts = self._calculate_distribution(count)
+
+        # Shuffle the type sequence to avoid clustering by type
+        persona_types = [
+            persona_type
+            for persona_type, target_count in persona_counts.items()
+            for _ in range(target_count)
+        ]
+        random.shuffle(persona_types)
+
+        tiers: List[Optional[str]] = [None] * len(persona_types)
+        if engagement_tier_counts is not None:
+            tiers = [tier for tier, tier_count in engagement_tier_counts.items() for _ in range(tier_count)]
+            if len(tiers) != len(persona_types):
+                raise ValueError(
+                    f"Engagement tier counts sum to {len(tiers)}, expected {len(persona_types)} personas"
+                )
+            random.shuffle(tiers)
+
+        for persona_type, tier in zip(persona_types, tiers):
+            with profiling.stage("persona.generate"):
+                persona = self._generate_single(persona_type, self.configs[persona_type], tier)
+            profiling.count("personas")
+            hooks.emit("on_persona", persona)
+            yield persona
+
+    def persona_counts(self, count: int) -> Dict[str, int]:
+        """
+        Number of personas per type for a cohort of `count` users
 
-        # Shuffle to avoid clustering by type
-        random.shuffle(personas)
+        Args:
+            count: Cohort size
 
-        return personas
+        Returns:
+            Dictionary mapping persona type to count (sums to `count`)
+        """
+        return self._calculate_distribution(count)
+
+    def engagement_tier_counts(self, count: int) -> Dict[str, int]:
+        """Number of users per engagement tier for a cohort of `count` users"""
+        return _allocate(self.ENGAGEMENT_LEVELS, count)
+
+    def top_up_counts(
+        self,
+        existing_persona_counts: Dict[str, int],
+        existing_tier_counts: Dict[str, int],
+        count: int
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Allocate `count` new users so an existing cohort moves to its target mix
 
-    def _calculate_distribution(self, count: int) -> Dict[str, int]:
-        """Calculate how many of each persona type to generate"""
-        persona_counts = {}
-        remaining = count
-
-        # Sort by distribution to handle rounding consistently
-        sorted_types = sorted(
-            self.configs.items(),
-            key=lambda x: x[1].distribution,
-            reverse=True
-        )
+        Targets are the persona distribution and ENGAGEMENT_LEVELS for the
+        combined cohort size; the new users fill each group's deficit.
 
-        for i, (persona_type, config) in enumerate(sorted_types):
-            if i == len(sorted_types) - 1:
-                # Last persona gets remaining count
-                persona_counts[persona_type] = remaining
-            else:
-                target = round(count * config.distribution)
-                persona_counts[persona_type] = target
-                remaining -= target
+        Args:
+            existing_persona_counts: Users per persona type already generated
+            existing_tier_counts: Users per engagement tier already generated
+            count: Number of users to add
 
-        return persona_counts
+        Returns:
+            (persona counts, engagement tier counts) for the new users
+        """
+        total = sum(existing_persona_counts.values()) + count
+        persona_counts = allocate_deficit(self._calculate_distribution(total), existing_persona_counts, count)
+        tier_counts = allocate_deficit(self.engagement_tier_counts(total), existing_tier_counts, count)
+        return persona_counts, tier_counts
 
-    def _generate_single(self, persona_type: str, config: PersonaConfig) -> Persona:
+    def _calculate_distribution(self, count: int) -> Dict[str, int]:
+        """Calculate how many of each persona type to generate"""
+        return _allocate({persona_type: config.distribution for persona_type, config in self.configs.items()}, count)
+
+    def _generate_single(
+        self,
+        persona_type: str,
+        config: PersonaConfig,
+        engagement_tier: Optional[str] = None
+    ) -> Persona:
         """Generate a single persona instance with correlations"""
 
+        vocabulary = self.vocabulary
+
         # Generate demographics
         age = random.randint(config.age_range[0], config.age_range[1])
-        gender = self._weighted_choice(config.gender_distribution)
-        education = self._weighted_choice(config.education_distribution)
+        gender = vocabulary.intern("gender", self._weighted_choice(config.gender_distribution))
+        education = vocabulary.intern("education", self._weighted_choice(config.education_distribution))
 
         # Generate tech_comfort (needed for correlations)
         tech_comfort_range = config.tech_comfort if hasattr(config, 'tech_comfort') and config.tech_comfort else [0.5, 0.8]
@@ -148,15 +205,19 @@ class PersonaGenerator:
         attributes = self._generate_attributes(config, age, tech_comfort)
 
         # Add engagement stratification
-        attributes['engagement_tier'] = self._weighted_choice(self.ENGAGEMENT_LEVELS)
+        attributes['engagement_tier'] = vocabulary.intern(
+            "engagement_tier", engagement_tier or self._weighted_choice(self.ENGAGEMENT_LEVELS)
+        )
 
         # Add knowledge capture behavior
-        attributes['capture_behavior'] = self._weighted_choice(self.CAPTURE_BEHAVIORS)
+        attributes['capture_behavior'] = vocabulary.intern(
+            "capture_behavior", self._weighted_choice(self.CAPTURE_BEHAVIORS)
+        )
 
         # Create persona instance
         persona = Persona(
             id=str(uuid.uuid4()),
-            persona_type=persona_type,
+            persona_type=vocabulary.intern("persona_type", persona_type),
             config=config,
             age=age,
             gender=gender,
@@ -267,3 +328,42 @@ class PersonaGenerator:
         choices = list(distribution.keys())
         weights = list(distribution.values())
         return random.choices(choices, weights=weights)[0]
+
+
+def _allocate(distribution: Dict[str, float], count: int) -> Dict[str, int]:
+    """Round a distribution to non-negative integer counts summing to `count` (largest remainders)"""
+    total = sum(distribution.values())
+    shares = {key: count * share / total for key, share in distribution.items()}
+    counts = {key: int(share) for key, share in shares.items()}
+    # Rounding each share separately could leave the last key a negative remainder
+    by_remainder = sorted(shares, key=lambda key: shares[key] - counts[key], reverse=True)
+    for key in by_remainder[:count - sum(counts.values())]:
+        counts[key] += 1
+    return counts
+
+
+def allocate_deficit(targets: Dict[str, int], existing: Dict[str, int], count: int) -> Dict[str, int]:
+    """
+    Split `count` new items across groups in proportion to how far each is below target
+
+    Args:
+        targets: Target count per group for the combined population
+        existing: Current count per group
+        count: Number of new items
+
+    Returns:
+        New items per group (sums to `count`)
+    """
+    deficits = {key: max(0, target - existing.get(key, 0)) for key, target in targets.items()}
+    total_deficit = sum(deficits.values())
+    if total_deficit <= count:
+        # Only when nothing is above target (total_deficit == count)
+        return deficits
+
+    # Groups above target make total_deficit exceed count: scale down with largest remainders
+    shares = {key: deficit * count / total_deficit for key, deficit in deficits.items()}
+    allocation = {key: int(share) for key, share in shares.items()}
+    by_remainder = sorted(shares, key=lambda key: shares[key] - allocation[key], reverse=True)
+    for key in by_remainder[:count - sum(allocation.values())]:
+        allocation[key] += 1
+    return allocation
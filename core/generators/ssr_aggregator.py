@@ -0,0 +1,198 @@
+"""
+Streaming survey aggregation for SSR response PMFs.
+
+Folds PMFs into running sums per (scale_id, persona_type, phase,
+engagement_tier) as they are produced, so cohort-level SSR reports need
+O(groups) memory instead of keeping every response. State is mergeable
+(Chan et al. parallel variance) for sharded runs and serializes to plain
+JSON via to_state()/from_state().
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+
+GROUP_FIELDS = ("scale_id", "persona_type", "phase", "engagement_tier")
+
+GroupKey = Tuple[str, ...]
+
+
+@dataclass
+class _GroupState:
+    """Running sums for one group"""
+
+    n: int = 0
+    pmf_sum: List[float] = field(default_factory=list)
+    ev_mean: float = 0.0  # running mean of per-response expected values
+    ev_m2: float = 0.0  # sum of squared deviations of expected values
+
+    def add(self, pmf: Sequence[float]) -> None:
+        """Fold a single PMF into the group (Welford update)"""
+        if not self.pmf_sum:
+            self.pmf_sum = [0.0] * len(pmf)
+        elif len(pmf) != len(self.pmf_sum):
+            raise ValueError(f"PMF has {len(pmf)} points, expected {len(self.pmf_sum)}")
+
+        expected_value = 0.0
+        for i, p in enumerate(pmf):
+            p = float(p)
+            self.pmf_sum[i] += p
+            expected_value += p * (i + 1)
+
+        self.n += 1
+        delta = expected_value - self.ev_mean
+        self.ev_mean += delta / self.n
+        self.ev_m2 += delta * (expected_value - self.ev_mean)
+
+    def merge(self, other: "_GroupState") -> None:
+        """Combine another group's sums into this one"""
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.pmf_sum = other.n, list(other.pmf_sum)
+            self.ev_mean, self.ev_m2 = other.ev_mean, other.ev_m2
+            return
+
+        n = self.n + other.n
+        delta = other.ev_mean - self.ev_mean
+        self.ev_m2 += other.ev_m2 + delta * delta * self.n * other.n / n
+        self.ev_mean += delta * other.n / n
+        self.pmf_sum = [a + b for a, b in zip(self.pmf_sum, other.pmf_sum)]
+        self.n = n
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate PMF, mean and variances for the group"""
+        aggregate_pmf = [s / self.n for s in self.pmf_sum]
+        aggregate_mean = sum(p * (i + 1) for i, p in enumerate(aggregate_pmf))
+        aggregate_variance = sum(
+            p * ((i + 1) - aggregate_mean) ** 2 for i, p in enumerate(aggregate_pmf)
+        )
+        return {
+            "n_responses": self.n,
+            "aggregate_pmf": aggregate_pmf,
+            "aggregate_expected_value": aggregate_mean,
+            # Spread of the pooled rating distribution
+            "aggregate_variance": aggregate_variance,
+            # Spread of individual expected values across responses
+            "expected_value_variance": self.ev_m2 / self.n
+        }
+
+
+class SurveyAggregator:
+    """Online aggregator of SSR PMFs grouped by scale, persona, phase and engagement tier"""
+
+    def __init__(self):
+        """Initialize an empty aggregator"""
+        self._groups: Dict[GroupKey, _GroupState] = {}
+
+    def add(
+        self,
+        pmf: Sequence[float],
+        scale_id: str,
+        persona_type: str = "",
+        phase: str = "",
+        engagement_tier: str = ""
+    ) -> None:
+        """
+        Fold one response PMF into its group
+
+        Args:
+            pmf: Probability distribution across the scale points
+            scale_id: Scale the response was rated on
+            persona_type: Persona type of the respondent
+            phase: Journey phase name
+            engagement_tier: Engagement tier of the respondent
+        """
+        key = (scale_id, persona_type, phase, engagement_tier)
+        state = self._groups.get(key)
+        if state is None:
+            state = self._groups[key] = _GroupState()
+        state.add(pmf)
+
+    def add_step_responses(
+        self,
+        ssr_responses: Dict[str, Dict[str, Any]],
+        persona_type: str,
+        phase: str,
+        engagement_tier: str
+    ) -> None:
+        """Fold every scale response of a journey step (as produced by JourneyGenerator)"""
+        for scale_id, response in ssr_responses.items():
+            self.add(response["pmf"], scale_id, persona_type, phase, engagement_tier)
+
+    def merge(self, other: "SurveyAggregator") -> "SurveyAggregator":
+        """Merge another aggregator (e.g. from another shard) into this one"""
+        for key, other_state in other._groups.items():
+            state = self._groups.get(key)
+            if state is None:
+                state = self._groups[key] = _GroupState()
+            state.merge(other_state)
+        return self
+
+    def results(self, group_by: Iterable[str] = GROUP_FIELDS) -> Dict[GroupKey, Dict[str, Any]]:
+        """
+        Get aggregate statistics, optionally rolled up to coarser groups
+
+        Args:
+            group_by: Subset of GROUP_FIELDS to keep, e.g. ("scale_id",) for
+                per-scale totals or ("scale_id", "persona_type")
+
+        Returns:
+            Dictionary mapping group key tuples to aggregate PMF, expected
+            value, variances and response counts
+        """
+        group_by = tuple(group_by)
+        unknown = set(group_by) - set(GROUP_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown group fields {sorted(unknown)}. Available: {GROUP_FIELDS}")
+
+        indices = [GROUP_FIELDS.index(name) for name in group_by]
+        rolled_up: Dict[GroupKey, _GroupState] = {}
+        for key, state in self._groups.items():
+            target_key = tuple(key[i] for i in indices)
+            target = rolled_up.get(target_key)
+            if target is None:
+                target = rolled_up[target_key] = _GroupState()
+            target.merge(state)
+
+        return {key: state.summary() for key, state in rolled_up.items()}
+
+    @property
+    def n_responses(self) -> int:
+        """Total responses folded in"""
+        return sum(state.n for state in self._groups.values())
+
+    def to_state(self) -> Dict[str, Any]:
+        """Serialize running sums (JSON-compatible) for merging across shards"""
+        return {
+            "group_fields": list(GROUP_FIELDS),
+            "groups": [
+                {
+                    "key": list(key),
+                    "n": state.n,
+                    "pmf_sum": state.pmf_sum,
+                    "ev_mean": state.ev_mean,
+                    "ev_m2": state.ev_m2
+                }
+                for key, state in self._groups.items()
+            ]
+        }
+
+    @classmethod
+    def from_state(cls, data: Dict[str, Any]) -> "SurveyAggregator":
+        """Restore an aggregator from to_state() output"""
+        aggregator = cls()
+        for group in data["groups"]:
+            aggregator._groups[tuple(group["key"])] = _GroupState(
+                n=group["n"],
+                pmf_sum=list(group["pmf_sum"]),
+                ev_mean=group["ev_mean"],
+                ev_m2=group["ev_m2"]
+            )
+        return aggregator
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __repr__(self) -> str:
+        return f"SurveyAggregator(groups={len(self._groups)}, responses={self.n_responses})"
@@ -10,12 +10,16 @@ Elicitation of Likert Ratings" (Maier et al., 2025)
 """
 
 import polars as po
-import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Union
 import numpy as np
 from semantic_similarity_rating import ResponseRater
 
+from ..utils import profiling
+from ..utils.config_loader import parse_yaml
+from .embedding_registry import EmbeddingModelRegistry, shared_registry
+from .ssr_aggregator import SurveyAggregator
+
 
 class SSRResponseGenerator:
     """
@@ -28,7 +32,9 @@ class SSRResponseGenerator:
     Attributes
     ----------
     rater : ResponseRater
-        The underlying SSR rater instance
+        The underlying SSR rater instance (embedding mode)
+    encoder : SentenceTransformer or OnnxSentenceEncoder
+        Embedding model shared through the model registry
     reference_config : Dict
         Loaded reference scale configurations
     available_scales : List[str]
@@ -50,7 +56,9 @@ class SSRResponseGenerator:
         self,
         reference_config_path: Union[str, Path],
         model_name: str = "all-MiniLM-L6-v2",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        registry: Optional[EmbeddingModelRegistry] = None,
+        backend: str = "torch"
     ):
         """
         Initialize with reference statements from YAML config.
@@ -63,22 +71,38 @@ class SSRResponseGenerator:
             SentenceTransformer model to use, by default "all-MiniLM-L6-v2"
         device : str, optional
             Device to run the model on ('cpu', 'cuda', etc.), by default None (auto-detect)
+        registry : EmbeddingModelRegistry, optional
+            Registry to get the embedding model from, by default the
+            process-wide shared registry
+        backend : str, optional
+            Embedding backend: "torch" (sentence-transformers) or "onnx"
+            (int8-quantized onnxruntime, CPU only), by default "torch"
         """
         self.reference_config_path = Path(reference_config_path)
         self.reference_config = self._load_reference_config()
+        self.model_name = model_name
+        self.device = device
+        self.backend = backend
+
+        with profiling.stage("ssr.load"):
+            # One model per (model_name, device, backend) is shared by every generator
+            self.encoder = (registry or shared_registry).get(model_name, device, backend)
+
+            # Build polars DataFrame for ResponseRater with precomputed embeddings
+            df_refs = self._build_reference_dataframe()
+            df_refs = df_refs.with_columns(
+                po.Series("embedding", list(self._encode(df_refs["sentence"].to_list())))
+            )
 
-        # Build polars DataFrame for ResponseRater
-        df_refs = self._build_reference_dataframe()
-
-        # Initialize ResponseRater in text mode
-        self.rater = ResponseRater(
-            df_refs,
-            model_name=model_name,
-            device=device
-        )
+        # Initialize ResponseRater in embedding mode so it does not load its own model
+        self.rater = ResponseRater(df_refs, embeddings_column="embedding")
 
         self.available_scales = self.rater.available_reference_sets
 
+    def _encode(self, sentences: List[str]) -> np.ndarray:
+        """Embed sentences with the shared model."""
+        return self.encoder.encode(sentences, convert_to_numpy=True)
+
     def _load_reference_config(self) -> Dict:
         """Load reference scale configurations from YAML file."""
         if not self.reference_config_path.exists():
@@ -87,7 +111,7 @@ class SSRResponseGenerator:
             )
 
         with open(self.reference_config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = parse_yaml(f)
 
         if not config:
             raise ValueError(f"Empty config file: {self.reference_config_path}")
@@ -201,12 +225,16 @@ class SSRResponseGenerator:
             )
 
         # Convert to PMF using SSR
-        pmf = self.rater.get_response_pmfs(
-            reference_set_id=scale_id,
-            llm_responses=[llm_response],
-            temperature=temperature,
-            epsilon=epsilon
-        )[0]  # Get first (only) response
+        with profiling.stage("ssr.embed"):
+            embedding = self._encode([llm_response])
+        with profiling.stage("ssr.pmf"):
+            pmf = self.rater.get_response_pmfs(
+                reference_set_id=scale_id,
+                llm_responses=embedding,
+                temperature=temperature,
+                epsilon=epsilon
+            )[0]  # Get first (only) response
+        profiling.count("ssr_responses")
 
         # Calculate expected value (mean)
         scale_points = np.arange(1, 6)
@@ -278,35 +306,48 @@ class SSRResponseGenerator:
 
     def get_survey_aggregate(
         self,
-        response_pmfs: List[np.ndarray]
+        response_pmfs: Iterable[np.ndarray],
+        include_individual: bool = True
     ) -> Dict:
         """
         Aggregate multiple response PMFs into survey-level statistics.
 
+        PMFs are folded one at a time, so a generator can be passed to
+        aggregate a large cohort without materializing every PMF. For
+        grouped (per persona/phase/tier) cohort reports use
+        SurveyAggregator directly.
+
         Parameters
         ----------
-        response_pmfs : List[np.ndarray]
-            List of PMF arrays
+        response_pmfs : Iterable[np.ndarray]
+            PMF arrays (any iterable, consumed once)
+        include_individual : bool, optional
+            Also return every individual expected value (O(responses)
+            memory), by default True
 
         Returns
         -------
         Dict
-            Survey-level statistics including aggregate PMF and expected value
+            Survey-level statistics including aggregate PMF, expected value
+            and variances
         """
-        pmfs_array = np.array(response_pmfs)
-        aggregate_pmf = self.rater.get_survey_response_pmf(pmfs_array)
-
+        aggregator = SurveyAggregator()
+        individual_expected_values = []
         scale_points = np.arange(1, 6)
-        expected_value = np.dot(aggregate_pmf, scale_points)
 
-        return {
-            "aggregate_pmf": aggregate_pmf.tolist(),
-            "aggregate_expected_value": float(expected_value),
-            "n_responses": len(response_pmfs),
-            "individual_expected_values": [
-                float(np.dot(pmf, scale_points)) for pmf in response_pmfs
-            ]
-        }
+        for pmf in response_pmfs:
+            aggregator.add(pmf, scale_id="survey")
+            if include_individual:
+                individual_expected_values.append(float(np.dot(pmf, scale_points)))
+
+        if aggregator.n_responses == 0:
+            raise ValueError("Cannot aggregate an empty set of responses")
+
+        summary = aggregator.results(group_by=())[()]
+        if include_individual:
+            summary["individual_expected_values"] = individual_expected_values
+
+        return summary
 
     def _summarize_persona(self, persona_config: Dict) -> str:
         """Create a brief summary string from persona config."""
@@ -356,5 +397,5 @@ class SSRResponseGenerator:
         return (
             f"SSRResponseGenerator("
             f"scales={len(self.available_scales)}, "
-            f"model={self.rater.model_info})"
+            f"model={self.model_name}, backend={self.backend}, device={self.device})"
         )
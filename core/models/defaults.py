@@ -0,0 +1,62 @@
+"""
+Shared immutable defaults for model fields.
+
+Most steps never get narrative responses or SSR ratings, and most users
+carry no metadata. Rather than allocating an empty dict/list per instance,
+such fields default to EMPTY_DICT / EMPTY_LIST: one shared, read-only
+instance each. They compare equal to {} / [] and serialize like them.
+
+Fields holding a shared default are replaced, not mutated:
+
+    step.narrative_responses = {"reflection": text}      # fine
+    step.narrative_responses["reflection"] = text        # TypeError
+"""
+
+from typing import Any, NoReturn
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"{type(self).__name__} is a shared default; assign a new container to the field instead"
+    )
+
+
+class FrozenDict(dict):
+    """Read-only dict (dict subclass so json, orjson and msgspec encode it natively)"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self):
+        # The shared instance unpickles as itself (e.g. in shard workers)
+        return "EMPTY_DICT" if self is EMPTY_DICT else (type(self), (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only list"""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self):
+        return "EMPTY_LIST" if self is EMPTY_LIST else (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+EMPTY_DICT = FrozenDict()
+EMPTY_LIST = FrozenList()
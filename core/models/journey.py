@@ -5,6 +5,13 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 from enum import Enum
 
+from .defaults import EMPTY_DICT, EMPTY_LIST
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Accept isoformat strings (JSON datasets) or datetimes (Parquet datasets)"""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
 
 class JourneyType(Enum):
     """Type of journey progression"""
@@ -21,7 +28,7 @@ class CompletionStatus(Enum):
     ABANDONED = "abandoned"
 
 
-@dataclass
+@dataclass(slots=True)
 class JourneyPhase:
     """A single phase in a user journey"""
 
@@ -31,16 +38,16 @@ class JourneyPhase:
 
     # Phase configuration
     objectives: List[str]
-    emotional_objectives: List[str] = field(default_factory=list)
-    data_to_collect: List[str] = field(default_factory=list)
+    emotional_objectives: List[str] = EMPTY_LIST
+    data_to_collect: List[str] = EMPTY_LIST
 
     # Completion criteria
     completion_threshold: float = 0.7
     duration_estimate: Optional[str] = None  # e.g., "1 week", "3 sessions"
 
     # Phase-specific content
-    narrative_prompts: List[str] = field(default_factory=list)
-    verification_questions: List[str] = field(default_factory=list)
+    narrative_prompts: List[str] = EMPTY_LIST
+    verification_questions: List[str] = EMPTY_LIST
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert phase to dictionary"""
@@ -54,8 +61,24 @@ class JourneyPhase:
             "completion_threshold": self.completion_threshold
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JourneyPhase":
+        """Create phase from dictionary (phase config or JourneyPhase.to_dict())"""
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            order=data["order"],
+            objectives=data.get("objectives") or EMPTY_LIST,
+            emotional_objectives=data.get("emotional_objectives") or EMPTY_LIST,
+            data_to_collect=data.get("data_to_collect") or EMPTY_LIST,
+            completion_threshold=data.get("completion_threshold", 0.7),
+            duration_estimate=data.get("duration_estimate"),
+            narrative_prompts=data.get("narrative_prompts") or EMPTY_LIST,
+            verification_questions=data.get("verification_questions") or EMPTY_LIST
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class JourneyStep:
     """A step within a journey phase (e.g., a single session or week)"""
 
@@ -70,16 +93,19 @@ class JourneyStep:
     completion_status: CompletionStatus
 
     # Collected data
-    data_captured: Dict[str, Any] = field(default_factory=dict)
-    narrative_responses: Dict[str, str] = field(default_factory=dict)
+    data_captured: Dict[str, Any] = EMPTY_DICT
+    narrative_responses: Dict[str, str] = EMPTY_DICT
 
     # Engagement metrics
     time_invested: Optional[int] = None  # minutes
     engagement_score: Optional[float] = None
 
+    # SSR ratings by scale_id (only populated when SSR is enabled)
+    ssr_responses: Dict[str, Dict[str, Any]] = EMPTY_DICT
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert step to dictionary"""
-        return {
+        data = {
             "id": self.id,
             "phase_id": self.phase_id,
             "step_number": self.step_number,
@@ -92,9 +118,30 @@ class JourneyStep:
             "time_invested": self.time_invested,
             "engagement_score": self.engagement_score
         }
+        if self.ssr_responses:
+            data["ssr_responses"] = self.ssr_responses
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JourneyStep":
+        """Create step from dictionary (JourneyStep.to_dict())"""
+        return cls(
+            id=data["id"],
+            phase_id=data["phase_id"],
+            step_number=data["step_number"],
+            timestamp=_as_datetime(data["timestamp"]),
+            actions=data.get("actions", []),
+            emotional_state=data["emotional_state"],
+            completion_status=CompletionStatus(data["completion_status"]),
+            data_captured=data.get("data_captured") or EMPTY_DICT,
+            narrative_responses=data.get("narrative_responses") or EMPTY_DICT,
+            time_invested=data.get("time_invested"),
+            engagement_score=data.get("engagement_score"),
+            ssr_responses=data.get("ssr_responses") or EMPTY_DICT
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Journey:
     """Complete user journey through all phases"""
 
@@ -135,18 +182,69 @@ class Journey:
         total_possible = len(self.phases) * 10  # Assume ~10 steps per phase
         self.overall_completion = min(completed_steps / total_possible, 1.0)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert journey to dictionary"""
-        return {
+    def to_dict(self, include_phases: bool = True) -> Dict[str, Any]:
+        """
+        Convert journey to dictionary
+
+        Args:
+            include_phases: Embed full phase definitions; when False only
+                phase ids are emitted (normalized datasets keep the phase
+                definitions once in the dataset header)
+        """
+        data = {
             "id": self.id,
             "user_id": self.user_id,
             "persona_type": self.persona_type,
             "journey_type": self.journey_type.value,
-            "phases": [p.to_dict() for p in self.phases],
+        }
+        if include_phases:
+            data["phases"] = [p.to_dict() for p in self.phases]
+        else:
+            data["phase_ids"] = [p.id for p in self.phases]
+        data.update({
             "steps": [s.to_dict() for s in self.steps],
             "current_phase": self.current_phase,
             "overall_completion": self.overall_completion,
             "started_at": self.started_at.isoformat(),
             "last_activity": self.last_activity.isoformat() if self.last_activity else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None
-        }
+        })
+        return data
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        phases: Optional[Dict[str, JourneyPhase]] = None
+    ) -> "Journey":
+        """
+        Create journey from dictionary (Journey.to_dict())
+
+        Args:
+            data: Journey dictionary, legacy (embedded "phases") or
+                normalized ("phase_ids")
+            phases: Phases by id used to resolve "phase_ids" (and shared
+                between journeys instead of one copy per journey)
+        """
+        if "phase_ids" in data:
+            journey_phases = [phases[phase_id] for phase_id in data["phase_ids"]] if phases else []
+        elif phases:
+            journey_phases = [phases.get(p["id"]) or JourneyPhase.from_dict(p) for p in data.get("phases", [])]
+        else:
+            journey_phases = [JourneyPhase.from_dict(p) for p in data.get("phases", [])]
+
+        last_activity = data.get("last_activity")
+        completed_at = data.get("completed_at")
+        return cls(
+            id=data["id"],
+            user_id=data["user_id"],
+            persona_type=data["persona_type"],
+            journey_type=JourneyType(data["journey_type"]),
+            phases=journey_phases,
+            steps=[JourneyStep.from_dict(step) for step in data.get("steps", [])],
+            current_phase=data.get("current_phase", 0),
+            overall_completion=data.get("overall_completion", 0.0),
+            started_at=_as_datetime(data["started_at"]),
+            last_activity=_as_datetime(last_activity) if last_activity else None,
+            completed_at=_as_datetime(completed_at) if completed_at else None
+        )
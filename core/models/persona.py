@@ -1,9 +1,11 @@
 """Persona data models"""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Any, Optional
 from enum import Enum
 
+from .defaults import EMPTY_DICT, EMPTY_LIST
+
 
 class EngagementPattern(Enum):
     """Common engagement patterns across domains"""
@@ -15,7 +17,23 @@ class EngagementPattern(Enum):
     EXPLORATORY = "exploratory"
 
 
-@dataclass
+# Engagement stratification: 20% high, 60% standard, 20% low
+ENGAGEMENT_LEVELS = {
+    'high': 0.20,
+    'standard': 0.60,
+    'low': 0.20
+}
+
+# Knowledge capture behaviors
+CAPTURE_BEHAVIORS = {
+    'systematic': 0.25,
+    'opportunistic': 0.35,
+    'crisis_driven': 0.25,
+    'experimental': 0.15
+}
+
+
+@dataclass(slots=True)
 class PersonaConfig:
     """Configuration for a persona archetype"""
 
@@ -34,16 +52,16 @@ class PersonaConfig:
     anxiety_level: Optional[Tuple[float, float]] = None
 
     # Domain-specific attributes (flexible)
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = EMPTY_DICT
 
     # Journey completion thresholds
-    completion_thresholds: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    completion_thresholds: Dict[str, Tuple[float, float]] = EMPTY_DICT
 
     # Emotional states
-    emotional_progression: List[str] = field(default_factory=list)
+    emotional_progression: List[str] = EMPTY_LIST
 
     # Narrative patterns
-    narrative_style: Dict[str, Any] = field(default_factory=dict)
+    narrative_style: Dict[str, Any] = EMPTY_DICT
 
     def validate(self) -> bool:
         """Validate persona configuration"""
@@ -54,7 +72,7 @@ class PersonaConfig:
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class Persona:
     """An instantiated persona with specific characteristics"""
 
@@ -73,7 +91,7 @@ class Persona:
     anxiety_level: Optional[float] = None
 
     # Domain-specific data
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = EMPTY_DICT
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert persona to dictionary"""
@@ -88,3 +106,25 @@ class Persona:
             "anxiety_level": self.anxiety_level,
             "attributes": self.attributes
         }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], config: Optional[PersonaConfig] = None) -> "Persona":
+        """
+        Create persona from dictionary (Persona.to_dict() or UserProfile.to_dict())
+
+        Args:
+            data: Persona or user dictionary
+            config: Archetype configuration to attach (not stored in datasets)
+        """
+        return cls(
+            id=data["id"],
+            persona_type=data["persona_type"],
+            config=config,
+            age=data["age"],
+            gender=data["gender"],
+            education=data["education"],
+            engagement_level=data["engagement_level"],
+            action_tendency=data["action_tendency"],
+            anxiety_level=data.get("anxiety_level"),
+            attributes=data.get("attributes") or EMPTY_DICT
+        )
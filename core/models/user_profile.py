@@ -1,12 +1,14 @@
 """User profile model"""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, Any, Optional
 from datetime import datetime
 import uuid
 
+from .defaults import EMPTY_DICT
 
-@dataclass
+
+@dataclass(slots=True)
 class UserProfile:
     """Complete user profile combining persona and journey data"""
 
@@ -27,13 +29,13 @@ class UserProfile:
     anxiety_level: Optional[float] = None
 
     # Domain-specific attributes
-    attributes: Dict[str, Any] = field(default_factory=dict)
+    attributes: Dict[str, Any] = EMPTY_DICT
 
     # Journey reference
     journey_id: Optional[str] = None
 
     # Metadata
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Dict[str, Any] = EMPTY_DICT
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert user profile to dictionary"""
@@ -56,11 +58,12 @@ class UserProfile:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UserProfile":
-        """Create user profile from dictionary"""
-        profile = cls()
-        for key, value in data.items():
-            if key == "created_at" and isinstance(value, str):
-                value = datetime.fromisoformat(value)
-            if hasattr(profile, key):
-                setattr(profile, key, value)
-        return profile
+        """Create user profile from dictionary (unknown keys such as "journey" are ignored)"""
+        kwargs = {key: value for key, value in data.items() if key in _FIELD_NAMES}
+        created_at = kwargs.get("created_at")
+        if isinstance(created_at, str):
+            kwargs["created_at"] = datetime.fromisoformat(created_at)
+        return cls(**kwargs)
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(UserProfile))
@@ -0,0 +1,119 @@
+"""
+Categorical vocabularies for low-cardinality string fields.
+
+persona_type, phase_id, emotional_state, gender, ... take a handful of
+values across a whole cohort. A Vocabulary holds, per field, the one
+canonical string for each value and a small integer code:
+
+    vocabulary = ConfigLoader(project_path).load_vocabulary()
+    code = vocabulary.encode("emotional_state", "curious")    # int
+    vocabulary.decode("emotional_state", code)                # "curious"
+    vocabulary.intern("gender", text)                         # shared str
+
+Codes follow the project configuration order and are stable for a given
+project. Categories are open: values missing from the configuration (e.g.
+in a dataset generated from an older config) are appended on first use.
+Model attributes hold the interned strings, so every object references the
+same str as every other; codes are used by the columnar exporters, which
+write dictionary indices instead of repeating the strings in every row.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+
+CATEGORICAL_FIELDS = (
+    "persona_type",
+    "phase_id",
+    "emotional_state",
+    "completion_status",
+    "engagement_tier",
+    "capture_behavior",
+    "gender",
+    "education",
+    "action",
+)
+
+
+class Category:
+    """Values of one categorical field, coded 0..n-1 in insertion order"""
+
+    __slots__ = ("name", "values", "codes")
+
+    def __init__(self, name: str, values: Iterable[str] = ()):
+        self.name = name
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.extend(values)
+
+    def encode(self, value: str) -> int:
+        """Code of a value (unseen values are added)"""
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def decode(self, code: int) -> str:
+        """Value of a code"""
+        return self.values[code]
+
+    def intern(self, value: str) -> str:
+        """Canonical instance of a value"""
+        return self.values[self.encode(value)]
+
+    def extend(self, values: Iterable[str]) -> None:
+        """Add values that are not in the category yet"""
+        for value in values:
+            self.encode(value)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self.codes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __repr__(self) -> str:
+        return f"Category({self.name}, values={len(self.values)})"
+
+
+class Vocabulary:
+    """Categories for every field in CATEGORICAL_FIELDS"""
+
+    def __init__(self, categories: Optional[Mapping[str, Iterable[str]]] = None):
+        """
+        Initialize vocabulary
+
+        Args:
+            categories: Initial values by field name (fields not given start empty)
+        """
+        self.categories = {name: Category(name) for name in CATEGORICAL_FIELDS}
+        for name, values in (categories or {}).items():
+            self[name].extend(values)
+
+    def __getitem__(self, name: str) -> Category:
+        if name not in self.categories:
+            raise KeyError(f"Unknown categorical field '{name}'. Available: {list(self.categories)}")
+        return self.categories[name]
+
+    def encode(self, name: str, value: str) -> int:
+        """Code of a field value"""
+        return self[name].encode(value)
+
+    def decode(self, name: str, code: int) -> str:
+        """Field value of a code"""
+        return self[name].decode(code)
+
+    def intern(self, name: str, value: str) -> str:
+        """Canonical instance of a field value"""
+        return self[name].intern(value)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Values by field, in code order"""
+        return {name: list(category.values) for name, category in self.categories.items()}
+
+    def __repr__(self) -> str:
+        sizes = ", ".join(f"{name}={len(category)}" for name, category in self.categories.items())
+        return f"Vocabulary({sizes})"
@@ -0,0 +1,5 @@
+"""Local HTTP service for on-demand generation"""
+
+from .server import GenerationService, ServiceError
+
+__all__ = ["GenerationService", "ServiceError"]
@@ -0,0 +1,480 @@
+"""
+Local HTTP generation service.
+
+`python cli.py serve` starts an asyncio HTTP server that keeps each
+project's configuration and generators warm, so a request pays for
+generation only - not interpreter startup, YAML parsing or (with SSR)
+loading the embedding model:
+
+    GET /generate?project=private_language&count=100&seed=42[&ssr=1]
+        -> application/x-ndjson, one user (with journey) per line, streamed
+    GET /health
+        -> {"projects": [...warm projects...], "generations": n, ...}
+
+A request is planned like a sharded dataset (core.dataset.shards): its
+users are split into chunks with seeds drawn from the request seed, and
+the chunks run on a bounded pool of worker processes that keep their own
+warm generators. Chunks are streamed in order as they complete; a chunk is
+dropped once every client streaming it has read it, and a generation
+pauses while its slowest client is a full window of chunks behind, so a
+slow client holds a bounded amount of memory. Identical seeded requests
+that arrive while one is being generated are coalesced, as long as none of
+its chunks has been dropped yet: they all stream the same chunks from a
+single generation. Without a seed every request is generated on its own
+(the seed used is returned in the X-Synth-Seed header).
+
+On Linux the workers are forked when the server starts, after the
+projects passed to `preload` are warmed, so they inherit their parsed
+configuration and SSR model copy-on-write.
+"""
+
+import asyncio
+import json
+import math
+import multiprocessing
+import random
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Warm generators of this process: (project path, ssr, ssr backend) -> CohortGenerator
+_GENERATORS: Dict[Tuple[str, bool, str], Any] = {}
+# The service builds generators on executor threads
+_GENERATORS_LOCK = threading.Lock()
+
+FlightKey = Tuple[str, int, int, bool]  # (project, count, seed, ssr)
+
+
+def warm_generator(project_path: Union[str, Path], ssr: bool = False, ssr_backend: str = "torch"):
+    """CohortGenerator for a project, built once per process"""
+    from ..generators.cohort_generator import CohortGenerator
+
+    key = (str(project_path), ssr, ssr_backend)
+    with _GENERATORS_LOCK:
+        generator = _GENERATORS.get(key)
+        if generator is None:
+            generator = _GENERATORS[key] = CohortGenerator(
+                project_path, enable_ssr=ssr, ssr_backend=ssr_backend
+            )
+    return generator
+
+
+def generate_chunk(
+    project_path: str,
+    ssr: bool,
+    start: int,
+    count: int,
+    seed: int,
+    persona_counts: Dict[str, int],
+    ssr_backend: str = "torch"
+) -> bytes:
+    """
+    Generate one chunk of users as JSONL (runs in a worker process)
+
+    Returns:
+        UTF-8 encoded lines, each terminated by a newline
+    """
+    from ..dataset.codec import get_serializer
+
+    serializer = get_serializer()
+    cohort = warm_generator(project_path, ssr, ssr_backend)
+    lines = [
+        serializer.encode_user(user, journey)
+        for user, journey in cohort.iter_models(count, persona_counts, start, seed)
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+
+def _limit_worker_threads() -> None:
+    """Worker initializer: one intra-op thread per worker (see embedding_registry)"""
+    from ..generators.embedding_registry import _limit_worker_threads as limit
+
+    limit()
+
+
+class ServiceError(Exception):
+    """Request error reported to the client with an HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Flight:
+    """One generation in progress; every coalesced request streams its chunks"""
+
+    def __init__(self, seed: int, limit: int):
+        """
+        Initialize flight
+
+        Args:
+            seed: Seed of the generation
+            limit: Chunks the slowest reader may fall behind before the
+                producer waits (see `wait_for_room`)
+        """
+        self.seed = seed
+        self.limit = limit
+        # Published chunks not yet read by every reader; chunks[0] is chunk `offset`
+        self.chunks: Deque[bytes] = deque()
+        self.offset = 0
+        self.positions: Dict[int, int] = {}  # reader -> next chunk it reads
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Condition()
+        self._readers = 0
+
+    @property
+    def joinable(self) -> bool:
+        """A new reader can still stream every chunk"""
+        return self.offset == 0 and not self.done
+
+    async def publish(self, chunk: bytes) -> None:
+        async with self.changed:
+            self.chunks.append(chunk)
+            self._trim()
+            self.changed.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None) -> None:
+        async with self.changed:
+            self.error = error
+            self.done = True
+            self.changed.notify_all()
+
+    async def wait_for_room(self) -> bool:
+        """
+        Wait until fewer than `limit` chunks are unread by the slowest reader
+
+        Returns:
+            False once every reader has gone (the generation can stop)
+        """
+        async with self.changed:
+            await self.changed.wait_for(lambda: len(self.chunks) < self.limit or self.abandoned)
+            return not self.abandoned
+
+    @property
+    def abandoned(self) -> bool:
+        """Readers attached and all of them have gone"""
+        return self._readers > 0 and not self.positions
+
+    def stream(self) -> AsyncIterator[bytes]:
+        """
+        Attach a reader and yield chunks in order, waiting for ones still being generated
+
+        Close the iterator (aclose) when the client goes away, so its
+        chunks are dropped and the producer stops waiting for it.
+        """
+        reader = self._readers
+        self._readers += 1
+        self.positions[reader] = self.offset
+        return self._read(reader)
+
+    async def _read(self, reader: int) -> AsyncIterator[bytes]:
+        try:
+            while True:
+                async with self.changed:
+                    await self.changed.wait_for(
+                        lambda: self.positions[reader] < self.offset + len(self.chunks) or self.done
+                    )
+                    position = self.positions[reader]
+                    if position < self.offset + len(self.chunks):
+                        chunk = self.chunks[position - self.offset]
+                    elif self.error is not None:
+                        raise self.error
+                    else:
+                        return
+                    self.positions[reader] = position + 1
+                    self._trim()
+                    self.changed.notify_all()
+                yield chunk
+        finally:
+            async with self.changed:
+                del self.positions[reader]
+                self._trim()
+                self.changed.notify_all()
+
+    def _trim(self) -> None:
+        """Drop the chunks every reader has read (called holding `changed`)"""
+        if not self._readers:
+            return
+        read = min(self.positions.values(), default=self.offset + len(self.chunks))
+        while self.offset < read:
+            self.chunks.popleft()
+            self.offset += 1
+
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class GenerationService:
+    """Serve on-demand generation over HTTP from warm generators"""
+
+    def __init__(
+        self,
+        projects_dir: Union[str, Path] = "projects",
+        workers: Optional[int] = None,
+        chunk_size: int = 500,
+        max_count: int = 100_000,
+        executor: Optional[Executor] = None,
+        ssr_backend: str = "torch"
+    ):
+        """
+        Initialize service
+
+        Args:
+            projects_dir: Directory holding the projects (projects/<name>)
+            workers: Worker processes generating chunks (default: CPU count)
+            chunk_size: Users per chunk (the unit of parallelism and streaming)
+            max_count: Largest count a request may ask for
+            executor: Executor for chunks (default: a process pool of `workers`)
+            ssr_backend: SSR embedding backend for ssr=1 requests ('torch' or 'onnx')
+        """
+        self.projects_dir = Path(projects_dir)
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.max_count = max_count
+        self.ssr_backend = ssr_backend
+        # Chunks in flight per generation: enough to keep every worker busy
+        self.window = self.workers * 2
+        self.generations = 0
+        self.coalesced = 0
+
+        self._executor = executor
+        self._flights: Dict[FlightKey, _Flight] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Worker pool, created on first use (by `start`, after `preload`)"""
+        if self._executor is None:
+            context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=context, initializer=_limit_worker_threads
+            )
+        return self._executor
+
+    def project_path(self, name: str) -> Path:
+        """Directory of a served project"""
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            raise ServiceError(400, f"Invalid project name '{name}'")
+        path = self.projects_dir / name
+        if not path.is_dir():
+            raise ServiceError(404, f"Project not found: {name}")
+        return path
+
+    def preload(self, projects: Iterable[str], ssr: bool = False) -> None:
+        """Warm projects (and with ssr, their SSR model) before `start` forks the workers"""
+        for name in projects:
+            warm_generator(self.project_path(name), ssr, self.ssr_backend)
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Start the workers, then listen (port 0 picks a free port, see `address`)"""
+        # Fork the workers before any socket is open: a worker forked while
+        # serving would inherit client connections and keep them from closing
+        await asyncio.get_running_loop().run_in_executor(self.executor, _limit_worker_threads)
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """(host, port) the server listens on"""
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Start and serve until cancelled"""
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and shut the worker pool down"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one request per connection"""
+        try:
+            request_line = await reader.readline()
+            # Headers are not used; read up to the blank line
+            while (await reader.readline()).strip():
+                pass
+
+            try:
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+            except ValueError:
+                raise ServiceError(400, "Malformed request line")
+            url = urlsplit(target)
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+            if method != "GET":
+                raise ServiceError(405, f"Method not allowed: {method}")
+            if url.path == "/generate":
+                await self._generate(params, writer)
+            elif url.path == "/health":
+                await self._send_json(writer, 200, self.health())
+            else:
+                raise ServiceError(404, f"Unknown path: {url.path}")
+
+        except ServiceError as e:
+            await self._send_json(writer, e.status, {"error": str(e)})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def health(self) -> Dict[str, Any]:
+        """Warm projects and request counters"""
+        return {
+            "projects": sorted({Path(path).name for path, _, _ in _GENERATORS}),
+            "workers": self.workers,
+            "generations": self.generations,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
+
+    async def _generate(self, params: Dict[str, str], writer: asyncio.StreamWriter) -> None:
+        """Stream the users of one /generate request"""
+        project_path = self.project_path(params.get("project", ""))
+        count = _int_param(params, "count", 100)
+        if not 0 < count <= self.max_count:
+            raise ServiceError(400, f"count must be between 1 and {self.max_count}")
+        seed = _int_param(params, "seed", None)
+        ssr = params.get("ssr", "0").lower() in ("1", "true", "yes")
+
+        flight = await self._flight(project_path, count, seed, ssr)
+        chunks = flight.stream()
+        try:
+            try:
+                first = await chunks.__anext__()
+            except StopAsyncIteration:
+                first = b""
+            except Exception as e:
+                raise ServiceError(500, f"Generation failed: {e}")
+
+            writer.write(self._head(200, "application/x-ndjson", {
+                "Transfer-Encoding": "chunked",
+                "X-Synth-Seed": str(flight.seed),
+            }))
+            await self._send_chunk(writer, first)
+            # Errors after the first chunk end the response without the final chunk
+            async for chunk in chunks:
+                await self._send_chunk(writer, chunk)
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            # Detach, so a client that went away does not hold chunks or stall the generation
+            await chunks.aclose()
+
+    async def _flight(self, project_path: Path, count: int, seed: Optional[int], ssr: bool) -> _Flight:
+        """Join an identical seeded generation in progress, or start one"""
+        key = None
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        else:
+            key = (str(project_path), count, seed, ssr)
+            flight = self._join(key)
+            if flight is not None:
+                return flight
+
+        # Persona counts need the project's generator (workers warm their own),
+        # but not its SSR model: only `preload` loads that here, before the fork.
+        # Building it parses YAML: keep it off the event loop
+        from ..dataset.shards import plan_shards
+
+        try:
+            generator = await asyncio.get_running_loop().run_in_executor(None, warm_generator, project_path)
+            persona_counts = generator.persona_gen.persona_counts(count)
+        except (ImportError, ValueError, AssertionError) as e:
+            raise ServiceError(400, f"Cannot generate for {project_path.name}: {e}")
+        specs = plan_shards(persona_counts, math.ceil(count / self.chunk_size), seed)
+
+        if key is not None:
+            # An identical request may have started while the generator was built
+            flight = self._join(key)
+            if flight is not None:
+                return flight
+
+        flight = _Flight(seed, self.window)
+        if key is not None:
+            self._flights[key] = flight
+        self.generations += 1
+        asyncio.get_running_loop().create_task(self._produce(key, flight, project_path, ssr, specs))
+        return flight
+
+    def _join(self, key: FlightKey) -> Optional[_Flight]:
+        """Identical generation in progress whose chunks can all still be streamed"""
+        flight = self._flights.get(key)
+        if flight is None or not flight.joinable:
+            return None
+        self.coalesced += 1
+        return flight
+
+    async def _produce(self, key: Optional[FlightKey], flight: _Flight, project_path: Path, ssr: bool, specs) -> None:
+        """Run a generation's chunks on the pool, publishing them in order"""
+        loop = asyncio.get_running_loop()
+        pending: Deque[asyncio.Future] = deque()
+        error = None
+        try:
+            for spec in specs:
+                # Paced by the slowest reader: at most a window of chunks waits to be read
+                if not await flight.wait_for_room():
+                    break  # every client went away
+                pending.append(loop.run_in_executor(
+                    self.executor, generate_chunk,
+                    str(project_path), ssr, spec.start, spec.count, spec.seed, spec.persona_counts,
+                    self.ssr_backend
+                ))
+                if len(pending) >= self.window:
+                    await flight.publish(await pending.popleft())
+            else:
+                while pending:
+                    await flight.publish(await pending.popleft())
+        except Exception as e:
+            error = e
+        finally:
+            for future in pending:
+                future.cancel()
+            if key is not None and self._flights.get(key) is flight:
+                del self._flights[key]
+            await flight.finish(error)
+
+    @staticmethod
+    def _head(status: int, content_type: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Status line and headers (one request per connection)"""
+        lines = [f"HTTP/1.1 {status} {STATUS_TEXT[status]}", f"Content-Type: {content_type}", "Connection: close"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        writer.write(self._head(status, "application/json", {"Content-Length": str(len(data))}) + data)
+        await writer.drain()
+
+    @staticmethod
+    async def _send_chunk(writer: asyncio.StreamWriter, chunk: bytes) -> None:
+        if chunk:
+            writer.write(f"{len(chunk):x}\r\n".encode("latin-1") + chunk + b"\r\n")
+            await writer.drain()
+
+    def __repr__(self) -> str:
+        return f"GenerationService(projects_dir={self.projects_dir}, workers={self.workers})"
+
+
+def _int_param(params: Dict[str, str], name: str, default: Optional[int]) -> Optional[int]:
+    """Integer query parameter"""
+    if name not in params:
+        return default
+    try:
+        return int(params[name])
+    except ValueError:
+        raise ServiceError(400, f"{name} must be an integer, got '{params[name]}'")
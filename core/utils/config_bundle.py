@@ -0,0 +1,198 @@
+"""
+Compiled, validated project configuration bundles.
+
+`python cli.py compile <project>` parses and validates the seven project
+YAML files once and writes <project>/config.bundle: the parsed documents
+plus the SHA-256 of every source file, pickled into one compact file.
+ConfigLoader loads the bundle instead of parsing YAML and refuses it
+(StaleBundleError) when a source file was edited, added or removed since
+the bundle was compiled.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+from .config_loader import ConfigLoader, parse_yaml
+
+
+BUNDLE_NAME = "config.bundle"
+BUNDLE_FORMAT = "synth.config_bundle"
+BUNDLE_VERSION = 1
+
+PROJECT_FILES = (
+    "config.yaml",
+    "personas.yaml",
+    "journey_phases.yaml",
+    "emotional_states.yaml",
+    "narrative_patterns.yaml",
+    "data_schema.yaml",
+    "response_scales.yaml",
+)
+
+
+class StaleBundleError(ValueError):
+    """A compiled bundle no longer matches its project's YAML files"""
+
+
+def bundle_path(project_path: Union[str, Path]) -> Path:
+    """Compiled bundle file of a project"""
+    return Path(project_path) / BUNDLE_NAME
+
+
+def file_hash(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of a source file"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def validate_documents(project_path: Union[str, Path], documents: Dict[str, Any]) -> List[str]:
+    """
+    Validate parsed project files
+
+    Args:
+        project_path: Project directory (for messages and persona parsing)
+        documents: Parsed document by file name (PROJECT_FILES)
+
+    Returns:
+        Warnings (problems that do not stop generation)
+
+    Raises:
+        ValueError: Listing every error found
+    """
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    for name in PROJECT_FILES:
+        if name not in documents:
+            errors.append(f"{name}: file not found")
+        elif not isinstance(documents[name], dict) or not documents[name]:
+            errors.append(f"{name}: expected a non-empty mapping")
+    if errors:
+        raise ValueError(f"Invalid project {project_path}:\n  " + "\n  ".join(errors))
+
+    if not documents["config.yaml"].get("name"):
+        errors.append("config.yaml: missing 'name'")
+
+    personas = documents["personas.yaml"].get("personas")
+    if not isinstance(personas, dict) or not personas:
+        errors.append("personas.yaml: expected a non-empty 'personas' mapping")
+        personas = {}
+    else:
+        try:
+            configs = ConfigLoader(project_path, use_bundle=False)._build_personas(documents["personas.yaml"])
+        except (KeyError, TypeError, ValueError) as e:
+            errors.append(f"personas.yaml: cannot parse personas ({e!r})")
+            configs = {}
+        for persona_type, config in configs.items():
+            try:
+                config.validate()
+            except AssertionError as e:
+                errors.append(f"personas.yaml: {persona_type}: {e}")
+        total = sum(config.distribution for config in configs.values())
+        if configs and abs(total - 1.0) > 0.01:
+            warnings.append(f"personas.yaml: persona distributions sum to {total:.2f}, not 1.0")
+
+    phases = documents["journey_phases.yaml"].get("phases")
+    if not isinstance(phases, list) or not phases:
+        errors.append("journey_phases.yaml: expected a non-empty 'phases' list")
+    else:
+        for i, phase in enumerate(phases):
+            if not isinstance(phase, dict) or not phase.get("name"):
+                errors.append(f"journey_phases.yaml: phase {i + 1} has no 'name'")
+            elif not isinstance(phase.get("objectives", []), list):
+                errors.append(f"journey_phases.yaml: {phase['name']}: 'objectives' must be a list")
+
+    progressions = documents["emotional_states.yaml"].get("emotional_progressions")
+    if not isinstance(progressions, dict):
+        errors.append("emotional_states.yaml: expected an 'emotional_progressions' mapping")
+    else:
+        for persona_type, by_phase in progressions.items():
+            if not isinstance(by_phase, dict) or not all(isinstance(s, list) for s in by_phase.values()):
+                errors.append(f"emotional_states.yaml: {persona_type}: expected lists of states per phase")
+            elif personas and persona_type not in personas:
+                warnings.append(f"emotional_states.yaml: {persona_type} is not a persona type")
+
+    if not isinstance(documents["narrative_patterns.yaml"].get("patterns"), dict):
+        errors.append("narrative_patterns.yaml: expected a 'patterns' mapping")
+
+    for scale_name, scale in documents["response_scales.yaml"].items():
+        points = scale.get("scale_points") if isinstance(scale, dict) else None
+        if not isinstance(points, dict) or {int(k) for k in points} != set(range(1, 6)):
+            errors.append(f"response_scales.yaml: {scale_name}: scale_points must be exactly 1-5")
+        elif not all(isinstance(p, dict) and p.get("statement") for p in points.values()):
+            errors.append(f"response_scales.yaml: {scale_name}: every scale point needs a 'statement'")
+
+    if errors:
+        raise ValueError(f"Invalid project {project_path}:\n  " + "\n  ".join(errors))
+    return warnings
+
+
+def compile_bundle(project_path: Union[str, Path]) -> Tuple[Path, List[str]]:
+    """
+    Validate a project and write its compiled bundle
+
+    Args:
+        project_path: Project directory
+
+    Returns:
+        (bundle path, validation warnings)
+
+    Raises:
+        ValueError: The project configuration is invalid (nothing is written)
+    """
+    project_path = Path(project_path)
+    documents: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    for path in sorted(project_path.glob("*.yaml")):
+        data = path.read_bytes()
+        sources[path.name] = hashlib.sha256(data).hexdigest()
+        documents[path.name] = parse_yaml(data)
+
+    warnings = validate_documents(project_path, documents)
+
+    bundle = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "sources": sources,
+        "documents": documents,
+    }
+    path = bundle_path(project_path)
+    partial = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(partial, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(partial, path)
+    return path, warnings
+
+
+def load_bundle(path: Union[str, Path], project_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a compiled bundle after checking it against the project's YAML files
+
+    Args:
+        path: Bundle file
+        project_path: Project directory the bundle was compiled from
+
+    Returns:
+        Parsed document by file name
+
+    Raises:
+        StaleBundleError: A source file changed, appeared or disappeared
+    """
+    with open(path, "rb") as f:
+        bundle = pickle.load(f)
+    if bundle.get("format") != BUNDLE_FORMAT or bundle.get("version") != BUNDLE_VERSION:
+        raise StaleBundleError(f"{path} is not a version {BUNDLE_VERSION} config bundle")
+
+    current = {source.name: file_hash(source) for source in Path(project_path).glob("*.yaml")}
+    if current != bundle["sources"]:
+        changed = sorted(
+            name for name in set(current) | set(bundle["sources"])
+            if current.get(name) != bundle["sources"].get(name)
+        )
+        raise StaleBundleError(
+            f"{path} is stale ({', '.join(changed)} changed since it was compiled); "
+            f"rerun: python cli.py compile {Path(project_path).name}"
+        )
+    return bundle["documents"]
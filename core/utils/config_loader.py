@@ -1,28 +1,108 @@
-"""Load project configurations from YAML files"""
+"""
+Load project configurations from YAML files
 
+Parsed YAML documents are memoized per file for the whole process and
+re-parsed only when the file's mtime or size changes; objects built from
+them (PersonaConfig, the vocabulary, ...) are memoized per loader. Treat
+everything a ConfigLoader returns as read-only.
+
+A project compiled with `python cli.py compile <project>` has a validated
+bundle (core.utils.config_bundle) that is loaded instead of the YAML files;
+a bundle whose recorded source hashes no longer match is refused. Without
+one, a loader given a snapshot directory (opt-in: `cli.py generate
+--config-cache`, and a temporary one for shard workers) keeps a compiled
+snapshot of the project: every YAML document pickled into one file named
+after the content hash of the project's YAML files. Cold starts and worker
+processes load the snapshot instead of parsing YAML; any edit to the
+configuration changes the hash, so a stale snapshot is never read, and
+writing a new snapshot removes the project's older ones. Snapshots are
+pickles: only point a loader at a directory you trust.
+
+YAML is parsed with libyaml's CSafeLoader when PyYAML was built with it.
+"""
+
+import hashlib
+import os
+import pickle
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional, Tuple, TypeVar, Union
+
+from ..models.persona import CAPTURE_BEHAVIORS, ENGAGEMENT_LEVELS, PersonaConfig
+from ..models.journey import CompletionStatus, JourneyType
+from ..models.vocabulary import Vocabulary
+
+
+DEFAULT_SNAPSHOT_DIR = Path(".synth_cache") / "config"
+
+T = TypeVar("T")
+
+# libyaml's C loader is several times faster than the pure-Python SafeLoader
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML shared by all loaders: path -> ((mtime_ns, size), document)
+_DOCUMENTS: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def config_hash(project_path: Union[str, Path]) -> str:
+    """
+    Hash a project's YAML configuration
 
-from ..models.persona import PersonaConfig
-from ..models.journey import JourneyType
+    Args:
+        project_path: Project directory
+
+    Returns:
+        SHA-256 hex digest over the file names and contents
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(project_path).glob("*.yaml")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def parse_yaml(stream: Any) -> Any:
+    """Parse a YAML document (safe loader, C-accelerated when available)"""
+    return yaml.load(stream, Loader=YamlLoader)
+
+
+def _stamp(file_path: Path) -> Tuple[int, int]:
+    """Modification time and size of a file (changes invalidate its parsed document)"""
+    stat = file_path.stat()
+    return stat.st_mtime_ns, stat.st_size
 
 
 class ConfigLoader:
     """Load and parse project configuration files"""
 
-    def __init__(self, project_path: Path):
+    def __init__(
+        self,
+        project_path: Path,
+        snapshot_dir: Optional[Union[str, Path]] = None,
+        use_bundle: bool = True
+    ):
         """
         Initialize config loader for a project
 
         Args:
             project_path: Path to project directory
+            snapshot_dir: Directory for compiled snapshots of the parsed
+                configuration (e.g. DEFAULT_SNAPSHOT_DIR); None parses YAML
+            use_bundle: Load the project's compiled bundle when it has one
+                (raises StaleBundleError if the YAML changed since compiling)
         """
         self.project_path = Path(project_path)
+        self.snapshot_dir = Path(snapshot_dir) if snapshot_dir is not None else None
+        self.use_bundle = use_bundle
 
         if not self.project_path.exists():
             raise FileNotFoundError(f"Project path does not exist: {project_path}")
 
+        # Built objects by name, with the documents they were built from
+        self._built: Dict[str, Tuple[Tuple[Any, ...], Any]] = {}
+        self._bundle_checked = not use_bundle
+        self._snapshot_checked = False
+
     def load_config(self) -> Dict[str, Any]:
         """Load main project configuration"""
         config_file = self.project_path / "config.yaml"
@@ -30,9 +110,10 @@ class ConfigLoader:
 
     def load_personas(self) -> Dict[str, PersonaConfig]:
         """Load persona configurations"""
-        personas_file = self.project_path / "personas.yaml"
-        data = self._load_yaml(personas_file)
+        return self._memoized("personas", ("personas.yaml",), self._build_personas)
 
+    def _build_personas(self, data: Dict[str, Any]) -> Dict[str, PersonaConfig]:
+        """Parse every persona of personas.yaml"""
         personas = {}
         for persona_id, persona_data in data["personas"].items():
             config = self._parse_persona_config(persona_id, persona_data)
@@ -63,6 +144,55 @@ class ConfigLoader:
         schema_file = self.project_path / "data_schema.yaml"
         return self._load_yaml(schema_file)
 
+    def load_model_routing(self) -> Dict[str, Any]:
+        """Load LLM model tiers and routing rules (empty if not configured)"""
+        config = self.load_config()
+        return config.get("llm", {}) or {}
+
+    def load_vocabulary(self) -> Vocabulary:
+        """
+        Build the categorical vocabulary of the project
+
+        Values are taken from personas.yaml (persona types, genders,
+        education levels), journey_phases.yaml (phase ids, objectives as
+        actions) and emotional_states.yaml, plus the fixed completion
+        statuses, engagement tiers and capture behaviors.
+        """
+        return self._memoized(
+            "vocabulary",
+            ("personas.yaml", "journey_phases.yaml", "emotional_states.yaml"),
+            self._build_vocabulary
+        )
+
+    def _build_vocabulary(
+        self,
+        personas_data: Dict[str, Any],
+        phases_data: Dict[str, Any],
+        emotions_data: Dict[str, Any]
+    ) -> Vocabulary:
+        """Collect categorical values from the parsed project files"""
+        personas = personas_data["personas"]
+        phases = phases_data.get("phases", [])
+        emotional_states = emotions_data.get("emotional_progressions", {})
+
+        demographics = [persona.get("demographics", {}) for persona in personas.values()]
+        return Vocabulary({
+            "persona_type": personas,
+            "phase_id": [f"phase_{i+1}" for i in range(len(phases))],
+            "emotional_state": [
+                state
+                for by_phase in emotional_states.values()
+                for states in by_phase.values()
+                for state in states
+            ],
+            "completion_status": [status.value for status in CompletionStatus],
+            "engagement_tier": ENGAGEMENT_LEVELS,
+            "capture_behavior": CAPTURE_BEHAVIORS,
+            "gender": [gender for d in demographics for gender in d.get("gender_distribution", {})],
+            "education": [level for d in demographics for level in d.get("education_distribution", {})],
+            "action": [objective for phase in phases for objective in phase.get("objectives", [])],
+        })
+
     def get_journey_type(self) -> JourneyType:
         """Get journey type from config"""
         config = self.load_config()
@@ -75,13 +205,105 @@ class ConfigLoader:
         else:
             return JourneyType.SESSION_BASED
 
+    def _memoized(self, name: str, file_names: Tuple[str, ...], build: Callable[..., T]) -> T:
+        """Build an object from project files once, rebuilding when one of them changes"""
+        documents = tuple(self._load_yaml(self.project_path / file_name) for file_name in file_names)
+        cached = self._built.get(name)
+        if cached is not None and all(old is new for old, new in zip(cached[0], documents)):
+            return cached[1]
+
+        built = build(*documents)
+        self._built[name] = (documents, built)
+        return built
+
     def _load_yaml(self, file_path: Path) -> Dict[str, Any]:
-        """Load and parse a YAML file"""
+        """Load and parse a YAML file (memoized until the file changes)"""
         if not file_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {file_path}")
 
+        file_path = file_path.resolve()
+        stamp = _stamp(file_path)
+        cached = _DOCUMENTS.get(file_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        if not self._bundle_checked:
+            self._bundle_checked = True
+            self._load_bundle()
+            cached = _DOCUMENTS.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+        if self.snapshot_dir is not None and not self._snapshot_checked:
+            self._snapshot_checked = True
+            self._load_snapshot()
+            cached = _DOCUMENTS.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
         with open(file_path, 'r') as f:
-            return yaml.safe_load(f)
+            document = parse_yaml(f)
+        _DOCUMENTS[file_path] = (stamp, document)
+        return document
+
+    def _load_bundle(self) -> None:
+        """Seed the document cache from the project's compiled bundle, if any"""
+        from .config_bundle import bundle_path, load_bundle
+
+        bundle = bundle_path(self.project_path)
+        if not bundle.exists():
+            return
+
+        # Stamped before the bundle's hashes are checked: a later edit only costs a re-parse
+        stamps = {path.resolve(): _stamp(path) for path in self.project_path.glob("*.yaml")}
+        documents = load_bundle(bundle, self.project_path)
+        for path, stamp in stamps.items():
+            if path.name in documents:
+                _DOCUMENTS[path] = (stamp, documents[path.name])
+
+    def snapshot_path(self) -> Path:
+        """Compiled snapshot file for the current configuration"""
+        if self.snapshot_dir is None:
+            raise ValueError("ConfigLoader was created without a snapshot_dir")
+        digest = config_hash(self.project_path)
+        return self.snapshot_dir / f"{self.project_path.resolve().name}-{digest[:16]}.pickle"
+
+    def _load_snapshot(self) -> None:
+        """Seed the document cache from the compiled snapshot, writing it if missing"""
+        files = sorted(path.resolve() for path in self.project_path.glob("*.yaml"))
+        # Stamped before hashing: an edit in between only costs a re-parse
+        stamps = {path: _stamp(path) for path in files}
+        snapshot = self.snapshot_path()
+
+        try:
+            with open(snapshot, "rb") as f:
+                documents = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            documents = None
+
+        if documents is None:
+            documents = {}
+            for path in files:
+                with open(path, 'r') as f:
+                    documents[path.name] = parse_yaml(f)
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name so concurrent workers never read a partial file
+            partial = snapshot.with_name(f"{snapshot.name}.{os.getpid()}.tmp")
+            with open(partial, "wb") as f:
+                pickle.dump(documents, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(partial, snapshot)
+            self._prune_snapshots(snapshot)
+
+        for path in files:
+            if path.name in documents:
+                _DOCUMENTS[path] = (stamps[path], documents[path.name])
+
+    def _prune_snapshots(self, current: Path) -> None:
+        """Remove this project's snapshots of earlier configurations"""
+        digest = "[0-9a-f]" * 16
+        for old in current.parent.glob(f"{self.project_path.resolve().name}-{digest}.pickle"):
+            if old != current:
+                old.unlink(missing_ok=True)
 
     def _parse_persona_config(
         self,
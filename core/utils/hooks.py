@@ -0,0 +1,210 @@
+"""
+Event hooks for the generation pipeline.
+
+Subscribers observe what the generators produce as it is produced, for
+instrumentation, export or validation without post-processing the final
+records:
+
+    from core.utils import hooks
+
+    def check_step(persona, step):
+        assert step.time_invested <= 60
+
+    hooks.subscribe("on_step", check_step)                        # inline
+    hooks.subscribe("on_journey_complete", export, background=True)  # worker thread
+
+Events and their arguments:
+
+    on_persona            (persona)                            a persona was generated
+    on_step               (persona, step)                      a journey step was created
+    on_journey_complete   (persona, journey)                   a journey and all its steps
+    on_llm_call           (persona, scale_id, text, seconds)   an LLM response (real LLM mode)
+    on_ssr_rating         (persona, scale_id, response)        an SSR rating of one step
+
+Inline subscribers run in the generating thread, in subscription order,
+and their exceptions propagate (a validator can stop a run). Background
+subscribers receive events through a bounded queue on their own thread:
+events are handed over in batches, a full queue blocks the generator
+(or, with drop_when_full, drops the batch and counts its events), and
+the first exception is re-raised on close.
+
+Generators call emit(), which with no subscriber for the event costs a
+function call and a dict lookup (`python -m benchmarks.hook_overhead`).
+Subscribers are per process: shard workers and service workers do not
+see the parent's subscriptions.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+EVENTS = ("on_persona", "on_step", "on_journey_complete", "on_llm_call", "on_ssr_rating")
+
+# Event -> subscribers; replaced, never mutated, so emit() needs no lock
+_subscribers: Dict[str, Tuple[Callable[..., Any], ...]] = {}
+_lock = threading.Lock()
+
+_STOP = object()
+
+
+class BackgroundSubscriber:
+    """
+    Run a subscriber on a worker thread, fed through a bounded queue
+
+    Events are handed over in batches of `batch_size`: waking the worker
+    for every event would cost more than most subscribers. close() hands
+    over the last partial batch.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        maxsize: int = 10_000,
+        drop_when_full: bool = False,
+        batch_size: int = 256
+    ):
+        """
+        Initialize subscriber and start its thread
+
+        Args:
+            callback: Called with each event's arguments
+            maxsize: Events buffered before the generator blocks (or drops)
+            drop_when_full: Drop events when the queue is full instead of blocking
+            batch_size: Events handed to the worker at a time
+        """
+        self.callback = callback
+        self.drop_when_full = drop_when_full
+        self.batch_size = max(1, min(batch_size, maxsize))
+        self.dropped = 0
+        self.error: Optional[BaseException] = None
+        self._pending: List[Tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._queue: "queue.Queue" = queue.Queue(max(1, maxsize // self.batch_size))
+        self._thread = threading.Thread(target=self._run, name=f"hook-{getattr(callback, '__name__', 'subscriber')}",
+                                        daemon=True)
+        self._thread.start()
+
+    def __call__(self, *args: Any) -> None:
+        with self._pending_lock:
+            self._pending.append(args)
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+            self._put(batch)
+
+    def _put(self, batch: List[Tuple[Any, ...]]) -> None:
+        if self.drop_when_full:
+            try:
+                self._queue.put_nowait(batch)
+            except queue.Full:
+                self.dropped += len(batch)
+        else:
+            self._queue.put(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is _STOP:
+                return
+            if self.error is not None:
+                continue
+            try:
+                for args in batch:
+                    self.callback(*args)
+            except BaseException as e:
+                # Later events are discarded; close() reports the failure
+                self.error = e
+
+    def close(self) -> None:
+        """
+        Process the queued events and stop the thread
+
+        Raises:
+            Exception: The first exception raised by the callback
+        """
+        if self._thread.is_alive():
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._queue.put(batch)
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __repr__(self) -> str:
+        return f"BackgroundSubscriber({getattr(self.callback, '__name__', self.callback)!r}, dropped={self.dropped})"
+
+
+def subscribe(
+    event: str,
+    callback: Callable[..., Any],
+    background: bool = False,
+    queue_size: int = 10_000,
+    drop_when_full: bool = False
+) -> Callable[..., Any]:
+    """
+    Call `callback` on every `event`
+
+    Args:
+        event: One of EVENTS
+        callback: Called with the event's arguments
+        background: Run on a worker thread instead of inline
+        queue_size: Background queue bound
+        drop_when_full: Drop events instead of blocking when the background queue is full
+
+    Returns:
+        The registered subscriber (pass it to unsubscribe; a
+        BackgroundSubscriber when background=True)
+
+    Raises:
+        ValueError: Unknown event
+    """
+    if event not in EVENTS:
+        raise ValueError(f"Unknown hook event '{event}'. Available: {list(EVENTS)}")
+    subscriber = BackgroundSubscriber(callback, queue_size, drop_when_full) if background else callback
+    with _lock:
+        _subscribers[event] = _subscribers.get(event, ()) + (subscriber,)
+    return subscriber
+
+
+def unsubscribe(event: str, subscriber: Callable[..., Any]) -> None:
+    """
+    Remove a subscriber (a background one is drained and stopped)
+
+    Raises:
+        Exception: The first exception raised by a background subscriber
+    """
+    with _lock:
+        remaining = tuple(s for s in _subscribers.get(event, ()) if s is not subscriber)
+        if remaining:
+            _subscribers[event] = remaining
+        else:
+            _subscribers.pop(event, None)
+    if isinstance(subscriber, BackgroundSubscriber):
+        subscriber.close()
+
+
+@contextmanager
+def subscribed(event: str, callback: Callable[..., Any], **options: Any):
+    """
+    Subscribe for the duration of a block (see subscribe for the options)
+
+    Yields:
+        The registered subscriber
+    """
+    subscriber = subscribe(event, callback, **options)
+    try:
+        yield subscriber
+    finally:
+        unsubscribe(event, subscriber)
+
+
+def emit(event: str, *args: Any) -> None:
+    """Call the subscribers of an event (returns at once when there are none)"""
+    subscribers = _subscribers.get(event)
+    if subscribers:
+        for subscriber in subscribers:
+            subscriber(*args)
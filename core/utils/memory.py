@@ -0,0 +1,236 @@
+"""
+Process memory measurement and generation memory budgets.
+
+rss_bytes() reads the resident set size of this process; RssSampler
+records its peak from a background thread while a block of code runs.
+retained_bytes() counts the memory a group of objects keeps alive.
+MemoryBudget projects a generation run's memory from the RSS growth
+observed so far and stops it early (MemoryBudgetExceeded) when the
+projection for the whole cohort exceeds the budget
+(`cli.py generate --memory-budget 2G`).
+
+Measure bytes per persona, journey step and SSR response with
+`python -m benchmarks.memory_budget`.
+"""
+
+import gc
+import os
+import pickle
+import re
+import sys
+import threading
+import tracemalloc
+from typing import Any, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+
+SIZE_UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30, "T": 2**40}
+
+
+class MemoryBudgetExceeded(RuntimeError):
+    """Generation would use (or already uses) more memory than its budget"""
+
+
+def parse_size(text: str) -> int:
+    """
+    Parse a byte size such as "512M", "1.5G", "2GiB" or "1048576"
+
+    Units are binary (K = 1024 bytes).
+
+    Raises:
+        ValueError: Unrecognized size
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:I?B)?\s*", text.upper())
+    if not match:
+        raise ValueError(f"Invalid size '{text}' (expected e.g. 512M, 1.5G, 2GiB)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def format_size(size: float) -> str:
+    """Human-readable binary size (e.g. 1.5 GiB)"""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(size) < 1024 or unit == "GiB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.1f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GiB"  # pragma: no cover
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    Current resident set size of this process
+
+    Read from /proc on Linux; elsewhere the peak RSS (getrusage) is the
+    closest available figure. None where neither is available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+    return None
+
+
+def retained_bytes(objects: Any) -> int:
+    """
+    Bytes needed to hold `objects`, counted by tracemalloc while rebuilding them from a pickle
+
+    Tracing the code that built them would be several times slower. Every
+    retained object (strings included) is allocated again, and objects
+    shared within `objects`, or with module-level state such as interned
+    strings and shared empty defaults, stay shared.
+    """
+    payload = pickle.dumps(objects, pickle.HIGHEST_PROTOCOL)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        rebuilt = pickle.loads(payload)
+        gc.collect()
+        allocated = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    del rebuilt
+    return allocated
+
+
+class RssSampler:
+    """Sample RSS on a background thread while a block runs"""
+
+    def __init__(self, interval: float = 0.01):
+        """
+        Initialize sampler
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples: List[int] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            rss = rss_bytes()
+            if rss is not None:
+                self.samples.append(rss)
+            self._stop.wait(self.interval)
+
+    @property
+    def start(self) -> Optional[int]:
+        """RSS when sampling started"""
+        return self.samples[0] if self.samples else None
+
+    @property
+    def peak(self) -> Optional[int]:
+        """Largest RSS sampled"""
+        return max(self.samples) if self.samples else None
+
+    def __enter__(self) -> "RssSampler":
+        rss = rss_bytes()
+        if rss is not None:
+            self.samples.append(rss)
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        self._thread.join()
+        rss = rss_bytes()
+        if rss is not None:
+            self.samples.append(rss)
+
+
+class MemoryBudget:
+    """
+    Stop a generation run early when its projected memory exceeds a budget
+
+    Call check(users_done) as users are produced. Every `check_every` users
+    the growth in RSS over the last interval is extrapolated to the rest of
+    the cohort. A run is stopped when RSS is already over the budget, or
+    when the projection exceeds it at `patience` consecutive checks; one
+    interval of growth is not enough, because streaming writers legitimately
+    grow until their first batch is flushed (Parquet row groups, SQLite
+    batches) and then stay flat.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        total_users: int,
+        check_every: Optional[int] = None,
+        patience: int = 3
+    ):
+        """
+        Initialize budget
+
+        Args:
+            limit: Budget in bytes of RSS
+            total_users: Users the run will generate
+            check_every: Users between checks (default: 5% of the run, at least 200)
+            patience: Consecutive over-budget projections before stopping
+
+        Raises:
+            MemoryBudgetExceeded: The process already uses more than the budget
+        """
+        self.limit = limit
+        self.total_users = total_users
+        self.check_every = check_every or max(200, total_users // 20)
+        self.patience = patience
+        self.projected: Optional[int] = None
+        self.peak = rss_bytes()
+        self._last = (0, self.peak)
+        self._strikes = 0
+
+        if self.peak is None:
+            raise RuntimeError("Memory budgets need RSS measurements, which this platform does not provide")
+        if self.peak > limit:
+            raise MemoryBudgetExceeded(
+                f"RSS is already {format_size(self.peak)} before generating, over the "
+                f"{format_size(limit)} budget"
+            )
+
+    def check(self, users_done: int) -> None:
+        """
+        Check memory after `users_done` users
+
+        Raises:
+            MemoryBudgetExceeded: RSS or its projection exceeds the budget
+        """
+        if users_done % self.check_every and users_done != self.total_users:
+            return
+
+        rss = rss_bytes()
+        self.peak = max(self.peak, rss)
+        if rss > self.limit:
+            raise MemoryBudgetExceeded(
+                f"RSS reached {format_size(rss)} after {users_done:,} users, over the "
+                f"{format_size(self.limit)} budget"
+            )
+
+        last_users, last_rss = self._last
+        self._last = (users_done, rss)
+        growth = max(0.0, (rss - last_rss) / max(1, users_done - last_users))
+        self.projected = int(rss + growth * (self.total_users - users_done))
+        if self.projected <= self.limit:
+            self._strikes = 0
+            return
+
+        self._strikes += 1
+        if self._strikes >= self.patience:
+            raise MemoryBudgetExceeded(
+                f"Projected {format_size(self.projected)} for {self.total_users:,} users exceeds the "
+                f"{format_size(self.limit)} budget (RSS {format_size(rss)} after {users_done:,} users, "
+                f"growing {format_size(growth)}/user); use a streaming format, fewer users or --shards"
+            )
+
+    def __repr__(self) -> str:
+        return f"MemoryBudget(limit={format_size(self.limit)}, total_users={self.total_users})"
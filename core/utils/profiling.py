@@ -0,0 +1,229 @@
+"""
+Per-stage timers and counters for the generation pipeline.
+
+Generators and writers mark their stages with the module functions:
+
+    from ..utils import profiling
+
+    with profiling.stage("journey.generate"):
+        ...
+    profiling.count("steps", len(steps))
+
+Nothing is recorded until a Profiler is activated; until then stage()
+returns one shared no-op context manager and count() returns at once, so
+the instrumentation costs a function call per stage. Activated (see
+`activate`, or `cli.py generate --profile`), a Profiler records per stage
+the number of calls, the total (inclusive) time and the self time
+(excluding nested stages), optionally a Chrome trace timeline
+(chrome://tracing, https://ui.perfetto.dev).
+
+Stage names are <component>.<operation>:
+
+    config.load          ConfigLoader/CohortGenerator setup
+    persona.generate     one persona
+    journey.generate     one journey, steps included
+    ssr.load             loading the embedding model, embedding reference statements
+    ssr.embed, ssr.pmf   SSR: embedding a response, converting it to a PMF
+    llm.call             one routed LLM response (self time: waiting for a tier slot)
+    llm.request          one LLM API request
+    write.encode         serializing a user (to_dict/JSON/row flattening)
+    write.io             writing encoded data (file writes, row groups, inserts)
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+
+_NULL_STAGE = nullcontext()
+
+# The profiler stages and counters report to (None: profiling is off)
+_active: Optional["Profiler"] = None
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Accumulated time of one stage"""
+    calls: int = 0
+    total: float = 0.0
+    self_time: float = 0.0
+
+
+class _Span:
+    """One timed stage on the current thread's stack"""
+
+    __slots__ = ("profiler", "name", "start", "children")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.children = 0.0
+        self.profiler._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter()
+        self.profiler._close(self, end)
+
+
+class Profiler:
+    """Record stage timings, counters and (optionally) a trace timeline"""
+
+    def __init__(self, trace: bool = False, max_trace_events: int = 1_000_000):
+        """
+        Initialize profiler
+
+        Args:
+            trace: Keep one event per stage call for write_trace()
+            max_trace_events: Stop tracing after this many events (the
+                breakdown keeps counting); a 100k-user run has millions of stages
+        """
+        self.trace = trace
+        self.max_trace_events = max_trace_events
+        self.stages: Dict[str, StageStats] = defaultdict(StageStats)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.events: List[Dict[str, Any]] = []
+        self.trace_truncated = False
+        self.origin = time.perf_counter()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def stage(self, name: str) -> _Span:
+        """Context manager timing one call of a stage"""
+        return _Span(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add to a counter"""
+        with self._lock:
+            self.counters[name] += n
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _close(self, span: _Span, end: float) -> None:
+        stack = self._stack()
+        stack.pop()
+        elapsed = end - span.start
+        if stack:
+            stack[-1].children += elapsed
+
+        with self._lock:
+            stats = self.stages[span.name]
+            stats.calls += 1
+            stats.total += elapsed
+            stats.self_time += elapsed - span.children
+            if self.trace:
+                if len(self.events) < self.max_trace_events:
+                    self.events.append({
+                        "name": span.name,
+                        "cat": span.name.split(".", 1)[0],
+                        "ph": "X",
+                        "ts": round((span.start - self.origin) * 1e6, 3),
+                        "dur": round(elapsed * 1e6, 3),
+                        "pid": os.getpid(),
+                        "tid": threading.get_ident(),
+                    })
+                else:
+                    self.trace_truncated = True
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created"""
+        return time.perf_counter() - self.origin
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Stage statistics and counters (JSON-serializable)"""
+        return {
+            "elapsed": round(self.elapsed, 6),
+            "stages": {
+                name: {"calls": stats.calls, "total": round(stats.total, 6), "self": round(stats.self_time, 6)}
+                for name, stats in sorted(self.stages.items(), key=lambda item: -item[1].self_time)
+            },
+            "counters": dict(self.counters),
+        }
+
+    def report(self, wall: Optional[float] = None) -> str:
+        """
+        Stage breakdown as a text table, slowest self time first
+
+        Args:
+            wall: Wall-clock seconds to compare against (default: since creation)
+        """
+        wall = wall or self.elapsed
+        lines = [
+            f"   {'stage':<20} {'calls':>10} {'total s':>9} {'self s':>9} {'self %':>7} {'mean ms':>9}"
+        ]
+        for name, stats in sorted(self.stages.items(), key=lambda item: -item[1].self_time):
+            lines.append(
+                f"   {name:<20} {stats.calls:>10,} {stats.total:>9.2f} {stats.self_time:>9.2f} "
+                f"{stats.self_time / wall:>7.1%} {stats.total / stats.calls * 1000:>9.3f}"
+            )
+        untracked = wall - sum(stats.self_time for stats in self.stages.values())
+        lines.append(f"   {'(other)':<20} {'':>10} {'':>9} {max(untracked, 0.0):>9.2f} {max(untracked, 0.0) / wall:>7.1%}")
+        if self.counters:
+            lines.append("   " + ", ".join(f"{name}={value:,}" for name, value in sorted(self.counters.items())))
+        return "\n".join(lines)
+
+    def write_trace(self, path: Union[str, Path]) -> Path:
+        """Write recorded events in Chrome trace format"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        trace = {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": dict(self.counters), "truncated": self.trace_truncated},
+        }
+        path.write_text(json.dumps(trace))
+        return path
+
+    def __repr__(self) -> str:
+        return f"Profiler(stages={len(self.stages)}, events={len(self.events)})"
+
+
+def stage(name: str):
+    """Time a stage on the active profiler (a shared no-op when none is active)"""
+    profiler = _active
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.stage(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add to a counter of the active profiler"""
+    profiler = _active
+    if profiler is not None:
+        profiler.count(name, n)
+
+
+def active() -> Optional[Profiler]:
+    """The active profiler, if any"""
+    return _active
+
+
+@contextmanager
+def activate(profiler: Optional[Profiler] = None):
+    """
+    Record stages and counters on a profiler for the duration
+
+    Yields:
+        The profiler (a new one unless given)
+    """
+    global _active
+    profiler = profiler or Profiler()
+    previous, _active = _active, profiler
+    try:
+        yield profiler
+    finally:
+        _active = previous
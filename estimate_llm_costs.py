@@ -3,8 +3,18 @@
 Estimate Anthropic API costs for SSR journey generation.
 """
 
-import json
 from pathlib import Path
+from core.dataset.readers import iter_users
+from core.dataset.shards import map_shards
+
+
+def journey_lengths_of(users_file):
+    """Steps per journey in one dataset file (or shard)"""
+    return [
+        len(user["journey"]["steps"])
+        for user in iter_users(users_file)
+        if "journey" in user and "steps" in user["journey"]
+    ]
 
 
 def main():
@@ -17,14 +27,13 @@ def main():
 
     # Load sample user to get typical journey length
     users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
-
-    # Analyze journey lengths
-    journey_lengths = []
-    for user in users_data:
-        if "journey" in user and "steps" in user["journey"]:
-            journey_lengths.append(len(user["journey"]["steps"]))
+
+    # Analyze journey lengths (streamed; shards of a sharded dataset in parallel)
+    journey_lengths = [
+        length
+        for shard_lengths in map_shards(users_file, journey_lengths_of)
+        for length in shard_lengths
+    ]
 
     avg_steps = sum(journey_lengths) / len(journey_lengths) if journey_lengths else 15
     min_steps = min(journey_lengths) if journey_lengths else 12
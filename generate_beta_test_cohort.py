@@ -19,18 +19,19 @@ Priority 2: Woodworking
 import json
 import random
 from collections import defaultdict
+from core.dataset.readers import select_users
+from core.dataset.summary import read_summary
 
-# Load 500-user cohort
-with open('output/private_language_synthetic_users.json', 'r') as f:
-    users = json.load(f)
+# 500-user cohort (users.jsonl and sharded datasets are found by the same path)
+USERS_FILE = 'output/private_language_synthetic_users.json'
 
 print("=" * 80)
 print("BETA TEST COHORT GENERATION")
 print("=" * 80)
-print(f"\nTotal Users in Cohort: {len(users)}\n")
+print(f"\nTotal Users in Cohort: {read_summary(USERS_FILE).rows}\n")
 
-# Filter for Studio Practitioners
-studio_practitioners = [u for u in users if u['persona_type'] == 'studio_practitioner']
+# Only Studio Practitioners are candidates; indexed JSONL skips parsing the rest
+studio_practitioners = select_users(USERS_FILE, persona_type='studio_practitioner')
 print(f"Studio Practitioners: {len(studio_practitioners)}")
 
 # Apply beta tester criteria
@@ -5,17 +5,24 @@ Generate full cohort with real Claude Sonnet 4.5 LLM integration.
 This will regenerate journeys for existing users using real LLM calls.
 """
 
-import json
+import argparse
 import time
-from pathlib import Path
 from datetime import datetime
 from core.generators.journey_generator import JourneyGenerator
+from core.generators.model_router import ModelRouter
 from core.models.journey import JourneyType
-from core.models.persona import Persona
 from core.utils.config_loader import ConfigLoader
+from core.dataset.compression import dump_json
+from core.dataset.loader import CohortLoader
 
 
-def main():
+# .gz / .zst paths are (de)compressed transparently
+USERS_FILE = "output/private_language_synthetic_users.json"
+OUTPUT_FILE = "output/private_language_synthetic_users_llm.json"
+PROJECT_PATH = "projects/private_language"
+
+
+def main(users_file: str = USERS_FILE, output_file: str = OUTPUT_FILE):
     """Generate cohort with real LLM calls."""
 
     print("=" * 80)
@@ -23,12 +30,10 @@ def main():
     print("=" * 80)
     print()
 
-    # Load existing users
-    users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
+    # Load existing users (personas come back with their PersonaConfig attached)
+    records = CohortLoader(users_file, project_path=PROJECT_PATH, journeys=False).load()
 
-    num_users = len(users_data)
+    num_users = len(records)
 
     # Cost estimation
     avg_steps = 14  # From our earlier analysis
@@ -49,9 +54,10 @@ def main():
     print()
 
     # Load project configs
-    config_loader = ConfigLoader("projects/private_language")
+    config_loader = ConfigLoader(PROJECT_PATH)
     phases = config_loader.load_journey_phases()
     emotional_states = config_loader.load_emotional_states()
+    model_router = ModelRouter.from_config(config_loader.load_model_routing())
 
     # Initialize journey generator with REAL LLM
     print("Initializing journey generator with Claude Sonnet 4.5...")
@@ -59,20 +65,23 @@ def main():
         journey_type=JourneyType.SESSION_BASED,
         phases_config=phases,
         emotional_states=emotional_states,
-        ssr_config_path="projects/private_language/response_scales.yaml",
+        ssr_config_path=f"{PROJECT_PATH}/response_scales.yaml",
         enable_ssr=True,
         use_real_llm=True,  # 🔥 Real LLM!
-        llm_model="claude-sonnet-4-5-20250929"
+        llm_model="claude-sonnet-4-5-20250929",
+        model_router=model_router
     )
-    print("✓ Generator ready")
+    print(f"✓ Generator ready ({model_router})")
     print()
 
     # Process each user
     results = []
     start_time = time.time()
 
-    for idx, user_data in enumerate(users_data, 1):
+    for idx, record in enumerate(records, 1):
         user_start = time.time()
+        user_data = record.profile.to_dict()
+        persona = record.persona
 
         print("─" * 80)
         print(f"Processing User {idx}/{num_users}")
@@ -86,20 +95,6 @@ def main():
 
         print()
 
-        # Recreate persona
-        persona = Persona(
-            id=user_data["id"],
-            persona_type=user_data["persona_type"],
-            config=None,
-            age=user_data["age"],
-            gender=user_data["gender"],
-            education=user_data["education"],
-            engagement_level=user_data.get("engagement_level", 0.7),
-            action_tendency=user_data.get("action_tendency", 0.6),
-            anxiety_level=user_data.get("anxiety_level"),
-            attributes=user_data["attributes"]
-        )
-
         # Generate journey with real LLM
         print("🤖 Generating journey with real LLM calls...")
         journey = journey_gen.generate(persona, user_data["id"])
@@ -172,14 +167,12 @@ def main():
         print()
 
     # Save results
-    output_file = Path("output/private_language_synthetic_users_llm.json")
     print("=" * 80)
     print("💾 Saving Results")
     print("=" * 80)
     print()
 
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    dump_json(results, output_file, indent=2)
 
     print(f"✓ Saved to: {output_file}")
     print()
@@ -207,6 +200,15 @@ def main():
     print(f"   Avg time per user: {total_time/num_users:.1f}s")
     print()
 
+    print("🧭 Model Tier Telemetry:")
+    for tier_name, stats in model_router.get_telemetry().items():
+        print(
+            f"   {tier_name} ({stats['model']}): {stats['calls']} calls, "
+            f"{stats['errors']} errors, avg {stats['avg_latency']:.2f}s, "
+            f"wait {stats['total_wait']:.1f}s"
+        )
+    print()
+
     print("🎯 Results:")
     print(f"   • Every journey includes real Claude Sonnet 4.5 responses")
     print(f"   • Each response is persona-specific and contextual")
@@ -223,4 +225,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", default=USERS_FILE, help="Input users dataset")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="Output file")
+    args = parser.parse_args()
+    main(args.users, args.output)
@@ -10,7 +10,6 @@ This script generates:
 Plus: Enhanced journeys with weekly synthesis and export events for ALL users.
 """
 
-import json
 import random
 import time
 from pathlib import Path
@@ -19,13 +18,15 @@ from core.generators.journey_generator import JourneyGenerator
 from core.models.journey import JourneyType
 from core.models.persona import Persona
 from core.utils.config_loader import ConfigLoader
+from core.dataset.compression import dump_json
+from core.dataset.readers import select_users
 
 
 def load_existing_users():
-    """Load existing user cohort"""
+    """Load the master educators of the existing user cohort"""
     users_file = Path("output/private_language_synthetic_users_llm.json")
-    with open(users_file) as f:
-        return json.load(f)
+    # Only master educators are linked to; indexed JSONL skips parsing the rest
+    return select_users(users_file, persona_type='master_educator')
 
 
 def select_master_educators(users, count=2):
@@ -460,7 +461,7 @@ def main():
     # Load existing users
     print("📂 Loading existing user cohort...")
     existing_users = load_existing_users()
-    print(f"   Loaded {len(existing_users)} existing users")
+    print(f"   Loaded {len(existing_users)} existing master educators")
     print()
 
     # Load project configs
@@ -623,8 +624,7 @@ def main():
 
     # Save new personas
     output_file = Path("output/network_effect_personas.json")
-    with open(output_file, 'w') as f:
-        json.dump(completed_users, f, indent=2)
+    dump_json(completed_users, output_file, indent=2)
 
     print("=" * 80)
     print("✅ Generation Complete")
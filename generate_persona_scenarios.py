@@ -6,18 +6,16 @@ Creates realistic user stories showing how different personas experience
 their first knowledge capture session.
 """
 
-import json
-from pathlib import Path
 from typing import Dict, List, Any
 import random
+from core.dataset.readers import load_users, resolve_dataset
 
 
 class PersonaScenarioGenerator:
     """Generate realistic user scenarios by persona"""
 
     def __init__(self, data_file: str):
-        with open(data_file, 'r') as f:
-            self.users = json.load(f)
+        self.users = load_users(data_file)
 
     def generate_scenarios(self):
         """Generate persona-specific first capture scenarios"""
@@ -248,7 +246,7 @@ class PersonaScenarioGenerator:
 def main():
     data_file = "output/private_language_synthetic_users.json"
 
-    if not Path(data_file).exists():
+    if not resolve_dataset(data_file).exists():
         print(f"❌ Data file not found: {data_file}")
         return
 
@@ -3,18 +3,24 @@
 Generate 2 users with real Claude Sonnet 4.5 - Quick test.
 """
 
-import json
+import argparse
 import time
 import sys
-from pathlib import Path
 from datetime import datetime
 from core.generators.journey_generator import JourneyGenerator
 from core.models.journey import JourneyType
 from core.models.persona import Persona
 from core.utils.config_loader import ConfigLoader
+from core.dataset.compression import dump_json
+from core.dataset.readers import select_users
 
 
-def main():
+# .gz / .zst paths are (de)compressed transparently
+USERS_FILE = "output/private_language_synthetic_users.json"
+OUTPUT_FILE = "output/private_language_2users_llm.json"
+
+
+def main(users_file: str = USERS_FILE, output_file: str = OUTPUT_FILE):
     """Generate 2 users with real LLM."""
 
     print("=" * 80, flush=True)
@@ -23,12 +29,8 @@ def main():
     print(flush=True)
 
     # Load existing users
-    users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
-
-    # Just 2 users
-    users_to_process = users_data[:2]
+    # Just 2 users (read through the offset index for indexed JSONL)
+    users_to_process = select_users(users_file, limit=2)
 
     print(f"Processing {len(users_to_process)} users...", flush=True)
     print(f"Est. cost: ~${len(users_to_process) * 0.12:.2f}", flush=True)
@@ -38,6 +40,7 @@ def main():
     config_loader = ConfigLoader("projects/private_language")
     phases = config_loader.load_journey_phases()
     emotional_states = config_loader.load_emotional_states()
+    persona_configs = config_loader.load_personas()
 
     print("Initializing journey generator...", flush=True)
     journey_gen = JourneyGenerator(
@@ -60,19 +63,8 @@ def main():
         print(f"User {idx}/{len(users_to_process)}: {user_data['name']} ({user_data['persona_type']})", flush=True)
         print("─" * 80, flush=True)
 
-        # Recreate persona
-        persona = Persona(
-            id=user_data["id"],
-            persona_type=user_data["persona_type"],
-            config=None,
-            age=user_data["age"],
-            gender=user_data["gender"],
-            education=user_data["education"],
-            engagement_level=user_data.get("engagement_level", 0.7),
-            action_tendency=user_data.get("action_tendency", 0.6),
-            anxiety_level=user_data.get("anxiety_level"),
-            attributes=user_data["attributes"]
-        )
+        # Recreate persona with its archetype config
+        persona = Persona.from_dict(user_data, persona_configs.get(user_data["persona_type"]))
 
         print("Generating journey...", flush=True)
         user_start = time.time()
@@ -129,9 +121,7 @@ def main():
         results.append(user_result)
 
     # Save
-    output_file = Path("output/private_language_2users_llm.json")
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    dump_json(results, output_file, indent=2)
 
     total_time = time.time() - start_time
     total_responses = sum(
@@ -152,4 +142,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", default=USERS_FILE, help="Input users dataset")
+    parser.add_argument("--output", default=OUTPUT_FILE, help="Output file")
+    args = parser.parse_args()
+    main(args.users, args.output)
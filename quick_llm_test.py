@@ -3,9 +3,9 @@
 Quickest test: Generate 1 journey step-by-step showing progress.
 """
 
-import json
 import sys
 from pathlib import Path
+from core.dataset.readers import select_users
 from core.generators.llm_response_generator import LLMResponseGenerator
 from core.generators.ssr_response_generator import SSRResponseGenerator
 
@@ -17,10 +17,7 @@ def main():
 
     # Load user
     users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
-
-    user = users_data[0]
+    user = select_users(users_file, limit=1)[0]
     print(f"User: {user['name']} ({user['persona_type']})")
     print()
 
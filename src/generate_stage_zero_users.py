@@ -3,18 +3,19 @@
 Generate 500 synthetic Stage Zero Health users with full 10-week assessment data
 """
 
-import json
 import sys
 from pathlib import Path
 from datetime import datetime
 from dataclasses import asdict
 import argparse
 
-# Add src to path for imports
+# Add src (generator modules) and the repo root (core package) to path for imports
 sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent))
 
 # Import generator components (need to combine them into single file)
 from stage_zero_generator import StageZeroGenerator
+from core.dataset.compression import dump_json
 
 
 def convert_to_json_serializable(obj):
@@ -47,7 +48,7 @@ def main():
         '--output',
         type=str,
         default='output/stage_zero_users.json',
-        help='Output file path (default: output/stage_zero_users.json)'
+        help='Output file path; .gz/.zst compress (default: output/stage_zero_users.json)'
     )
     parser.add_argument(
         '--summary',
@@ -78,8 +79,8 @@ def main():
         users_data.append(user_dict)
     
     # Save to file
-    with open(output_path, 'w') as f:
-        json.dump(users_data, f, indent=2, default=str)
+    # .json.gz / .json.zst output paths are compressed while streaming
+    dump_json(users_data, output_path, indent=2, default=str)
     
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
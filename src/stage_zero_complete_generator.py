@@ -4,7 +4,6 @@ Generate 500 synthetic Stage Zero Health users with full 10-week assessment data
 This is a simplified version that demonstrates the structure.
 """
 
-import json
 import random
 import uuid
 from datetime import datetime, timedelta, date
@@ -12,6 +11,11 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 import argparse
+import sys
+
+# Repo root on the path for the shared core package when run as a script
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from core.dataset.compression import dump_json
 
 # For this demonstration, we'll create a simplified version
 # In production, this would include all the methods from the generator parts
@@ -384,8 +388,8 @@ def main():
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w') as f:
-        json.dump(users_data, f, indent=2, default=str)
+    # .json.gz / .json.zst output paths are compressed while streaming
+    dump_json(users_data, output_path, indent=2, default=str)
     
     print(f"✓ Generated {len(users)} users")
     print(f"✓ Saved to {output_path}")
@@ -6,8 +6,8 @@ Cost: ~$0.02-0.03 (much cheaper!)
 Time: ~30-45 seconds
 """
 
-import json
 from pathlib import Path
+from core.dataset.readers import select_users
 from datetime import datetime, timedelta
 import random
 import uuid
@@ -30,17 +30,10 @@ def main():
 
     # Load user
     users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
 
     # Pick a Studio Practitioner
-    test_user = None
-    for user in users_data:
-        if user['persona_type'] == 'studio_practitioner':
-            test_user = user
-            break
-    if not test_user:
-        test_user = users_data[0]
+    matches = select_users(users_file, persona_type='studio_practitioner', limit=1)
+    test_user = matches[0] if matches else select_users(users_file, limit=1)[0]
 
     print("🎭 Persona: {} ({})".format(test_user['name'], test_user['persona_type']))
     print(f"   Age: {test_user['age']}, Gender: {test_user['gender']}")
@@ -6,8 +6,8 @@ Cost: ~$0.12 for full journey
 Time: ~1-2 minutes
 """
 
-import json
 from pathlib import Path
+from core.dataset.readers import select_users
 from core.generators.journey_generator import JourneyGenerator
 from core.models.journey import JourneyType
 from core.models.persona import Persona
@@ -27,19 +27,11 @@ def main():
 
     # Load existing users
     users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
 
     # Pick an interesting persona
     # Let's find a Studio Practitioner - good middle-ground persona
-    test_user = None
-    for user in users_data:
-        if user['persona_type'] == 'studio_practitioner':
-            test_user = user
-            break
-
-    if not test_user:
-        test_user = users_data[0]
+    matches = select_users(users_file, persona_type='studio_practitioner', limit=1)
+    test_user = matches[0] if matches else select_users(users_file, limit=1)[0]
 
     print("=" * 80)
     print("🎭 Selected Persona")
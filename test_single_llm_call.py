@@ -3,8 +3,8 @@
 Simple test: Single Anthropic LLM call + SSR conversion.
 """
 
-import json
 from pathlib import Path
+from core.dataset.readers import select_users
 from core.generators.llm_response_generator import LLMResponseGenerator
 from core.generators.ssr_response_generator import SSRResponseGenerator
 
@@ -19,10 +19,7 @@ def main():
 
     # Load a real user
     users_file = Path("output/private_language_synthetic_users.json")
-    with open(users_file) as f:
-        users_data = json.load(f)
-
-    test_user = users_data[0]
+    test_user = select_users(users_file, limit=1)[0]
 
     print(f"🎭 Persona: {test_user['name']} ({test_user['persona_type']})")
     print(f"   Age: {test_user['age']}")
@@ -0,0 +1,17 @@
+"""Shared fixtures"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def project_path(tmp_path_factory):
+    """Copy of projects/private_language (without a locally compiled bundle, which may be stale)"""
+    path = tmp_path_factory.mktemp("projects") / "private_language"
+    shutil.copytree(REPO_ROOT / "projects" / "private_language", path,
+                    ignore=shutil.ignore_patterns("config.bundle"))
+    return path
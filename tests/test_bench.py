@@ -0,0 +1,37 @@
+"""Benchmark matrix (benchmarks.suite, cli.py bench)"""
+
+import json
+
+import pytest
+
+from benchmarks.suite import format_row, run_suite, save_report
+from core.generators.journey_generator import SSR_AVAILABLE
+
+
+def test_suite_reports_every_stage_with_fingerprint(project_path, tmp_path):
+    stages = ["personas", "journeys:milestone_based", "serialize", "ssr"]
+    report = run_suite(project_path, sizes=[40], stages=stages, batch_size=16, isolate=False)
+
+    rows = {row["stage"]: row for row in report["results"]}
+    assert list(rows) == stages
+    assert rows["personas"]["users"] == 40 and rows["personas"]["steps"] == 0
+    assert rows["journeys:milestone_based"]["steps"] > 0
+    assert rows["journeys:milestone_based"]["steps_per_sec"] > 0
+    assert {"personas", "journeys", "to_dict", "json.dumps"} <= set(rows["serialize"]["stage_seconds"])
+    if not SSR_AVAILABLE:
+        assert "skipped" in rows["ssr"]
+
+    assert report["machine"]["id"] and report["machine"]["cpu_count"]
+    assert "commit" in report["git"]
+
+    path = save_report(report, tmp_path / "bench.json")
+    assert json.loads(path.read_text())["results"] == report["results"]
+
+
+def test_sizes_below_one_are_rejected_and_missing_rates_print_as_dashes(project_path):
+    with pytest.raises(ValueError, match="at least 1"):
+        run_suite(project_path, sizes=[0, 100], stages=["personas"], isolate=False)
+
+    row = {"stage": "personas", "users": 1, "users_per_sec": None, "steps_per_sec": None,
+           "peak_rss_mb": None, "stage_seconds": {"personas": 0.0}}
+    assert format_row(row).split()[2:5] == ["-", "-", "-"]
@@ -0,0 +1,50 @@
+"""Serializer backends (core.dataset.codec)"""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from core.dataset import IndexedDataset, open_writer
+from core.dataset.codec import SERIALIZERS, get_serializer, loads
+from core.dataset.writers import user_record
+from core.generators.cohort_generator import CohortGenerator
+
+
+def _serializer(name):
+    try:
+        return get_serializer(name)
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+
+
+@pytest.fixture(scope="module")
+def models(project_path):
+    return list(CohortGenerator(project_path).iter_models(6, seed=2))
+
+
+@pytest.mark.parametrize("name", list(SERIALIZERS))
+@pytest.mark.parametrize("include_phases", [True, False])
+def test_encode_user_matches_to_dict(models, name, include_phases):
+    serializer = _serializer(name)
+    for user, journey in models:
+        expected = user_record(user, journey, include_phases)
+        assert loads(serializer.encode_user(user, journey, include_phases)) == expected
+        assert loads(serializer.encode(journey.steps[0])) == journey.steps[0].to_dict()
+
+    if name == "json":
+        # The stdlib backend keeps the previous byte layout
+        user, journey = models[0]
+        assert serializer.encode_user(user, journey) == json.dumps(user_record(user, journey))
+
+
+def test_offsets_count_utf8_bytes(models, tmp_path):
+    path = tmp_path / "users.jsonl"
+    with open_writer(path, "jsonl", index=True) as writer:
+        for i, (user, journey) in enumerate(models):
+            writer.write_user(replace(user, name=f"Zoë Ångström {i}"), journey)
+
+    with IndexedDataset(path, build=False) as dataset:
+        assert [dataset[row]["name"] for row in range(len(dataset))] == [
+            f"Zoë Ångström {i}" for i in range(len(models))
+        ]
@@ -0,0 +1,103 @@
+"""Memoized and snapshotted project configuration (core.utils.config_loader)"""
+
+import os
+
+import pytest
+import yaml
+
+from core.utils import config_loader
+from core.utils.config_bundle import StaleBundleError, compile_bundle
+from core.utils.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def project(project_path, tmp_path):
+    """Private copy of the project with an empty document cache"""
+    path = tmp_path / "project"
+    path.mkdir()
+    for source in project_path.glob("*.yaml"):
+        (path / source.name).write_bytes(source.read_bytes())
+    config_loader._DOCUMENTS.clear()
+    return path
+
+
+def _touch_config(path, description):
+    """Rewrite config.yaml with a new description and a later mtime"""
+    config_file = path / "config.yaml"
+    data = yaml.safe_load(config_file.read_text())
+    data["description"] = description
+    config_file.write_text(yaml.safe_dump(data))
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_parsed_objects_are_memoized_until_the_file_changes(project):
+    loader = ConfigLoader(project)
+    personas = loader.load_personas()
+    assert loader.load_personas() is personas
+    # Documents are shared across loaders
+    assert ConfigLoader(project).load_config() is loader.load_config()
+
+    _touch_config(project, "edited")
+    assert loader.load_config()["description"] == "edited"
+    assert loader.load_personas() is personas
+
+
+def test_snapshot_skips_yaml_parsing(project, tmp_path, monkeypatch):
+    snapshots = tmp_path / "snapshots"
+    expected = ConfigLoader(project, snapshot_dir=snapshots).load_personas()
+    snapshot = ConfigLoader(project, snapshot_dir=snapshots).snapshot_path()
+    assert snapshot.exists()
+
+    config_loader._DOCUMENTS.clear()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML parsed despite a snapshot")
+
+    monkeypatch.setattr(config_loader, "parse_yaml", fail)
+    loader = ConfigLoader(project, snapshot_dir=snapshots)
+    assert loader.load_personas() == expected
+    assert loader.load_journey_phases()
+
+
+def test_stale_snapshot_is_not_used_and_is_removed(project, tmp_path):
+    snapshots = tmp_path / "snapshots"
+    ConfigLoader(project, snapshot_dir=snapshots).load_config()
+    stale = ConfigLoader(project, snapshot_dir=snapshots).snapshot_path()
+    other_project = snapshots / "other-0123456789abcdef.pickle"
+    other_project.write_bytes(b"")
+
+    _touch_config(project, "edited")
+    config_loader._DOCUMENTS.clear()
+    loader = ConfigLoader(project, snapshot_dir=snapshots)
+    assert loader.load_config()["description"] == "edited"
+    assert loader.snapshot_path() != stale
+    assert loader.snapshot_path().exists()
+    assert not stale.exists()
+    assert other_project.exists()
+
+
+def test_compiled_bundle_is_loaded_and_refused_when_stale(project, monkeypatch):
+    bundle, warnings = compile_bundle(project)
+    assert bundle.exists()
+    # Persona distributions sum to 1
+    assert not any("sum to" in warning for warning in warnings)
+
+    config_loader._DOCUMENTS.clear()
+    with monkeypatch.context() as patch:
+        patch.setattr(config_loader, "parse_yaml", lambda *args: pytest.fail("YAML parsed despite a bundle"))
+        expected = ConfigLoader(project).load_personas()
+    assert expected == ConfigLoader(project, use_bundle=False).load_personas()
+
+    _touch_config(project, "edited")
+    config_loader._DOCUMENTS.clear()
+    with pytest.raises(StaleBundleError, match="config.yaml"):
+        ConfigLoader(project).load_config()
+    assert ConfigLoader(project, use_bundle=False).load_config()["description"] == "edited"
+
+
+def test_compile_rejects_invalid_projects(project):
+    (project / "response_scales.yaml").write_text("broken_scale:\n  scale_points:\n    1: {statement: x}\n")
+    with pytest.raises(ValueError, match="broken_scale"):
+        compile_bundle(project)
+    assert not (project / "config.bundle").exists()
@@ -0,0 +1,160 @@
+"""Round-trip checks for dataset writers, readers and exporters"""
+
+import sqlite3
+
+import pytest
+
+from core.dataset import IndexedDataset, build_index, load_users, open_writer, select_users
+from core.dataset.readers import resolve_dataset
+from core.dataset.sqlite import SqliteCohortWriter
+
+
+def _user(i, persona_type="studio_practitioner", n_steps=3):
+    """Minimal user dict in the shape cli.py generate writes"""
+    user_id = f"user-{i}"
+    journey_id = f"journey-{i}"
+    steps = [
+        {
+            "id": f"{journey_id}-step-{n}",
+            "phase_id": f"phase_{n % 2 + 1}",
+            "step_number": n,
+            "timestamp": f"2026-01-01T00:00:{n:02d}",
+            "actions": ["capture", "reflect"],
+            "emotional_state": "curious",
+            "completion_status": "completed",
+            "data_captured": {"notes": n},
+            "time_invested": 10,
+            "engagement_score": 0.5,
+            "ssr_responses": {
+                "relevance": {
+                    "pmf": [0.1, 0.1, 0.2, 0.3, 0.3],
+                    "expected_value": 3.6,
+                    "most_likely_rating": 4,
+                    "text_response": "Useful.",
+                },
+            },
+        }
+        for n in range(1, n_steps + 1)
+    ]
+    return {
+        "id": user_id,
+        "persona_type": persona_type,
+        "created_at": "2026-01-01T00:00:00",
+        "name": f"{persona_type}_user_{i}",
+        "age": 40,
+        "gender": "female",
+        "education": "masters",
+        "attributes": {"engagement_tier": "standard"},
+        "journey_id": journey_id,
+        "metadata": {},
+        "journey": {
+            "id": journey_id,
+            "user_id": user_id,
+            "persona_type": persona_type,
+            "journey_type": "phase_based",
+            "phase_ids": ["phase_1", "phase_2"],
+            "steps": steps,
+            "current_phase": 1,
+            "overall_completion": 0.5,
+            "started_at": "2026-01-01T00:00:00",
+            "last_activity": None,
+            "completed_at": None,
+        },
+    }
+
+
+def test_sqlite_export_loads_tables_and_indexes(tmp_path):
+    db_path = tmp_path / "cohort.sqlite"
+    with SqliteCohortWriter(db_path, batch_size=4) as writer:
+        for i in range(10):
+            writer.write(_user(i, "early_adopter" if i % 2 else "studio_practitioner"))
+
+    conn = sqlite3.connect(db_path)
+    counts = {
+        table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        for table in SqliteCohortWriter.TABLES
+    }
+    assert counts == {"users": 10, "journeys": 10, "steps": 30, "ssr_responses": 30}
+
+    pmf = conn.execute("SELECT pmf_1, pmf_2, pmf_3, pmf_4, pmf_5 FROM ssr_responses LIMIT 1").fetchone()
+    assert pmf == (0.1, 0.1, 0.2, 0.3, 0.3)
+
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_users_persona_type", "idx_steps_phase_id", "idx_steps_emotional_state",
+            "idx_steps_timestamp"} <= indexes
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+@pytest.mark.parametrize("suffix", [".jsonl.gz", ".json.gz", ".jsonl.zst", ".json.zst"])
+def test_compressed_datasets_round_trip(tmp_path, suffix):
+    if suffix.endswith(".zst"):
+        pytest.importorskip("zstandard")
+
+    path = tmp_path / f"users{suffix}"
+    output_format = "jsonl" if ".jsonl" in suffix else "json"
+    with open_writer(path, output_format, flush_every=2) as writer:
+        for i in range(5):
+            writer.write(_user(i))
+
+    magic = {".gz": b"\x1f\x8b", ".zst": b"\x28\xb5\x2f\xfd"}[path.suffix]
+    assert path.read_bytes().startswith(magic)
+    users = load_users(tmp_path / f"users{suffix.rsplit('.', 1)[0]}")  # resolves the compressed variant
+    assert [user["id"] for user in users] == [f"user-{i}" for i in range(5)]
+
+
+def test_offset_index_random_access(tmp_path):
+    path = tmp_path / "users.jsonl"
+    header = {"phases": [{"id": "phase_1"}, {"id": "phase_2"}]}
+    with open_writer(path, "jsonl", header=header, index=True) as writer:
+        for i in range(20):
+            writer.write(_user(i, "early_adopter" if i % 4 == 0 else "studio_practitioner"))
+
+    with IndexedDataset(path, build=False) as dataset:
+        assert len(dataset) == 20
+        assert dataset.persona_counts() == {"early_adopter": 5, "studio_practitioner": 15}
+        assert dataset.get("user-13")["id"] == "user-13"
+        assert dataset[-1]["id"] == "user-19"
+        assert [u["id"] for u in dataset.iter_persona("early_adopter", limit=2)] == ["user-0", "user-4"]
+        assert dataset[0]["journey"]["phases"] == header["phases"]
+
+    # Rebuilding from the file alone yields the same index
+    written = (tmp_path / "users.jsonl.idx").read_text()
+    build_index(path)
+    assert (tmp_path / "users.jsonl.idx").read_text() == written
+
+    assert [u["id"] for u in select_users(path, persona_type="studio_practitioner", limit=3)] == [
+        "user-1", "user-2", "user-3"
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_json_path_falls_back_to_the_jsonl_dataset(tmp_path, suffix):
+    with open_writer(tmp_path / f"users{suffix}", "jsonl", index=suffix == ".jsonl") as writer:
+        for i in range(6):
+            writer.write(_user(i, "early_adopter" if i % 3 == 0 else "studio_practitioner"))
+
+    # Scripts refer to users.json, the default `generate` output
+    assert resolve_dataset(tmp_path / "users.json") == tmp_path / f"users{suffix}"
+    assert len(load_users(tmp_path / "users.json")) == 6
+    assert [u["id"] for u in select_users(tmp_path / "users.json", persona_type="early_adopter")] == [
+        "user-0", "user-3"
+    ]
+
+    # An existing JSON array is still preferred
+    with open_writer(tmp_path / "users.json", "json") as writer:
+        writer.write(_user(9))
+    assert [user["id"] for user in load_users(tmp_path / "users.json")] == ["user-9"]
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "json"])
+def test_denormalized_users_get_their_own_phases(tmp_path, output_format):
+    path = tmp_path / f"users.{output_format}"
+    header = {"phases": [{"id": "phase_1", "objectives": ["explore"]}, {"id": "phase_2", "objectives": []}]}
+    with open_writer(path, output_format, header=header) as writer:
+        for i in range(3):
+            writer.write(_user(i))
+
+    first, second, _ = load_users(path)
+    assert first["journey"]["phases"] == second["journey"]["phases"] == header["phases"]
+    first["journey"]["phases"][0]["objectives"].append("edited")
+    assert second["journey"]["phases"][0]["objectives"] == ["explore"]
@@ -0,0 +1,188 @@
+"""Process-wide embedding model registry (core.generators.embedding_registry)"""
+
+import os
+import pickle
+import sys
+import threading
+import types
+
+import pytest
+
+from core.generators import embedding_registry
+from core.generators.embedding_registry import EmbeddingModelRegistry
+
+
+class StubModel:
+    def __init__(self, model_name, device):
+        self.key = (model_name, device)
+        self.pid = os.getpid()
+
+    def encode(self, sentences):
+        return [[float(len(sentence))] for sentence in sentences]
+
+
+class CountingLoader:
+    """Stands in for sentence-transformers, counting loads"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, model_name, device):
+        self.calls.append((model_name, device))
+        return StubModel(model_name, device)
+
+
+def test_models_are_shared_per_name_device_and_backend():
+    loader = CountingLoader()
+    registry = EmbeddingModelRegistry({"torch": loader, "onnx": loader})
+
+    model = registry.get("all-MiniLM-L6-v2")
+    assert registry.get("all-MiniLM-L6-v2") is model
+    assert registry.get("all-MiniLM-L6-v2", device="cpu") is not model
+    assert registry.get("all-MiniLM-L6-v2", backend="onnx") is not model
+    assert registry.get("paraphrase-MiniLM-L3-v2") is not model
+    assert len(loader.calls) == 4
+    assert set(registry.loaded()) == {
+        ("all-MiniLM-L6-v2", None, "torch"),
+        ("all-MiniLM-L6-v2", "cpu", "torch"),
+        ("all-MiniLM-L6-v2", None, "onnx"),
+        ("paraphrase-MiniLM-L3-v2", None, "torch"),
+    }
+
+    registry.clear()
+    assert registry.loaded() == []
+    assert registry.get("all-MiniLM-L6-v2") is not model
+
+
+def test_concurrent_first_use_loads_once():
+    loader = CountingLoader()
+    registry = EmbeddingModelRegistry({"torch": loader})
+    start = threading.Barrier(8)
+    models = []
+
+    def get():
+        start.wait()
+        models.append(registry.get("all-MiniLM-L6-v2"))
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(loader.calls) == 1
+    assert all(model is models[0] for model in models)
+
+
+def test_register_preload_and_unknown_backend():
+    loader = CountingLoader()
+    registry = EmbeddingModelRegistry({"torch": loader})
+    prebuilt = StubModel("custom", "cpu")
+    registry.register("custom", "cpu", prebuilt)
+    assert registry.get("custom", "cpu") is prebuilt
+
+    registry.preload([("all-MiniLM-L6-v2", None, "torch")])
+    assert loader.calls == [("all-MiniLM-L6-v2", None)]
+
+    with pytest.raises(ValueError, match="Unknown embedding backend 'tensorrt'"):
+        registry.get("all-MiniLM-L6-v2", backend="tensorrt")
+
+
+def test_registry_selects_the_onnx_backend(monkeypatch):
+    # OnnxSentenceEncoder needs onnxruntime
+    module = types.ModuleType("core.generators.onnx_encoder")
+    module.OnnxSentenceEncoder = lambda model_name: StubModel(model_name, None)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    def torch_loader(model_name, device):
+        raise AssertionError("torch backend loaded for backend='onnx'")
+
+    registry = EmbeddingModelRegistry({"torch": torch_loader})
+    encoder = registry.get("all-MiniLM-L6-v2", "cpu", backend="onnx")
+    assert encoder.key == ("all-MiniLM-L6-v2", None)
+    # The device is ignored by the ONNX loader but still part of the key
+    assert registry.get("all-MiniLM-L6-v2", "cpu", backend="onnx") is encoder
+    assert registry.loaded() == [("all-MiniLM-L6-v2", "cpu", "onnx")]
+
+
+# Read by pool workers, which inherit the parent's registry when forked
+_registry = None
+_initialized = None
+
+
+def _set_initialized(value):
+    global _initialized
+    _initialized = value
+
+
+def _inspect_worker(_):
+    model = _registry.get("all-MiniLM-L6-v2")
+    return model.pid, model.encode(["abc"]), _initialized, sys.modules["torch"].threads
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork_pool forks on Linux only")
+def test_fork_pool_workers_inherit_loaded_models(monkeypatch):
+    def fail(model_name, device):
+        raise AssertionError("worker loaded its own model")
+
+    parent = EmbeddingModelRegistry({"torch": CountingLoader()})
+    parent.get("all-MiniLM-L6-v2")
+    parent.loaders["torch"] = fail
+    monkeypatch.setattr(sys.modules[__name__], "_registry", parent)
+    # Workers limit the (already imported) torch thread pool to one thread
+    torch = types.SimpleNamespace(threads=None)
+    torch.set_num_threads = lambda n: setattr(torch, "threads", n)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+    pool = parent.fork_pool(2, initializer=_set_initialized, initargs=("ready",))
+    try:
+        results = pool.map(_inspect_worker, range(4))
+    finally:
+        pool.close()
+        pool.join()
+
+    assert results == [(os.getpid(), [[3.0]], "ready", 1)] * 4
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork_executor forks on Linux only")
+def test_fork_executor_workers_inherit_loaded_models(monkeypatch):
+    def fail(model_name, device):
+        raise AssertionError("worker loaded its own model")
+
+    parent = EmbeddingModelRegistry({"torch": CountingLoader()})
+    parent.get("all-MiniLM-L6-v2")
+    parent.loaders["torch"] = fail
+    monkeypatch.setattr(sys.modules[__name__], "_registry", parent)
+    torch = types.SimpleNamespace(threads=None)
+    torch.set_num_threads = lambda n: setattr(torch, "threads", n)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+    with parent.fork_executor(2, initializer=_set_initialized, initargs=("ready",)) as executor:
+        # Both workers were forked up front
+        assert len(executor._processes) == 2
+        results = list(executor.map(_inspect_worker, range(4)))
+
+    assert results == [(os.getpid(), [[3.0]], "ready", 1)] * 4
+
+
+def _worker_state(_):
+    return _initialized, sys.modules["torch"].threads
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="workers see the fake torch only when forked")
+def test_workers_run_the_same_initializer_without_fork(monkeypatch):
+    # Spawned workers unpickle the initializer, so it must be module-level
+    assert pickle.loads(pickle.dumps(embedding_registry._init_worker)) is embedding_registry._init_worker
+    monkeypatch.setattr(embedding_registry, "FORK_WORKERS", False)
+    torch = types.SimpleNamespace(threads=None)
+    torch.set_num_threads = lambda n: setattr(torch, "threads", n)
+    monkeypatch.setitem(sys.modules, "torch", torch)
+
+    registry = EmbeddingModelRegistry()
+    pool = registry.fork_pool(1, initializer=_set_initialized, initargs=("ready",))
+    try:
+        assert pool.map(_worker_state, range(2)) == [("ready", 1)] * 2
+    finally:
+        pool.close()
+        pool.join()
+    with registry.fork_executor(1, initializer=_set_initialized, initargs=("ready",)) as executor:
+        assert list(executor.map(_worker_state, range(2))) == [("ready", 1)] * 2
@@ -0,0 +1,102 @@
+"""Generation event hooks (core.utils.hooks)"""
+
+import threading
+from contextlib import ExitStack
+
+import pytest
+
+from core.generators.cohort_generator import CohortGenerator
+from core.utils import hooks
+
+
+class FakeSSR:
+    """Stands in for SSRResponseGenerator (the SSR extras are optional)"""
+    available_scales = ["engagement", "satisfaction"]
+
+    def generate_persona_response(self, persona_config, stimulus, scale_id, llm_response):
+        return {"scale_id": scale_id, "text_response": llm_response, "pmf": [0.2] * 5}
+
+
+class FakeLLM:
+    def generate_response(self, **kwargs):
+        return f"response for {kwargs['scale_id']}"
+
+
+def _record(events):
+    stack = ExitStack()
+    for event in hooks.EVENTS:
+        stack.enter_context(hooks.subscribed(event, lambda *args, event=event: events.append((event, args))))
+    return stack
+
+
+def test_pipeline_emits_every_event(project_path):
+    cohort = CohortGenerator(project_path)
+    generator = cohort.journey_gen
+    generator.ssr_enabled, generator.ssr_generator = True, FakeSSR()
+    generator.use_real_llm, generator.llm_generator = True, FakeLLM()
+
+    events = []
+    with _record(events):
+        models = list(cohort.iter_models(5, seed=1))
+
+    names = [name for name, _ in events]
+    steps = sum(len(journey.steps) for _, journey in models)
+    assert names.count("on_persona") == names.count("on_journey_complete") == 5
+    assert names.count("on_step") == steps
+    assert names.count("on_llm_call") == names.count("on_ssr_rating") == 2 * steps
+
+    journeys = [args[1] for name, args in events if name == "on_journey_complete"]
+    assert journeys == [journey for _, journey in models]
+    _, scale_id, text, seconds = next(args for name, args in events if name == "on_llm_call")
+    assert text == f"response for {scale_id}" and seconds >= 0
+    # Steps of a journey are reported before the journey completes
+    assert names.index("on_step") < names.index("on_journey_complete")
+
+
+def test_inline_subscriber_exceptions_stop_generation(project_path):
+    cohort = CohortGenerator(project_path)
+
+    def reject(persona, step):
+        raise ValueError(f"invalid step {step.step_number}")
+
+    with hooks.subscribed("on_step", reject):
+        with pytest.raises(ValueError, match="invalid step 1"):
+            list(cohort.iter_models(3, seed=1))
+    assert "on_step" not in hooks._subscribers
+
+
+def test_background_subscriber_receives_every_event_in_order():
+    seen, threads = [], set()
+
+    def collect(value):
+        seen.append(value)
+        threads.add(threading.get_ident())
+
+    with hooks.subscribed("on_persona", collect, background=True, queue_size=8):
+        for i in range(1_000):
+            hooks.emit("on_persona", i)
+    assert seen == list(range(1_000))
+    assert threads and threading.get_ident() not in threads
+
+
+def test_background_subscriber_drops_or_reports_errors():
+    release = threading.Event()
+    subscriber = hooks.BackgroundSubscriber(lambda value: release.wait(), maxsize=4, drop_when_full=True,
+                                            batch_size=1)
+    for i in range(100):
+        subscriber(i)
+    assert subscriber.dropped > 0
+    release.set()
+    subscriber.close()
+
+    def fail(value):
+        raise RuntimeError("export failed")
+
+    with pytest.raises(RuntimeError, match="export failed"):
+        with hooks.subscribed("on_persona", fail, background=True):
+            hooks.emit("on_persona", 1)
+
+
+def test_unknown_event_is_rejected():
+    with pytest.raises(ValueError, match="Unknown hook event"):
+        hooks.subscribe("on_user", print)
@@ -0,0 +1,74 @@
+"""Import-time budget for the CLI: non-SSR commands must not pay for torch/anthropic"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Seconds allowed for a cold `python cli.py --help` (override for slow CI machines)
+CLI_HELP_BUDGET = float(os.environ.get("SYNTH_CLI_HELP_BUDGET", "1.5"))
+
+HEAVY_MODULES = [
+    "torch",
+    "sentence_transformers",
+    "semantic_similarity_rating",
+    "polars",
+    "numpy",
+    "anthropic",
+    "dotenv",
+    "faker",
+]
+
+
+def _loaded_heavy_modules(statement: str):
+    """Run an import statement in a fresh interpreter and list heavy modules it loaded"""
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def test_cli_import_skips_heavy_backends():
+    """Importing the CLI must not import generator, SSR or LLM dependencies"""
+    assert _loaded_heavy_modules("import cli") == []
+
+
+def test_journey_generator_import_skips_ssr_and_llm():
+    """SSR and LLM backends load on first use, not when journey_generator is imported"""
+    loaded = _loaded_heavy_modules("import core.generators.journey_generator")
+    assert not set(loaded) - {"faker"}, f"Heavy modules imported eagerly: {loaded}"
+
+
+def test_cli_help_within_budget():
+    """A cold `cli.py --help` stays within the startup budget"""
+    # Warm the OS file cache and __pycache__ so we measure interpreter + imports only
+    subprocess.run([sys.executable, "cli.py", "--help"], cwd=REPO_ROOT, capture_output=True)
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "cli.py", "--help"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    if elapsed > CLI_HELP_BUDGET:
+        pytest.fail(
+            f"`cli.py --help` took {elapsed:.2f}s, budget is {CLI_HELP_BUDGET:.2f}s "
+            f"(set SYNTH_CLI_HELP_BUDGET to adjust)"
+        )
@@ -0,0 +1,75 @@
+"""Typed dataset loading (core.dataset.loader)"""
+
+import pytest
+
+from core.dataset import CohortLoader, build_header, load_cohort, open_writer
+from core.generators.cohort_generator import CohortGenerator
+from core.models import UserProfile
+
+
+@pytest.mark.parametrize("output_format,normalized", [
+    ("jsonl", False),
+    ("jsonl", True),
+    ("json", False),
+    ("parquet", False),
+])
+def test_typed_round_trip(project_path, tmp_path, output_format, normalized):
+    if output_format == "parquet":
+        pytest.importorskip("pyarrow")
+
+    cohort = CohortGenerator(project_path)
+    users = list(cohort.iter_users(12, seed=3, include_phases=not normalized))
+    header = None
+    if normalized:
+        phases = [phase.to_dict() for phase in cohort.journey_gen.phases]
+        header = build_header(cohort.config, phases, cohort.journey_type.value)
+
+    path = tmp_path / f"users.{output_format}"
+    kwargs = {"header": header} if header else {}
+    with open_writer(path, output_format, **kwargs) as writer:
+        for user in users:
+            writer.write(user)
+
+    records = load_cohort(path, project_path)
+    assert [r.profile.id for r in records] == [u["id"] for u in users]
+
+    configs = CohortLoader(path, project_path).persona_configs
+    for record, user in zip(records, users):
+        assert record.persona.config == configs[user["persona_type"]]
+        assert record.persona.attributes == user["attributes"]
+        assert record.profile.to_dict() == {k: v for k, v in user.items() if k != "journey"}
+
+        expected = user["journey"]
+        journey = record.journey.to_dict(include_phases=not normalized)
+        if output_format == "parquet":
+            # Narrative responses are not part of the columnar export
+            for step in expected["steps"]:
+                step["narrative_responses"] = {}
+            expected = {**expected, "phases": [p.to_dict() for p in record.journey.phases]}
+        assert journey == expected
+
+    # Phase objects are shared between journeys
+    assert records[0].journey.phases[0] is records[1].journey.phases[0]
+
+
+def test_frames_match_between_jsonl_and_parquet(project_path, tmp_path):
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+
+    users = list(CohortGenerator(project_path).iter_users(8, seed=5))
+    for output_format in ("jsonl", "parquet"):
+        with open_writer(tmp_path / f"users.{output_format}", output_format) as writer:
+            for user in users:
+                writer.write(user)
+
+    jsonl = CohortLoader(tmp_path / "users.jsonl").frames()
+    parquet = CohortLoader(tmp_path / "users.parquet").frames()
+    assert jsonl["users"]["id"].to_list() == parquet["users"]["id"].to_list()
+    assert jsonl["steps"]["timestamp"].to_list() == parquet["steps"]["timestamp"].to_list()
+
+
+def test_user_profile_from_dict_ignores_unknown_keys():
+    profile = UserProfile.from_dict({"id": "u1", "created_at": "2026-01-01T00:00:00", "journey": {}})
+    assert profile.id == "u1"
+    assert profile.created_at.year == 2026
+    assert profile.attributes == {}
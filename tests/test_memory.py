@@ -0,0 +1,88 @@
+"""Tests for memory measurement and generation memory budgets"""
+
+import pytest
+
+from core.utils import memory
+from core.utils.memory import MemoryBudget, MemoryBudgetExceeded, RssSampler, parse_size, retained_bytes
+
+
+def test_parse_size():
+    assert parse_size("1048576") == 2**20
+    assert parse_size("512M") == 512 * 2**20
+    assert parse_size("1.5g") == int(1.5 * 2**30)
+    assert parse_size("2GiB") == parse_size("2GB") == 2 * 2**30
+    with pytest.raises(ValueError):
+        parse_size("lots")
+
+
+def test_rss_sampler_records_peak():
+    with RssSampler(interval=0.001) as sampler:
+        block = bytearray(32 * 2**20)
+        block[::4096] = b"x" * len(block[::4096])
+        del block
+    assert sampler.peak - sampler.start >= 16 * 2**20
+
+
+def test_retained_bytes_counts_distinct_objects_once():
+    strings = [f"{i:0100d}" for i in range(1_000)]
+    distinct = retained_bytes(strings)
+    assert 100_000 < distinct < 200_000
+    # The same string 1000 times is one object
+    assert retained_bytes([strings[0]] * 1_000) < distinct / 10
+
+
+def _fake_rss(monkeypatch, per_user, start=100 * 2**20, plateau=None):
+    """RSS growing per_user bytes per generated user, flat after `plateau` users"""
+    users = {"done": 0}
+    monkeypatch.setattr(
+        memory, "rss_bytes", lambda: start + per_user * min(users["done"], plateau or users["done"])
+    )
+    return users
+
+
+def test_budget_stops_on_projected_growth(monkeypatch):
+    users = _fake_rss(monkeypatch, per_user=10_000)
+    budget = MemoryBudget(parse_size("500M"), total_users=100_000)
+
+    with pytest.raises(MemoryBudgetExceeded, match="Projected"):
+        for done in range(1, 100_001):
+            users["done"] = done
+            budget.check(done)
+    # Three over-budget projections, well before RSS itself reached the budget
+    assert done == 3 * budget.check_every
+    assert budget.peak < budget.limit
+
+
+def test_budget_tolerates_bounded_buffers(monkeypatch):
+    # Grows like a writer buffer until its first flush, then stays flat
+    users = _fake_rss(monkeypatch, per_user=10_000, plateau=6_000)
+    budget = MemoryBudget(parse_size("500M"), total_users=100_000)
+
+    for done in range(1, 100_001):
+        users["done"] = done
+        budget.check(done)
+    assert budget.projected == budget.peak
+
+
+def test_budget_rejects_a_process_already_over(monkeypatch):
+    _fake_rss(monkeypatch, per_user=0, start=2 * 2**30)
+    with pytest.raises(MemoryBudgetExceeded, match="before generating"):
+        MemoryBudget(parse_size("1G"), total_users=10)
+
+
+def test_generate_sets_aside_partial_output_over_budget(project_path, tmp_path, monkeypatch, capsys):
+    from cli import generate_users
+
+    (tmp_path / "projects").mkdir()
+    (tmp_path / "projects" / "private_language").symlink_to(project_path)
+    monkeypatch.chdir(tmp_path)
+    readings = iter([100 * 2**20])
+    monkeypatch.setattr(memory, "rss_bytes", lambda: next(readings, 2 * 2**30))
+
+    with pytest.raises(SystemExit):
+        generate_users("private_language", 400, "out", "jsonl", memory_budget="1G")
+
+    assert sorted(path.name for path in (tmp_path / "out").iterdir()) == [
+        "private_language_synthetic_users.jsonl.partial"
+    ]
+    assert "Stopped after 200 of 400 users; partial output moved to" in capsys.readouterr().out
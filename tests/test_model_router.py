@@ -0,0 +1,126 @@
+"""Model tiering and routing for LLM scale prompts (core.generators.model_router)"""
+
+import threading
+import time
+
+import pytest
+
+from core.generators.model_router import ModelRouter, ModelTier, RoutingRule
+from core.utils.config_loader import ConfigLoader
+
+
+def _router(max_concurrency=4):
+    tiers = {
+        "fast": ModelTier("fast", "small-model", max_concurrency=max_concurrency),
+        "standard": ModelTier("standard", "large-model", max_concurrency=max_concurrency),
+        "deep": ModelTier("deep", "largest-model", max_concurrency=max_concurrency),
+    }
+    rules = [
+        RoutingRule("deep", scale_id="satisfaction", phase="mastery", persona_type="department_head"),
+        RoutingRule("fast", scale_id="satisfaction", phase="mastery"),
+        RoutingRule("fast", scale_id="relevance"),
+        RoutingRule("deep", persona_type="department_head"),
+    ]
+    return ModelRouter(tiers, rules, default_tier="standard")
+
+
+@pytest.mark.parametrize("prompt, tier", [
+    # The first matching rule wins, so specific rules are listed first
+    (("satisfaction", "mastery", "department_head"), "deep"),
+    (("satisfaction", "mastery", "master_educator"), "fast"),
+    (("relevance", "discovery", "department_head"), "fast"),
+    # Wildcard scale and phase
+    (("engagement", "discovery", "department_head"), "deep"),
+    # No rule matches
+    (("satisfaction", "discovery", "master_educator"), "standard"),
+    (("engagement", "mastery", "master_educator"), "standard"),
+])
+def test_route_precedence(prompt, tier):
+    assert _router().route(*prompt).name == tier
+
+
+def test_default_tier_is_the_first_without_one_configured():
+    router = ModelRouter({"a": ModelTier("a", "model-a"), "b": ModelTier("b", "model-b")})
+    assert router.route("engagement", "discovery", "anyone").name == "a"
+
+
+def test_from_config_reads_the_project_llm_section(project_path):
+    router = ModelRouter.from_config(ConfigLoader(project_path).load_config()["llm"])
+    assert router.default_tier == "standard"
+    assert router.tiers["fast"].max_concurrency == 16
+    assert router.route("relevance", "mastery", "master_educator").name == "fast"
+    assert router.route("engagement", "discovery", "master_educator").name == "fast"
+    assert router.route("engagement", "mastery", "master_educator").name == "standard"
+
+    # Without tiers every prompt goes to an implicit tier of the default model
+    implicit = ModelRouter.from_config({}, default_model="some-model")
+    assert implicit.route("relevance", "discovery", "anyone").model == "some-model"
+
+
+@pytest.mark.parametrize("tiers, rules, default_tier, message", [
+    ({}, None, None, "at least one tier"),
+    ({"fast": ModelTier("fast", "m")}, [RoutingRule("turbo", scale_id="relevance")], None, "Unknown model tier 'turbo'"),
+    ({"fast": ModelTier("fast", "m")}, None, "standard", "Unknown model tier 'standard'"),
+])
+def test_invalid_router_config_is_rejected(tiers, rules, default_tier, message):
+    with pytest.raises(ValueError, match=message):
+        ModelRouter(tiers, rules, default_tier)
+
+
+def test_invalid_tier_config_is_rejected():
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        ModelTier("fast", "m", max_concurrency=0)
+    with pytest.raises(ValueError, match="Unknown model tier 'turbo'"):
+        ModelRouter.from_config({"tiers": {"fast": {"model": "m"}}, "routing": [{"tier": "turbo"}]})
+    with pytest.raises(KeyError):
+        ModelRouter.from_config({"tiers": {"fast": {"max_concurrency": 2}}})
+
+
+def test_slot_blocks_at_the_tier_limit():
+    router = _router(max_concurrency=2)
+    fast = router.tiers["fast"]
+    release = threading.Event()
+    inside = threading.Semaphore(0)
+
+    def call():
+        with router.slot(fast, "relevance"):
+            inside.release()
+            release.wait()
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    assert inside.acquire(timeout=5) and inside.acquire(timeout=5)
+    # The third call waits for a slot; other tiers are not affected
+    assert not inside.acquire(timeout=0.2)
+    with router.slot(router.tiers["standard"]):
+        pass
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    telemetry = router.get_telemetry()["fast"]
+    assert telemetry["max_in_flight"] == 2
+    assert telemetry["total_wait"] > 0.1
+
+
+def test_slot_telemetry_counts_calls_errors_and_scales():
+    router = _router()
+    fast = router.tiers["fast"]
+    with router.slot(fast, "relevance"):
+        time.sleep(0.01)
+    with pytest.raises(RuntimeError):
+        with router.slot(fast, "progress"):
+            raise RuntimeError("API error")
+    with router.slot(fast):
+        pass
+
+    telemetry = router.get_telemetry()
+    assert telemetry["fast"]["model"] == "small-model"
+    assert (telemetry["fast"]["calls"], telemetry["fast"]["errors"]) == (3, 1)
+    assert telemetry["fast"]["by_scale"] == {"relevance": 1, "progress": 1}
+    assert telemetry["fast"]["total_latency"] >= 0.01
+    assert telemetry["fast"]["avg_latency"] == pytest.approx(telemetry["fast"]["total_latency"] / 3)
+    assert telemetry["standard"]["calls"] == 0 and telemetry["standard"]["avg_latency"] == 0.0
+    # A failed call still releases its slot
+    assert all(router._slots["fast"].acquire(blocking=False) for _ in range(fast.max_concurrency))
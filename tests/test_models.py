@@ -0,0 +1,54 @@
+"""Slotted models and shared empty defaults"""
+
+import json
+import pickle
+from datetime import datetime
+
+import pytest
+
+from core.models import Journey, JourneyPhase, Persona, PersonaConfig, UserProfile
+from core.models.defaults import EMPTY_DICT, EMPTY_LIST
+from core.models.journey import CompletionStatus, JourneyStep
+
+
+def _step():
+    return JourneyStep(
+        id="s1",
+        phase_id="phase_1",
+        step_number=1,
+        timestamp=datetime(2026, 1, 1),
+        actions=["capture"],
+        emotional_state="curious",
+        completion_status=CompletionStatus.COMPLETED,
+    )
+
+
+@pytest.mark.parametrize("cls", [UserProfile, Persona, PersonaConfig, Journey, JourneyStep, JourneyPhase])
+def test_models_are_slotted(cls):
+    assert "__slots__" in vars(cls)
+    assert "__dict__" not in cls.__slots__
+
+
+def test_unset_containers_share_one_read_only_default():
+    first, second = _step(), _step()
+    assert first.narrative_responses is second.narrative_responses is EMPTY_DICT
+    assert first.ssr_responses == {} and "ssr_responses" not in first.to_dict()
+    assert UserProfile().metadata is EMPTY_DICT
+    assert JourneyPhase(id="p", name="P", order=0, objectives=["o"]).narrative_prompts is EMPTY_LIST
+
+    with pytest.raises(TypeError):
+        first.narrative_responses["reflection"] = "text"
+    with pytest.raises(TypeError):
+        EMPTY_LIST.append("x")
+
+    # Writing the field replaces the shared default for this instance only
+    first.narrative_responses = {"reflection": "text"}
+    assert second.narrative_responses == {}
+
+
+def test_shared_defaults_serialize_and_pickle_as_empty_containers():
+    step = _step()
+    assert json.loads(json.dumps(step.to_dict()))["narrative_responses"] == {}
+    restored = pickle.loads(pickle.dumps(step))
+    assert restored == step
+    assert restored.narrative_responses is EMPTY_DICT
@@ -0,0 +1,97 @@
+"""Quantized ONNX SSR backend and its accuracy gate (core.generators.onnx_encoder)"""
+
+import sys
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.generators import onnx_encoder  # noqa: E402  (needs numpy)
+
+
+class FakeTokenizer:
+    """Token i of a sentence is its i-th word; shorter sentences are padded"""
+
+    def __call__(self, sentences, padding, truncation, max_length, return_tensors):
+        lengths = [min(len(sentence.split()), max_length) for sentence in sentences]
+        width = max(lengths)
+        mask = np.array([[1] * n + [0] * (width - n) for n in lengths])
+        return {"input_ids": np.arange(mask.size).reshape(mask.shape), "attention_mask": mask}
+
+
+class FakeSession:
+    """Hidden state of each token is [input_id, 1]; padding tokens get a large value"""
+
+    def run(self, outputs, feed):
+        ids = feed["input_ids"].astype(np.float32)
+        hidden = np.stack([ids, np.ones_like(ids)], axis=-1)
+        hidden[feed["attention_mask"] == 0] = 1e6
+        return [hidden]
+
+
+def _encoder(normalize):
+    encoder = object.__new__(onnx_encoder.OnnxSentenceEncoder)
+    encoder.metadata = {"input_names": ["input_ids", "attention_mask"], "max_seq_length": 8, "normalize": normalize}
+    encoder.tokenizer, encoder.session = FakeTokenizer(), FakeSession()
+    return encoder
+
+
+def test_export_cache_is_anchored_to_the_repository():
+    assert onnx_encoder.DEFAULT_CACHE_DIR.is_absolute()
+    assert (onnx_encoder.DEFAULT_CACHE_DIR.parents[1] / "cli.py").exists()
+
+
+def test_encode_mean_pools_unpadded_tokens_across_batches():
+    sentences = ["one two three", "four", "five six"]
+    embeddings = _encoder(normalize=False).encode(sentences, batch_size=2)
+
+    # First batch ids [[0, 1, 2], [3, 4, 5]] with "four" padded; second batch ids [[0, 1]]
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(embeddings, [[1.0, 1.0], [3.0, 1.0], [0.5, 1.0]])
+
+    normalized = _encoder(normalize=True).encode(sentences, batch_size=2)
+    np.testing.assert_allclose(np.linalg.norm(normalized, axis=1), 1.0, rtol=1e-6)
+    assert _encoder(normalize=True).encode([]).shape == (0, 0)
+
+
+class FakeGenerator:
+    """Stands in for SSRResponseGenerator: the onnx backend shifts each PMF by SHIFT[scale_id]"""
+
+    SHIFT = {"engagement": 0.01, "relevance": 0.04}
+
+    def __init__(self, reference_config_path, model_name, device=None, backend="torch"):
+        self.backend = backend
+        self.available_scales = list(self.SHIFT)
+        self.reference_config = {
+            "engagement": {"scale_points": {1: {"statement": "Not at all"}, 2: {"statement": "Very much"}}},
+        }
+        self.rater = self
+
+    def _encode(self, texts):
+        return texts
+
+    def get_response_pmfs(self, scale_id, texts):
+        shift = self.SHIFT[scale_id] if self.backend == "onnx" else 0.0
+        return [[0.5 + shift, 0.5 - shift] for _ in texts]
+
+
+def test_compare_backends_gates_on_mean_l1(monkeypatch):
+    module = types.ModuleType("core.generators.ssr_response_generator")
+    module.SSRResponseGenerator = FakeGenerator
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+
+    report = onnx_encoder.compare_backends("response_scales.yaml", tolerance=0.05)
+    assert report["n_texts"] == 2  # the reference statements
+    assert report["scales"]["engagement"]["mean_l1"] == pytest.approx(0.02)
+    assert report["scales"]["relevance"]["max_l1"] == pytest.approx(0.08)
+    assert not report["passed"]
+    assert onnx_encoder.compare_backends("response_scales.yaml", ["a", "b", "c"], tolerance=0.1)["passed"]
+
+
+def test_onnx_backend_matches_torch_within_tolerance(project_path):
+    for package in ("onnxruntime", "onnx", "sentence_transformers", "semantic_similarity_rating"):
+        pytest.importorskip(package)
+
+    report = onnx_encoder.compare_backends(project_path / "response_scales.yaml", tolerance=0.05)
+    assert report["passed"], report["scales"]
@@ -0,0 +1,210 @@
+"""
+Performance regression gate for the generator hot paths
+
+Times PersonaGenerator.generate, JourneyGenerator.generate for every
+JourneyType and Journey.to_dict at fixed seeds and sizes, and compares them
+with tests/perf_baseline.json. Times are divided by a fixed pure-Python
+calibration workload timed in the same run, so a baseline recorded on one
+machine is usable on another of a different speed.
+
+Timing is noisy on shared machines, so the gate is opt-in:
+
+    SYNTH_PERF=1 pytest tests/test_perf.py                 # check against the baseline
+    SYNTH_PERF_TOLERANCE=0.5 SYNTH_PERF=1 pytest ...       # allow +50% (default 0.25)
+    SYNTH_PERF_UPDATE=1 pytest tests/test_perf.py          # re-record the baseline
+
+A stage over the tolerance is measured again and only fails when the
+second run is slow as well. Step counts are part of the baseline: a
+change in generated output changes the workload, so it is reported
+separately and needs a re-recorded baseline.
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from core.generators.journey_generator import JourneyGenerator
+from core.generators.persona_generator import PersonaGenerator
+from core.models.journey import JourneyType
+from core.utils.config_loader import ConfigLoader
+
+BASELINE_FILE = Path(__file__).resolve().parent / "perf_baseline.json"
+
+UPDATE = os.environ.get("SYNTH_PERF_UPDATE") == "1"
+ENABLED = UPDATE or os.environ.get("SYNTH_PERF") == "1"
+# Largest allowed slowdown per stage, as a fraction of the baseline
+TOLERANCE = float(os.environ.get("SYNTH_PERF_TOLERANCE", "0.25"))
+
+SEED = 1234
+PERSONAS = 2_000
+JOURNEYS = 300
+REPEATS = 7
+
+
+def _timed(function):
+    """Seconds for one run with the garbage collector paused, and the result"""
+    # Collections triggered by earlier allocations are the largest source of noise
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = function()
+        return time.perf_counter() - start, result
+    finally:
+        gc.enable()
+
+
+def _calibration_work():
+    """A fixed interpreter-bound workload: the unit every stage time is expressed in"""
+    rng = random.Random(0)
+    table = {}
+    for i in range(50_000):
+        key = f"k{i % 977}"
+        table[key] = table.get(key, 0) + rng.random()
+    return sorted(table.items())
+
+
+def _relative(function, repeats=REPEATS):
+    """
+    Median time of a function in calibration units, its fastest time and last result
+
+    Every run is paired with a calibration run right before it, so both see
+    the same machine conditions (frequency scaling, noisy neighbours).
+    """
+    ratios, seconds = [], []
+    result = None
+    for _ in range(repeats):
+        calibration, _ = _timed(_calibration_work)
+        elapsed, result = _timed(function)
+        ratios.append(elapsed / calibration)
+        seconds.append(elapsed)
+    return statistics.median(ratios), min(seconds), result
+
+
+def measure(project_path):
+    """Stage timings, relative to the calibration workload, with their workload sizes"""
+    loader = ConfigLoader(project_path, snapshot_dir=None)
+    vocabulary = loader.load_vocabulary()
+    persona_gen = PersonaGenerator(loader.load_personas(), vocabulary)
+    phases, emotional_states = loader.load_journey_phases(), loader.load_emotional_states()
+
+    stages = {}
+
+    def personas():
+        random.seed(SEED)
+        return persona_gen.generate(PERSONAS)
+
+    relative, seconds, _ = _relative(personas)
+    stages["persona.generate"] = {"seconds": seconds, "relative": relative, "units": PERSONAS}
+
+    random.seed(SEED)
+    cohort = persona_gen.generate(JOURNEYS)
+    journeys = None
+    for journey_type in JourneyType:
+        generator = JourneyGenerator(journey_type, phases, emotional_states, vocabulary=vocabulary)
+
+        def generate():
+            random.seed(SEED)
+            return [generator.generate(persona, persona.id) for persona in cohort]
+
+        relative, seconds, generated = _relative(generate)
+        stages[f"journey.{journey_type.value}"] = {
+            "seconds": seconds, "relative": relative, "units": JOURNEYS,
+            "steps": sum(len(j.steps) for j in generated)
+        }
+        if journey_type == JourneyType.SESSION_BASED:
+            journeys = generated
+
+    relative, seconds, _ = _relative(lambda: [journey.to_dict() for journey in journeys])
+    stages["journey.to_dict"] = {
+        "seconds": seconds, "relative": relative, "units": JOURNEYS,
+        "steps": sum(len(j.steps) for j in journeys)
+    }
+
+    return {
+        "calibration_seconds": min(_timed(_calibration_work)[0] for _ in range(REPEATS)),
+        "python": platform.python_version(),
+        "seed": SEED,
+        "stages": stages,
+    }
+
+
+def compare(baseline, current, tolerance=TOLERANCE):
+    """
+    Per-stage deltas against a baseline
+
+    Returns:
+        (regressions, workload changes, table): the failing stage names,
+        stages whose step counts differ, and a readable table of every stage
+    """
+    regressions, changed = [], []
+    lines = [f"   {'stage':<26} {'baseline':>9} {'current':>9} {'delta':>8}"]
+    for name, expected in baseline["stages"].items():
+        actual = current["stages"].get(name)
+        if actual is None:
+            changed.append(name)
+            lines.append(f"   {name:<26} {expected['relative']:>8.2f}x {'missing':>9}")
+            continue
+        delta = actual["relative"] / expected["relative"] - 1
+        mark = ""
+        if delta > tolerance:
+            regressions.append(name)
+            mark = "  ✗ slower"
+        elif delta < -tolerance:
+            mark = "  faster (re-record the baseline to lock it in)"
+        if actual.get("steps") != expected.get("steps"):
+            changed.append(name)
+            mark += f"  workload changed: {expected.get('steps')} -> {actual.get('steps')} steps"
+        lines.append(
+            f"   {name:<26} {expected['relative']:>8.2f}x {actual['relative']:>8.2f}x {delta:>+8.1%}{mark}"
+        )
+    return regressions, changed, "\n".join(lines)
+
+
+@pytest.mark.skipif(not ENABLED, reason="set SYNTH_PERF=1 to run the performance gate")
+def test_hot_paths_match_baseline(project_path):
+    current = measure(project_path)
+
+    if UPDATE or not BASELINE_FILE.exists():
+        BASELINE_FILE.write_text(json.dumps(current, indent=2) + "\n")
+        if not UPDATE:
+            pytest.skip(f"No baseline yet; recorded {BASELINE_FILE.name}")
+        return
+
+    baseline = json.loads(BASELINE_FILE.read_text())
+    regressions, changed, table = compare(baseline, current)
+    if regressions and not changed:
+        # Confirm with a second measurement: a regression must show up in both
+        retry = measure(project_path)
+        for name, stats in current["stages"].items():
+            stats["relative"] = min(stats["relative"], retry["stages"][name]["relative"])
+        regressions, changed, table = compare(baseline, current)
+    header = (
+        f"Stage times in calibration units (baseline {baseline['calibration_seconds'] * 1000:.1f} ms, "
+        f"this run {current['calibration_seconds'] * 1000:.1f} ms), tolerance +{TOLERANCE:.0%}"
+    )
+    assert not changed, (
+        f"Generated workload differs from the baseline; re-record with SYNTH_PERF_UPDATE=1\n{header}\n{table}"
+    )
+    assert not regressions, f"Performance regression in {', '.join(regressions)}\n{header}\n{table}"
+
+
+def test_compare_reports_per_stage_deltas():
+    baseline = {"stages": {
+        "persona.generate": {"relative": 1.0},
+        "journey.time_based": {"relative": 2.0, "steps": 100},
+    }}
+    current = {"stages": {
+        "persona.generate": {"relative": 1.1},
+        "journey.time_based": {"relative": 3.0, "steps": 100},
+    }}
+    regressions, changed, table = compare(baseline, current, tolerance=0.25)
+    assert regressions == ["journey.time_based"] and changed == []
+    assert "+50.0%  ✗ slower" in table and "+10.0%" in table
@@ -0,0 +1,46 @@
+"""Stage profiling (core.utils.profiling)"""
+
+import json
+import time
+
+from core.dataset.writers import open_writer
+from core.generators.cohort_generator import CohortGenerator
+from core.utils import profiling
+from core.utils.profiling import Profiler
+
+
+def test_pipeline_stages_and_counters_are_recorded(project_path, tmp_path):
+    cohort = CohortGenerator(project_path)
+    with profiling.activate(Profiler(trace=True)) as profiler:
+        with open_writer(tmp_path / "users.jsonl", "jsonl") as writer:
+            for user, journey in cohort.iter_models(12, seed=3):
+                writer.write_user(user, journey)
+
+    stages = profiler.stages
+    assert stages["persona.generate"].calls == 12
+    assert stages["journey.generate"].calls == 12
+    assert stages["write.encode"].calls == stages["write.io"].calls == 12
+    assert profiler.counters["personas"] == profiler.counters["journeys"] == 12
+    assert profiler.counters["steps"] == sum(
+        len(json.loads(line)["journey"]["steps"]) for line in (tmp_path / "users.jsonl").read_text().splitlines()
+    )
+    assert "journey.generate" in profiler.report()
+
+    trace = json.loads(profiler.write_trace(tmp_path / "trace.json").read_text())
+    assert len(trace["traceEvents"]) == sum(stats.calls for stats in stages.values())
+    assert {event["ph"] for event in trace["traceEvents"]} == {"X"}
+
+
+def test_self_time_excludes_nested_stages_and_inactive_is_a_no_op():
+    with profiling.activate() as profiler:
+        with profiling.stage("outer"):
+            with profiling.stage("inner"):
+                time.sleep(0.02)
+    outer, inner = profiler.stages["outer"], profiler.stages["inner"]
+    assert outer.total >= inner.total >= 0.02
+    assert outer.self_time < 0.01
+
+    assert profiling.active() is None
+    assert profiling.stage("outer") is profiling.stage("inner")
+    profiling.count("personas")
+    assert profiler.counters == {}
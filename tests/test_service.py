@@ -0,0 +1,113 @@
+"""Local HTTP generation service (core.service)"""
+
+import asyncio
+import json
+
+from core.service import GenerationService
+from core.service.server import _Flight
+
+
+async def _get(address, target):
+    """GET a path and return (status, headers, body) with the chunked body decoded"""
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+
+    head, _, body = raw.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    if headers.get("Transfer-Encoding") == "chunked":
+        decoded = b""
+        while True:
+            size, _, body = body.partition(b"\r\n")
+            size = int(size, 16)
+            if not size:
+                break
+            decoded, body = decoded + body[:size], body[size + 2:]
+        body = decoded
+    return int(status_line.split()[1]), headers, body
+
+
+def _run(service, scenario):
+    async def main():
+        await service.start(port=0)
+        try:
+            return await scenario(service.address)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+def test_generate_streams_jsonl_and_coalesces_identical_requests(project_path):
+    service = GenerationService(project_path.parent, workers=2, chunk_size=15)
+    project = project_path.name
+
+    async def scenario(address):
+        target = f"/generate?project={project}&count=40&seed=9"
+        first, second = await asyncio.gather(_get(address, target), _get(address, target))
+        unseeded = await _get(address, f"/generate?project={project}&count=3")
+        health = await _get(address, "/health")
+        return first, second, unseeded, health
+
+    first, second, unseeded, health = _run(service, scenario)
+    status, headers, body = first
+    assert status == 200
+    assert headers["Content-Type"] == "application/x-ndjson"
+    assert headers["X-Synth-Seed"] == "9"
+    users = [json.loads(line) for line in body.splitlines()]
+    assert len(users) == 40
+    assert all(user["journey"]["steps"] for user in users)
+
+    # The concurrent identical request streamed the same generation
+    assert second[2] == body
+    assert len(unseeded[2].splitlines()) == 3
+    stats = json.loads(health[2])
+    assert stats["projects"] == [project]
+    assert (stats["generations"], stats["coalesced"]) == (2, 1)
+
+
+def test_bad_requests_get_json_errors(project_path):
+    service = GenerationService(project_path.parent, workers=1, max_count=50)
+
+    async def scenario(address):
+        return [
+            await _get(address, target) for target in (
+                "/generate?project=missing",
+                f"/generate?project={project_path.name}&count=500",
+                f"/generate?project={project_path.name}&seed=abc",
+                "/nope",
+            )
+        ]
+
+    responses = _run(service, scenario)
+    assert [status for status, _, _ in responses] == [404, 400, 400, 404]
+    assert "error" in json.loads(responses[1][2])
+
+
+def test_flight_drops_read_chunks_and_waits_for_the_slowest_reader():
+    async def scenario():
+        flight = _Flight(seed=1, limit=2)
+        fast, slow = flight.stream(), flight.stream()
+        await flight.publish(b"0")
+        await flight.publish(b"1")
+        room = asyncio.ensure_future(flight.wait_for_room())
+
+        assert [await fast.__anext__(), await fast.__anext__()] == [b"0", b"1"]
+        await asyncio.sleep(0)
+        # Both chunks are still unread by the slow reader
+        assert not room.done() and len(flight.chunks) == 2 and flight.joinable
+
+        assert await slow.__anext__() == b"0"
+        assert await room is True
+        # Chunk 0 is gone, so an identical request can no longer join
+        assert list(flight.chunks) == [b"1"] and not flight.joinable
+
+        # A reader that goes away no longer holds chunks; once all are gone the producer stops
+        await slow.aclose()
+        assert not flight.chunks
+        await fast.aclose()
+        return await flight.wait_for_room()
+
+    assert asyncio.run(scenario()) is False
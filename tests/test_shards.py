@@ -0,0 +1,52 @@
+"""Sharded dataset generation, verification and reading"""
+
+from core.dataset import load_users, select_users
+from core.dataset.shards import (
+    load_manifest,
+    map_shards,
+    plan_shards,
+    regenerate_shard,
+    shard_paths,
+    verify_shards,
+    write_sharded_dataset,
+)
+
+
+def _count_users(path):
+    return sum(1 for _ in load_users(path))
+
+
+def test_plan_shards_balances_persona_counts():
+    persona_counts = {"a": 10, "b": 7, "c": 1}
+    specs = plan_shards(persona_counts, shards=4, seed=1)
+
+    assert [spec.count for spec in specs] == [5, 5, 4, 4]
+    assert [spec.start for spec in specs] == [0, 5, 10, 14]
+    for persona_type, total in persona_counts.items():
+        assert sum(spec.persona_counts.get(persona_type, 0) for spec in specs) == total
+    assert len({spec.seed for spec in specs}) == 4
+    assert plan_shards(persona_counts, shards=4, seed=1) == specs
+
+
+def test_sharded_dataset_round_trip(project_path, tmp_path):
+    dataset = tmp_path / "users"
+    manifest = write_sharded_dataset(project_path, dataset, count=40, shards=3, workers=2, seed=3)
+
+    assert manifest["total_rows"] == 40
+    assert [shard["rows"] for shard in manifest["shards"]] == [14, 13, 13]
+    assert sum(manifest["persona_counts"].values()) == 40
+    assert verify_shards(dataset) == []
+
+    users = load_users(tmp_path / "users.json")  # resolves the sharded directory
+    assert len(users) == 40
+    assert [u["name"].rsplit("_", 1)[1] for u in users] == [str(i) for i in range(1, 41)]
+    assert map_shards(dataset, _count_users) == [14, 13, 13]
+    assert len(select_users(dataset, limit=20)) == 20
+
+    # Corrupt one shard, then regenerate it from its manifest entry
+    shard_paths(dataset)[1].write_text("")
+    assert verify_shards(dataset) == [1]
+    entry = regenerate_shard(dataset, 1)
+    assert entry["persona_counts"] == manifest["shards"][1]["persona_counts"]
+    assert verify_shards(dataset) == []
+    assert load_manifest(dataset)["shards"][1]["sha256"] == entry["sha256"]
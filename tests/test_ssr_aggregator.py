@@ -0,0 +1,238 @@
+"""Streaming SSR survey aggregation (core.generators.ssr_aggregator) and its dataset sidecars"""
+
+import json
+import os
+import random
+import sys
+import types
+
+import pytest
+
+from core.dataset.shards import regenerate_shard, shard_paths, verify_shards, write_sharded_dataset
+from core.dataset.summary import read_survey, survey_path
+from core.generators import journey_generator
+from core.generators.embedding_registry import FORK_WORKERS, shared_registry
+from core.generators.ssr_aggregator import SurveyAggregator
+
+np = pytest.importorskip("numpy")
+
+
+def _pmfs(rng, count, points=5):
+    return rng.dirichlet(np.ones(points), size=count)
+
+
+def _expected(pmfs):
+    """Aggregate statistics of a group computed directly over all of its PMFs"""
+    expected_values = pmfs @ np.arange(1, pmfs.shape[1] + 1)
+    return pmfs.mean(axis=0), expected_values.mean(), expected_values.var()
+
+
+def _assert_matches(stats, pmfs):
+    pmf, mean, variance = _expected(pmfs)
+    assert stats["n_responses"] == len(pmfs)
+    assert stats["aggregate_pmf"] == pytest.approx(pmf)
+    assert stats["aggregate_expected_value"] == pytest.approx(mean)
+    assert stats["expected_value_variance"] == pytest.approx(variance)
+
+
+def test_add_matches_direct_mean_and_variance():
+    pmfs = _pmfs(np.random.default_rng(1), 500)
+    aggregator = SurveyAggregator()
+    for pmf in pmfs:
+        aggregator.add(pmf, "engagement")
+
+    _assert_matches(aggregator.results(("scale_id",))[("engagement",)], pmfs)
+
+
+def test_merged_splits_and_restored_state_match_the_whole():
+    rng = np.random.default_rng(2)
+    pmfs = _pmfs(rng, 900)
+    phases = rng.choice(["onboarding", "practice", "mastery"], size=len(pmfs))
+
+    # Uneven splits, one of them empty, each round-tripped through JSON
+    merged = SurveyAggregator()
+    for part in np.split(np.arange(len(pmfs)), [7, 7, 400]):
+        shard = SurveyAggregator()
+        for i in part:
+            shard.add(pmfs[i], "engagement", "educator", phases[i], "core")
+        merged.merge(SurveyAggregator.from_state(json.loads(json.dumps(shard.to_state()))))
+
+    assert merged.n_responses == len(pmfs)
+    for phase in ("onboarding", "practice", "mastery"):
+        _assert_matches(merged.results(("phase",))[(phase,)], pmfs[phases == phase])
+    _assert_matches(merged.results(())[()], pmfs)
+
+
+def test_mismatched_pmf_length_is_rejected():
+    aggregator = SurveyAggregator()
+    aggregator.add([0.2] * 5, "engagement")
+    with pytest.raises(ValueError, match="expected 5"):
+        aggregator.add([0.5, 0.5], "engagement")
+    with pytest.raises(ValueError, match="Unknown group fields"):
+        aggregator.results(("country",))
+
+
+class FakeSSR:
+    """Stands in for SSRResponseGenerator (the SSR extras are optional)"""
+    available_scales = ["engagement", "satisfaction"]
+
+    def __init__(self, reference_config_path, backend="torch"):
+        self.backend = backend
+        self.model = shared_registry.get("all-MiniLM-L6-v2", backend=backend)
+
+    def generate_persona_response(self, persona_config, stimulus, scale_id, llm_response):
+        weights = [random.random() for _ in range(5)]
+        return {"scale_id": scale_id, "pmf": [w / sum(weights) for w in weights], "backend": self.backend,
+                "model_pid": self.model.pid}
+
+
+def _load_model(model_name, device):
+    """Stands in for loading the embedding model, remembering which process loaded it"""
+    return types.SimpleNamespace(pid=os.getpid())
+
+
+@pytest.fixture
+def fake_ssr(monkeypatch):
+    """Let enable_ssr=True build FakeSSR (shard workers are forked and inherit it)"""
+    module = types.ModuleType("core.generators.ssr_response_generator")
+    module.SSRResponseGenerator = FakeSSR
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(journey_generator, "SSR_AVAILABLE", True)
+    monkeypatch.setattr(shared_registry, "loaders", {"torch": _load_model, "onnx": _load_model})
+    monkeypatch.setattr(shared_registry, "_models", {})
+
+
+def _responses(users):
+    """SSR responses of every step of some users"""
+    return [
+        response
+        for user in users for step in user["journey"]["steps"] for response in step["ssr_responses"].values()
+    ]
+
+
+def _backends(users):
+    """Embedding backends that rated the SSR responses of some users"""
+    return {response["backend"] for response in _responses(users)}
+
+
+def _step_pmfs(path):
+    """PMFs of every SSR response written to a dataset, by scale"""
+    from core.dataset import load_users
+
+    pmfs = {}
+    for user in load_users(path):
+        for step in user["journey"]["steps"]:
+            for scale_id, response in step.get("ssr_responses", {}).items():
+                pmfs.setdefault(scale_id, []).append(response["pmf"])
+    return {scale_id: np.array(values) for scale_id, values in pmfs.items()}
+
+
+def test_sharded_ssr_dataset_merges_shard_surveys(project_path, tmp_path, fake_ssr):
+    dataset = tmp_path / "users"
+    manifest = write_sharded_dataset(project_path, dataset, count=24, shards=3, workers=2, seed=4, ssr=True)
+    assert manifest["ssr"]
+    assert all(survey_path(shard).exists() for shard in shard_paths(dataset))
+
+    survey = read_survey(dataset)
+    written = _step_pmfs(dataset)
+    assert survey.n_responses == sum(len(pmfs) for pmfs in written.values())
+    results = survey.results(("scale_id",))
+    for scale_id, pmfs in written.items():
+        _assert_matches(results[(scale_id,)], pmfs)
+
+    # A shard without its survey is incomplete; regenerating it writes a new one
+    survey_path(shard_paths(dataset)[1]).unlink()
+    assert verify_shards(dataset) == [1]
+    regenerate_shard(dataset, 1)
+    assert verify_shards(dataset) == []
+    assert read_survey(dataset).n_responses == survey.n_responses
+
+
+@pytest.mark.skipif(not FORK_WORKERS, reason="shard workers are forked on Linux only")
+def test_shard_workers_share_the_parents_ssr_model(project_path, tmp_path, fake_ssr):
+    from core.dataset import load_users
+
+    write_sharded_dataset(project_path, tmp_path / "users", count=12, shards=3, workers=3, seed=6, ssr=True)
+    assert {response["model_pid"] for response in _responses(load_users(tmp_path / "users"))} == {os.getpid()}
+
+
+def test_datasets_without_ssr_have_no_survey(project_path, tmp_path):
+    write_sharded_dataset(project_path, tmp_path / "users", count=6, shards=2, workers=1, seed=1)
+    assert read_survey(tmp_path / "users") is None
+
+
+def test_generate_with_ssr_saves_the_survey_next_to_the_summary(project_path, tmp_path, monkeypatch, capsys,
+                                                                 fake_ssr):
+    from cli import generate_users, survey_report
+
+    (tmp_path / "projects").mkdir()
+    (tmp_path / "projects" / "private_language").symlink_to(project_path)
+    monkeypatch.chdir(tmp_path)
+
+    generate_users("private_language", 12, "out", "jsonl", seed=3, ssr=True)
+    dataset = tmp_path / "out" / "private_language_synthetic_users.jsonl"
+    written = _step_pmfs(dataset)
+    assert read_survey(dataset).n_responses == sum(len(pmfs) for pmfs in written.values())
+
+    capsys.readouterr()
+    survey_report(str(dataset), ["scale_id"])
+    report = capsys.readouterr().out
+    assert all(scale_id in report for scale_id in written)
+
+
+def test_ssr_backend_is_recorded_for_regenerated_shards(project_path, tmp_path, fake_ssr):
+    from core.dataset import load_users
+
+    dataset = tmp_path / "users"
+    manifest = write_sharded_dataset(project_path, dataset, count=8, shards=2, workers=2, seed=5, ssr=True,
+                                     ssr_backend="onnx")
+    assert manifest["ssr_backend"] == "onnx"
+    assert _backends(load_users(dataset)) == {"onnx"}
+
+    regenerate_shard(dataset, 0, force=True)
+    assert _backends(load_users(shard_paths(dataset)[0])) == {"onnx"}
+
+
+def _serve_ssr(service, project_path, count):
+    """Users of one ssr=1 request to a started service"""
+    import asyncio
+
+    async def main():
+        await service.start(port=0)
+        try:
+            reader, writer = await asyncio.open_connection(*service.address)
+            target = f"/generate?project={project_path.name}&count={count}&seed=2&ssr=1"
+            writer.write(f"GET {target} HTTP/1.1\r\n\r\n".encode())
+            await writer.drain()
+            body = (await reader.read()).partition(b"\r\n\r\n")[2]
+            writer.close()
+            return body
+        finally:
+            await service.close()
+
+    # Skip the chunk-size lines of the chunked body
+    return [json.loads(line) for line in asyncio.run(main()).splitlines() if line.startswith(b"{")]
+
+
+def test_service_rates_with_its_ssr_backend(project_path, fake_ssr, monkeypatch):
+    from core.service import GenerationService, server
+
+    monkeypatch.setattr(server, "_GENERATORS", {})
+    service = GenerationService(project_path.parent, workers=1, chunk_size=5, ssr_backend="onnx")
+    users = _serve_ssr(service, project_path, 6)
+    assert len(users) == 6
+    assert _backends(users) == {"onnx"}
+    # Persona counts come from a generator without SSR: the event-loop process loads no model
+    assert list(server._GENERATORS) == [(str(project_path), False, "torch")]
+    assert shared_registry.loaded() == []
+
+
+@pytest.mark.skipif(not FORK_WORKERS, reason="service workers are forked on Linux only")
+def test_service_workers_share_the_preloaded_ssr_model(project_path, fake_ssr, monkeypatch):
+    from core.service import GenerationService, server
+
+    monkeypatch.setattr(server, "_GENERATORS", {})
+    service = GenerationService(project_path.parent, workers=2, chunk_size=3)
+    service.preload([project_path.name], ssr=True)
+    users = _serve_ssr(service, project_path, 6)
+    assert {response["model_pid"] for response in _responses(users)} == {os.getpid()}
@@ -0,0 +1,93 @@
+"""Incremental top-up generation (cli.py generate --append-to)"""
+
+from collections import Counter
+
+import pytest
+
+from core.dataset import IndexedDataset, load_users, open_writer
+from core.dataset.shards import append_shard, verify_shards, write_sharded_dataset
+from core.dataset.summary import DatasetSummary, read_summary, summary_path
+from core.generators.cohort_generator import CohortGenerator
+from core.generators.persona_generator import _allocate, allocate_deficit
+
+
+def test_allocate_deficit_fills_gaps_and_scales_down_surpluses():
+    targets = {"a": 60, "b": 30, "c": 10}
+    assert allocate_deficit(targets, {"a": 50, "b": 20, "c": 10}, 20) == {"a": 10, "b": 10, "c": 0}
+    # "c" is above target, so the deficits (15 + 10) exceed the 20 new items
+    assert allocate_deficit(targets, {"a": 45, "b": 20, "c": 15}, 20) == {"a": 12, "b": 8, "c": 0}
+
+
+def test_allocate_never_goes_negative():
+    # Rounding each share separately left the last group at -1 for 15 users
+    distribution = {"a": 0.26, "b": 0.17, "c": 0.13, "d": 0.10, "e": 0.06, "f": 0.05, "g": 0.05,
+                    "h": 0.04, "i": 0.04, "j": 0.03, "k": 0.03, "l": 0.02, "m": 0.02}
+    for count in (1, 7, 15, 20, 40, 500):
+        counts = _allocate(distribution, count)
+        assert sum(counts.values()) == count and min(counts.values()) >= 0
+    assert _allocate(distribution, 500) == {key: round(share * 500) for key, share in distribution.items()}
+
+
+def _composition(users):
+    return (
+        Counter(user["persona_type"] for user in users),
+        Counter(user["attributes"]["engagement_tier"] for user in users),
+    )
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_append_to_jsonl_matches_combined_targets(project_path, tmp_path, suffix):
+    cohort = CohortGenerator(project_path)
+    path = tmp_path / f"users{suffix}"
+    index = suffix == ".jsonl"
+
+    summary = DatasetSummary(project=project_path.name)
+    with open_writer(path, "jsonl", index=index) as writer:
+        for user in cohort.iter_users(50, seed=1):
+            writer.write(user)
+            summary.add(user)
+    summary.save(path)
+
+    existing = read_summary(path, scan=False)
+    persona_counts, tier_counts = cohort.persona_gen.top_up_counts(
+        existing.persona_counts, existing.engagement_tier_counts, 30
+    )
+    with open_writer(path, "jsonl", index=index, append=True) as writer:
+        for user in cohort.iter_users(30, persona_counts, start=50, engagement_tier_counts=tier_counts):
+            writer.write(user)
+
+    users = load_users(path)
+    personas, tiers = _composition(users)
+    assert len(users) == 80
+    assert users[-1]["name"].endswith("_user_80")
+    assert personas == Counter(cohort.persona_gen.persona_counts(80))
+    # Tiers of the first 50 users were sampled; the top-up only fills deficits,
+    # so no tier ends above max(target, what already existed)
+    target_tiers = cohort.persona_gen.engagement_tier_counts(80)
+    for tier, target in target_tiers.items():
+        assert tiers[tier] <= max(target, existing.engagement_tier_counts[tier])
+
+    if index:
+        with IndexedDataset(path, build=False) as dataset:
+            assert len(dataset) == 80
+            assert dataset[-1]["id"] == users[-1]["id"]
+
+
+def test_append_shard(project_path, tmp_path):
+    dataset = tmp_path / "users"
+    write_sharded_dataset(project_path, dataset, count=30, shards=2, workers=1, seed=5)
+
+    cohort = CohortGenerator(project_path)
+    existing = read_summary(dataset)
+    persona_counts, tier_counts = cohort.persona_gen.top_up_counts(
+        existing.persona_counts, existing.engagement_tier_counts, 20
+    )
+    entry = append_shard(dataset, persona_counts, tier_counts)
+
+    assert entry["index"] == 2 and entry["start"] == 30 and entry["rows"] == 20
+    assert verify_shards(dataset) == []
+    combined = read_summary(dataset)
+    assert combined.rows == 50
+    assert dict(combined.persona_counts) == cohort.persona_gen.persona_counts(50)
+    assert not summary_path(dataset).exists()  # sharded datasets keep counts in the manifest
+    assert _composition(load_users(dataset))[1] == combined.engagement_tier_counts
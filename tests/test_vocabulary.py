@@ -0,0 +1,70 @@
+"""Categorical vocabularies (core.models.vocabulary)"""
+
+import pytest
+
+from core.dataset import load_cohort, open_writer
+from core.generators.cohort_generator import CohortGenerator
+from core.models.vocabulary import CATEGORICAL_FIELDS, Vocabulary
+from core.utils.config_loader import ConfigLoader
+
+
+def test_project_vocabulary_codes_follow_config_order(project_path):
+    vocabulary = ConfigLoader(project_path).load_vocabulary()
+    assert set(vocabulary.categories) == set(CATEGORICAL_FIELDS)
+
+    personas = ConfigLoader(project_path).load_personas()
+    assert vocabulary["persona_type"].values == list(personas)
+    assert vocabulary.decode("phase_id", vocabulary.encode("phase_id", "phase_2")) == "phase_2"
+    assert vocabulary["completion_status"].values == ["not_started", "in_progress", "completed", "abandoned"]
+
+    # Rebuilding gives the same codes
+    assert ConfigLoader(project_path).load_vocabulary().to_dict() == vocabulary.to_dict()
+
+
+def test_categories_are_open_and_intern_values():
+    vocabulary = Vocabulary({"gender": ["female", "male"]})
+    assert vocabulary.encode("gender", "male") == 1
+    assert vocabulary.encode("gender", "non_binary") == 2
+
+    first = vocabulary.intern("gender", "".join(["fe", "male"]))
+    second = vocabulary.intern("gender", "".join(["fem", "ale"]))
+    assert first is second
+
+    with pytest.raises(KeyError):
+        vocabulary.encode("nickname", "x")
+
+
+def test_generated_and_loaded_users_share_strings(project_path, tmp_path):
+    cohort = CohortGenerator(project_path)
+    models = list(cohort.iter_models(20, seed=11))
+    states = cohort.vocabulary["emotional_state"]
+    for user, journey in models:
+        assert user.persona_type is cohort.vocabulary.intern("persona_type", user.persona_type)
+        for step in journey.steps:
+            assert step.emotional_state is states.intern(step.emotional_state)
+
+    path = tmp_path / "users.jsonl"
+    with open_writer(path, "jsonl") as writer:
+        for user, journey in models:
+            writer.write_user(user, journey)
+
+    records = load_cohort(path, project_path)
+    steps = [step for record in records for step in record.journey.steps]
+    by_state = {}
+    for step in steps:
+        assert by_state.setdefault(step.emotional_state, step.emotional_state) is step.emotional_state
+
+
+def test_parquet_categories_use_vocabulary_codes(project_path, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    cohort = CohortGenerator(project_path)
+    with open_writer(tmp_path / "users.parquet", "parquet", vocabulary=cohort.vocabulary) as writer:
+        for user, journey in cohort.iter_models(10, seed=2):
+            writer.write_user(user, journey)
+
+    steps = pq.read_table(tmp_path / "users.parquet" / "steps.parquet")
+    states = steps.column("emotional_state").combine_chunks()
+    assert states.dictionary.to_pylist() == cohort.vocabulary["emotional_state"].values
+    assert states.to_pylist()[0] == cohort.vocabulary.decode("emotional_state", states.indices[0].as_py())
+    assert all(isinstance(action, str) for actions in steps.column("actions").to_pylist() for action in actions)